@@ -19,6 +19,7 @@ import json
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -63,6 +64,9 @@ LANGUAGE_IMPORT_PATTERNS = {
     "javascript": r'^(?:import\s+.*from\s+|require\s*\()["\']([^"\']+)',
 }
 
+# Upper bound on threads parsing and resolving files for the dependency graph
+GRAPH_WORKERS = 16
+
 _EXT_TO_LANG = {}
 for lang, exts in LANGUAGE_EXTENSIONS.items():
     for ext in exts:
@@ -248,6 +252,7 @@ def detect_strategy(project_path: Path) -> dict:
 _TS_IMPORT_RE = re.compile(
     r'''import\s+(?:(?:type\s+)?(?:\{[^}]*\}|[\w*]+(?:\s*,\s*\{[^}]*\})?)\s+from\s+)?['"](.*?)['"]'''
 )
+_TS_SPECIFIERS_RE = re.compile(r'\{([^}]+)\}')
 
 
 def parse_ts_imports(file_path: Path) -> list:
@@ -257,21 +262,76 @@ def parse_ts_imports(file_path: Path) -> list:
     except OSError:
         return []
 
+    # _TS_IMPORT_RE needs the literal "import"; skip the regex where it is absent
+    if "import" not in text:
+        return []
+
     results = []
     for line in text.splitlines():
-        stripped = line.strip()
-        m = _TS_IMPORT_RE.search(stripped)
-        if m:
-            source = m.group(1)
-            specifiers = []
-            spec_match = re.search(r'\{([^}]+)\}', stripped)
-            if spec_match:
-                specifiers = [s.strip().split(" as ")[0].strip()
-                              for s in spec_match.group(1).split(",") if s.strip()]
-            results.append({"source": source, "specifiers": specifiers})
+        if "import" not in line:
+            continue
+        parsed = _parse_ts_import_line(line)
+        if parsed:
+            results.append(parsed)
     return results
 
 
+def _parse_ts_import_line(line: str) -> Optional[dict]:
+    """Parse one source line into an import dict, or None if it has no import."""
+    stripped = line.strip()
+    m = _TS_IMPORT_RE.search(stripped)
+    if not m:
+        return None
+    specifiers = []
+    spec_match = _TS_SPECIFIERS_RE.search(stripped)
+    if spec_match:
+        specifiers = [s.strip().split(" as ")[0].strip()
+                      for s in spec_match.group(1).split(",") if s.strip()]
+    return {"source": m.group(1), "specifiers": specifiers}
+
+
+def _parse_ts_imports_bulk(files: list) -> Optional[dict]:
+    """Extract imports from many files with one ripgrep call.
+
+    rg only selects candidate lines; each is re-parsed with the same
+    per-line logic as parse_ts_imports, so results match it exactly.
+    Returns {path_str: imports}, or None when rg is unavailable or fails.
+    """
+    if not _HAS_RG or not files:
+        return None
+    # Explicit paths are searched even if hidden or gitignored, like os.walk
+    cmd = ["rg", "--json", "--no-messages", "-e", _TS_IMPORT_RE.pattern, "--"]
+    cmd.extend(str(f) for f in files)
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    # 1 means no matches; 2 means an error, so results may be partial
+    if result.returncode not in (0, 1):
+        return None
+
+    imports = {}
+    for line in result.stdout.splitlines():
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if entry.get("type") != "match":
+            continue
+        data = entry["data"]
+        path_text = data.get("path", {}).get("text")
+        content = data.get("lines", {}).get("text")
+        if path_text is None or content is None:
+            # Non-UTF-8 path or line, reported as base64 bytes
+            return None
+        # rg splits on \n only; splitlines also breaks on \r and friends
+        for sub in content.splitlines():
+            parsed = _parse_ts_import_line(sub)
+            if parsed:
+                imports.setdefault(path_text, []).append(parsed)
+    return imports
+
+
 def resolve_ts_import(import_source: str, from_file: Path, project_path: Path) -> Optional[Path]:
     """Resolve a TypeScript import to an actual file path."""
     project_path = project_path.resolve()
@@ -324,16 +384,27 @@ def build_ts_dependency_graph(project_path: Path, entry_files: list = None) -> d
     if entry_files:
         ts_files = [Path(f).resolve() for f in entry_files if Path(f).exists()]
 
-    graph = {}
-    for fpath in ts_files:
-        imports = parse_ts_imports(fpath)
+    if not ts_files:
+        return {}
+
+    bulk = _parse_ts_imports_bulk(ts_files)
+
+    def file_deps(fpath: Path) -> list:
+        if bulk is not None:
+            imports = bulk.get(str(fpath), [])
+        else:
+            imports = parse_ts_imports(fpath)
         resolved = []
         for imp in imports:
             target = resolve_ts_import(imp["source"], fpath, project_path)
             if target:
                 resolved.append(str(target))
-        graph[str(fpath)] = resolved
-    return graph
+        return resolved
+
+    # Files are independent and resolution is stat-bound, so overlap them;
+    # map keeps input order, so the graph is the same as a serial build
+    with ThreadPoolExecutor(max_workers=min(GRAPH_WORKERS, len(ts_files))) as pool:
+        return {str(fpath): deps for fpath, deps in zip(ts_files, pool.map(file_deps, ts_files))}
 
 
 # ---------------------------------------------------------------------------
@@ -406,10 +477,13 @@ def search_pattern(project_path: Path, pattern: str, strategy: str = "grep-enhan
     return run_ripgrep(project_path, pattern, file_filter=file_filter)
 
 
+_IDENTIFIER_RE = re.compile(r'\b[a-zA-Z_]\w{2,}\b')
+
+
 def search_similar_patterns(project_path: Path, reference_code: str,
                             strategy: str = "grep-enhanced") -> list:
     """Find code similar to the reference snippet."""
-    identifiers = re.findall(r'\b[a-zA-Z_]\w{2,}\b', reference_code)
+    identifiers = _IDENTIFIER_RE.findall(reference_code)
     if not identifiers:
         return []
 
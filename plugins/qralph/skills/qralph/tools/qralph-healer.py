@@ -965,26 +965,18 @@ def cmd_history():
 
 def cmd_clear():
     """Clear error counts (reset circuit breaker)."""
-    with qralph_state.exclusive_state_lock():
-        return _cmd_clear_locked()
-
-
-def _cmd_clear_locked():
-    """Inner clear logic, called under exclusive lock."""
-    state = load_state()
-    if not state:
-        output = {"error": "No active project"}
-        print(json.dumps(output, indent=2))
-        return output
-
-    # Clear error counts
-    if "circuit_breakers" in state:
-        state["circuit_breakers"]["error_counts"] = {}
-
-    # Reset heal attempts
-    state["heal_attempts"] = 0
-
-    save_state(state)
+    with qralph_state.state_transaction(get_state_file()) as state:
+        if not state:
+            output = {"error": "No active project"}
+            print(json.dumps(output, indent=2))
+            return output
+
+        # Clear error counts
+        if "circuit_breakers" in state:
+            state["circuit_breakers"]["error_counts"] = {}
+
+        # Reset heal attempts
+        state["heal_attempts"] = 0
 
     project_path = Path(state.get("project_path", ""))
     if project_path.exists():
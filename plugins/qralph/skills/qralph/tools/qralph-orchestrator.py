@@ -99,6 +99,9 @@ VERSION_FILE = QRALPH_DIR / "VERSION"
 # Safe project ID pattern (matches session-state.py)
 SAFE_PROJECT_ID = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_\-]{0,99}$')
 
+# Numbered project directory names (NNN-slug)
+PROJECT_DIR_NAME = re.compile(r'^\d{3}-')
+
 # Circuit Breaker Limits
 MAX_TOKENS = 500_000
 MAX_COST_USD = 40.0
@@ -106,6 +109,9 @@ MAX_SAME_ERROR = 3
 MAX_HEAL_ATTEMPTS = 5
 MAX_BULK_REMEDIATE = 5
 
+# Timestamped checkpoint snapshots retained per project (state.json is always kept)
+MAX_CHECKPOINTS = 20
+
 # Fix level priorities: which finding severities to remediate
 LEVEL_PRIORITIES = {
     "none": [],
@@ -113,6 +119,9 @@ LEVEL_PRIORITIES = {
     "p0_p1": ["P0", "P1"],
     "all": ["P0", "P1", "P2"],
 }
+# Membership view of LEVEL_PRIORITIES (the lists stay ordered for task creation)
+LEVEL_PRIORITY_SETS = {level: frozenset(prios) for level, prios in LEVEL_PRIORITIES.items()}
+DEFAULT_PRIORITY_SET = LEVEL_PRIORITY_SETS["p0_p1"]
 
 # Model Pricing (per 1M tokens - input, simplified for estimation)
 MODEL_COSTS = {
@@ -163,6 +172,21 @@ def load_state() -> dict:
     return qralph_state.load_state(get_state_file())
 
 
+def load_state_with_path() -> Tuple[dict, Optional[Path]]:
+    """Load the current state together with its existing project directory.
+
+    Returns:
+        (state, project_path). project_path is None when there is no state,
+        no project_path recorded, or the directory no longer exists.
+    """
+    state = load_state()
+    raw_path = state.get("project_path") if state else None
+    if not raw_path:
+        return state, None
+    project_path = Path(raw_path)
+    return state, project_path if project_path.is_dir() else None
+
+
 def save_state(state: dict):
     """Persist project state atomically with locking and checksum injection."""
     qralph_state.save_state(state, get_state_file())
@@ -1678,6 +1702,7 @@ def _cmd_checkpoint_locked(phase: str):
     safe_write_json(checkpoint_file, state)
     # Also update state.json so cmd_resume picks up the latest phase
     safe_write_json(project_path / "checkpoints" / "state.json", state)
+    prune_checkpoints(project_path / "checkpoints")
 
     log_decision(project_path, f"Checkpoint saved: {phase} (PE gate passed)")
 
@@ -1691,6 +1716,29 @@ def _cmd_checkpoint_locked(phase: str):
     print(json.dumps(output))
 
 
+def prune_checkpoints(checkpoint_dir: Path, keep: int = MAX_CHECKPOINTS) -> List[Path]:
+    """Delete all but the newest ``keep`` timestamped snapshots in checkpoint_dir.
+
+    state.json is the live "latest" pointer that resume reads directly, so it
+    is never pruned; it keeps resume a single open regardless of project age.
+
+    Returns:
+        List of removed checkpoint paths.
+    """
+    snapshots = [p for p in checkpoint_dir.glob("*.json") if p.name != "state.json"]
+    if len(snapshots) <= keep:
+        return []
+    snapshots.sort(key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    removed = []
+    for stale in snapshots[keep:]:
+        try:
+            stale.unlink()
+            removed.append(stale)
+        except OSError as e:
+            print(f"Warning: Failed to prune checkpoint {stale}: {e}", file=sys.stderr)
+    return removed
+
+
 def cmd_generate_uat():
     """Generate UAT.md with acceptance test scenarios from synthesis findings."""
     with qralph_state.exclusive_state_lock():
@@ -1803,8 +1851,8 @@ def _cmd_finalize_locked():
     tasks = state.get("remediation_tasks", [])
     if tasks:
         fix_level = state.get("fix_level", "p0_p1")
-        active_priorities = LEVEL_PRIORITIES.get(fix_level, ["P0", "P1"])
-        open_blocking = [t for t in tasks if t.get("priority") in active_priorities and t.get("status") == "open"]
+        active_priorities = LEVEL_PRIORITY_SETS.get(fix_level, DEFAULT_PRIORITY_SET)
+        open_blocking = [t for t in tasks if t.get("status") == "open" and t.get("priority") in active_priorities]
         if open_blocking:
             ids = [t["id"] for t in open_blocking[:10]]
             suffix = f" (and {len(open_blocking) - 10} more)" if len(open_blocking) > 10 else ""
@@ -2433,9 +2481,9 @@ def _cmd_remediate_verify_locked():
 
     tasks = state.get("remediation_tasks", [])
     fix_level = state.get("fix_level", "p0_p1")
-    active_priorities = LEVEL_PRIORITIES.get(fix_level, ["P0", "P1"])
+    active_priorities = LEVEL_PRIORITY_SETS.get(fix_level, DEFAULT_PRIORITY_SET)
 
-    open_blocking = [t for t in tasks if t["priority"] in active_priorities and t["status"] == "open"]
+    open_blocking = [t for t in tasks if t["status"] == "open" and t["priority"] in active_priorities]
     open_all = [t for t in tasks if t["status"] == "open"]
 
     project_path = Path(state["project_path"])
@@ -2598,9 +2646,11 @@ def _cmd_resume_locked(project_id: str):
     if state_file.exists():
         state = qralph_state.load_state(state_file)
     else:
-        checkpoints = sorted(checkpoint_dir.glob("*.json"))
-        if checkpoints:
-            state = qralph_state.load_state(checkpoints[-1])
+        # Single pass for the newest snapshot; no need to sort every checkpoint
+        newest = max(checkpoint_dir.glob("*.json"),
+                     key=lambda p: p.stat().st_mtime_ns, default=None)
+        if newest:
+            state = qralph_state.load_state(newest)
         else:
             return _error_result("No checkpoint found")
 
@@ -2648,18 +2698,28 @@ def _cmd_resume_locked(project_id: str):
     rem_tasks = state.get("remediation_tasks", [])
     if rem_tasks:
         fix_level = state.get("fix_level", "p0_p1")
-        active_priorities = LEVEL_PRIORITIES.get(fix_level, ["P0", "P1"])
-        open_blocking = [t for t in rem_tasks if t.get("priority") in active_priorities and t.get("status") == "open"]
+        active_priorities = LEVEL_PRIORITY_SETS.get(fix_level, DEFAULT_PRIORITY_SET)
+        # One pass tallies fixed + blocking instead of three comprehensions
+        fixed = open_count = 0
+        blocking_ids = []
+        for t in rem_tasks:
+            status = t.get("status")
+            if status == "fixed":
+                fixed += 1
+            elif status == "open" and t.get("priority") in active_priorities:
+                open_count += 1
+                if len(blocking_ids) < 20:
+                    blocking_ids.append(t["id"])
         output["remediation_progress"] = {
             "total": len(rem_tasks),
-            "fixed": len([t for t in rem_tasks if t.get("status") == "fixed"]),
-            "open_at_fix_level": len(open_blocking),
+            "fixed": fixed,
+            "open_at_fix_level": open_count,
             "fix_level": fix_level,
         }
-        if open_blocking:
-            output["remediation_progress"]["blocking_ids"] = [t["id"] for t in open_blocking[:20]]
+        if open_count:
+            output["remediation_progress"]["blocking_ids"] = blocking_ids
             output["remediation_progress"]["warning"] = (
-                f"{len(open_blocking)} tasks must be fixed before finalize. "
+                f"{open_count} tasks must be fixed before finalize. "
                 "Continue remediation, then run remediate-verify."
             )
 
@@ -2687,8 +2747,13 @@ def cmd_status(project_id: Optional[str] = None):
         if matches:
             project_path = matches[0]
             state_file = project_path / "checkpoints" / "state.json"
-            state = safe_read_json(state_file)
-            if state:
+            raw = qralph_state.safe_read_text(state_file, "")
+            try:
+                state = json.loads(raw) if raw else {}
+            except json.JSONDecodeError as e:
+                print(f"Warning: Invalid JSON in {state_file}: {e}", file=sys.stderr)
+                state = {}
+            if isinstance(state, dict) and state:
                 # Build findings summary
                 findings = state.get("findings", {})
                 if isinstance(findings, dict):
@@ -2711,7 +2776,7 @@ def cmd_status(project_id: Optional[str] = None):
                 if validating_file.exists():
                     validation_result = safe_read_json(validating_file)
 
-                state["_status_summary"] = {
+                summary = {
                     "findings": {
                         "p0": p0_count,
                         "p1": p1_count,
@@ -2728,28 +2793,35 @@ def cmd_status(project_id: Optional[str] = None):
                     "fix_level": state.get("fix_level", "p0_p1"),
                 }
 
-                print(json.dumps(state, indent=2))
+                # Splice the summary into the file text instead of re-dumping the whole state
+                summary_json = json.dumps(summary, indent=2).replace("\n", "\n  ")
+                print(f'{raw.rstrip()[:-1].rstrip()},\n  "_status_summary": {summary_json}\n}}')
             else:
                 print(json.dumps({"project": project_path.name, "status": "no state file"}))
         else:
             _error_result(f"Project not found: {project_id}")
     else:
         projects = []
-        if PROJECTS_DIR.exists():
-            for p in sorted(PROJECTS_DIR.glob("[0-9][0-9][0-9]-*")):
-                state_file = p / "checkpoints" / "state.json"
-                state = safe_read_json(state_file)
-                if state:
-                    projects.append({
-                        "id": p.name,
-                        "phase": state.get("phase", "unknown"),
-                        "mode": state.get("mode", "unknown"),
-                        "team": state.get("team_name", "N/A"),
-                        "agents": len(state.get("agents", [])),
-                        "created": state.get("created_at", "unknown"),
-                    })
-                else:
-                    projects.append({"id": p.name, "phase": "no state"})
+        try:
+            with os.scandir(PROJECTS_DIR) as it:
+                project_names = sorted(e.name for e in it
+                                       if PROJECT_DIR_NAME.match(e.name) and e.is_dir())
+        except FileNotFoundError:
+            project_names = []
+        for name in project_names:
+            state_file = PROJECTS_DIR / name / "checkpoints" / "state.json"
+            state = safe_read_json(state_file)
+            if state:
+                projects.append({
+                    "id": name,
+                    "phase": state.get("phase", "unknown"),
+                    "mode": state.get("mode", "unknown"),
+                    "team": state.get("team_name", "N/A"),
+                    "agents": len(state.get("agents", [])),
+                    "created": state.get("created_at", "unknown"),
+                })
+            else:
+                projects.append({"id": name, "phase": "no state"})
         print(json.dumps({"projects": projects}, indent=2))
 
 
@@ -2814,35 +2886,58 @@ def handle_control_command(command: str, state: dict, project_path: Path) -> dic
     return output
 
 
-def write_status_file(state: dict, project_path: Path):
-    """Write a human-readable STATUS.md with phase, team, and breaker info."""
-    breakers = state.get("circuit_breakers", {})
-    status_content = f"""# QRALPH Status: {state.get('project_id', 'unknown')}
+STATUS_TEMPLATE = """# QRALPH Status: {project_id}
 
 ## Current State
-- **Phase**: {state.get('phase', 'unknown')}
-- **Mode**: {state.get('mode', 'unknown')}
-- **Team**: {state.get('team_name', 'N/A')}
-- **Heal Attempts**: {state.get('heal_attempts', 0)} / {MAX_HEAL_ATTEMPTS}
+- **Phase**: {phase}
+- **Mode**: {mode}
+- **Team**: {team_name}
+- **Heal Attempts**: {heal_attempts} / {max_heal_attempts}
 
 ## Team
-- **Agents**: {', '.join(state.get('agents', []))}
-- **Teammates**: {', '.join(state.get('teammates', []))}
-- **Domains**: {', '.join(state.get('domains', []))}
+- **Agents**: {agents}
+- **Teammates**: {teammates}
+- **Domains**: {domains}
 
 ## Circuit Breakers
-- **Total Tokens**: {breakers.get('total_tokens', 0):,} / {MAX_TOKENS:,}
-- **Total Cost**: ${breakers.get('total_cost_usd', 0.0):.2f} / ${MAX_COST_USD:.2f}
-- **Unique Errors**: {len(breakers.get('error_counts', {}))}
+- **Total Tokens**: {total_tokens:,} / {max_tokens:,}
+- **Total Cost**: ${total_cost_usd:.2f} / ${max_cost_usd:.2f}
+- **Unique Errors**: {unique_errors}
 
 ## Findings Summary
-- P0: {len(state.get('findings', {}).get('P0', []))}
-- P1: {len(state.get('findings', {}).get('P1', []))}
-- P2: {len(state.get('findings', {}).get('P2', []))}
+- P0: {p0}
+- P1: {p1}
+- P2: {p2}
 
 ---
-*Status generated at: {datetime.now().isoformat()}*
+*Status generated at: {generated_at}*
 """
+
+
+def write_status_file(state: dict, project_path: Path):
+    """Write a human-readable STATUS.md with phase, team, and breaker info."""
+    breakers = state.get("circuit_breakers", {})
+    findings = state.get("findings", {})
+    status_content = STATUS_TEMPLATE.format_map({
+        "project_id": state.get("project_id", "unknown"),
+        "phase": state.get("phase", "unknown"),
+        "mode": state.get("mode", "unknown"),
+        "team_name": state.get("team_name", "N/A"),
+        "heal_attempts": state.get("heal_attempts", 0),
+        "max_heal_attempts": MAX_HEAL_ATTEMPTS,
+        "agents": ", ".join(state.get("agents", [])),
+        "teammates": ", ".join(state.get("teammates", [])),
+        "domains": ", ".join(state.get("domains", [])),
+        "total_tokens": breakers.get("total_tokens", 0),
+        "max_tokens": MAX_TOKENS,
+        "total_cost_usd": breakers.get("total_cost_usd", 0.0),
+        "max_cost_usd": MAX_COST_USD,
+        "unique_errors": len(breakers.get("error_counts", {})),
+        "p0": len(findings.get("P0", [])),
+        "p1": len(findings.get("P1", [])),
+        "p2": len(findings.get("P2", [])),
+        "generated_at": datetime.now().isoformat(),
+    })
     safe_write(project_path / "STATUS.md", status_content)
 
 
@@ -2884,11 +2979,8 @@ def notify(message: str):
 
 def cmd_subteam_status(phase: str):
     """Check sub-team status with circuit breaker and control command checks."""
-    state, project_path = load_state(), None
-    if state:
-        project_path = Path(state.get("project_path", ""))
-
-    if not state or not project_path or not project_path.exists():
+    state, project_path = load_state_with_path()
+    if not project_path:
         return _error_result("No active project.")
 
     # Control + circuit breaker checks
@@ -2910,19 +3002,17 @@ def cmd_subteam_status(phase: str):
 
 def cmd_quality_gate_wrapper(phase: str):
     """Run quality gate with logging."""
-    state = load_state()
+    state, project_path = load_state_with_path()
     if not state:
         return _error_result("No active project.")
 
-    project_path = Path(state.get("project_path", ""))
-
     _subteam_path = SCRIPT_DIR / "qralph-subteam.py"
     _subteam_spec = importlib.util.spec_from_file_location("qralph_subteam", _subteam_path)
     subteam_mod = importlib.util.module_from_spec(_subteam_spec)
     _subteam_spec.loader.exec_module(subteam_mod)
     result = subteam_mod.cmd_quality_gate(phase)
 
-    if project_path.exists():
+    if project_path:
         passed = result.get("passed", False) if isinstance(result, dict) else False
         log_decision(project_path, f"Quality gate {phase}: {'PASSED' if passed else 'FAILED'} "
                      f"(confidence: {result.get('confidence', 0) if isinstance(result, dict) else 0})")
@@ -2933,11 +3023,10 @@ def cmd_quality_gate_wrapper(phase: str):
 
 def cmd_pe_gate(from_phase: str, to_phase: str):
     """Run PE overlay gate check manually."""
-    state = load_state()
-    if not state:
-        return _error_result("No active project.")
-    result = run_pe_gate(from_phase, to_phase, state)
-    save_state(state)
+    with qralph_state.state_transaction(get_state_file()) as state:
+        if not state:
+            return _error_result("No active project.")
+        result = run_pe_gate(from_phase, to_phase, state)
     print(json.dumps(result, indent=2, default=str))
     return result
 
@@ -3167,54 +3256,39 @@ def main():
         request = args.request_flag or args.request
         if not request:
             parser.error("init requires a request argument")
-        cmd_init(request, args.mode, args.execution_mode, args.fix_level)
-    elif args.command == "discover":
-        cmd_discover()
-    elif args.command == "select-agents":
-        agents = args.agents.split(",") if args.agents else None
-        cmd_select_agents(agents, use_subteam=args.subteam)
-    elif args.command == "synthesize":
-        cmd_synthesize()
-    elif args.command == "checkpoint":
-        cmd_checkpoint(args.phase)
-    elif args.command == "generate-uat":
-        cmd_generate_uat()
-    elif args.command == "finalize":
-        cmd_finalize()
-    elif args.command == "heal":
-        cmd_heal(args.error_details)
-    elif args.command == "resume":
-        cmd_resume(args.project_id)
-    elif args.command == "status":
-        cmd_status(args.project_id)
-    elif args.command == "work-plan":
-        cmd_work_plan()
-    elif args.command == "work-approve":
-        cmd_work_approve()
-    elif args.command == "work-iterate":
-        cmd_work_iterate(args.feedback)
-    elif args.command == "escalate":
-        cmd_escalate()
-    elif args.command == "remediate":
-        cmd_remediate()
-    elif args.command == "remediate-done":
-        cmd_remediate_done(args.task_ids, args.notes, args.batch)
-    elif args.command == "remediate-verify":
-        cmd_remediate_verify()
-    elif args.command == "subteam-status":
-        cmd_subteam_status(args.phase)
-    elif args.command == "quality-gate":
-        cmd_quality_gate_wrapper(args.phase)
-    elif args.command == "pe-gate":
-        cmd_pe_gate(args.from_phase, args.to_phase)
-    elif args.command == "coe-analyze":
-        cmd_coe_analyze(args.task, args.validate)
-    elif args.command == "pattern-sweep":
-        cmd_pattern_sweep(args.task, args.scope)
-    elif args.command == "adr-check":
-        cmd_adr_check(args.approve, args.list)
-    elif args.command == "adr-list":
-        cmd_adr_list()
+        args.request = request
+
+    commands = {
+        "init": lambda: cmd_init(args.request, args.mode, args.execution_mode, args.fix_level),
+        "discover": cmd_discover,
+        "select-agents": lambda: cmd_select_agents(args.agents.split(",") if args.agents else None,
+                                                   use_subteam=args.subteam),
+        "synthesize": cmd_synthesize,
+        "checkpoint": lambda: cmd_checkpoint(args.phase),
+        "generate-uat": cmd_generate_uat,
+        "finalize": cmd_finalize,
+        "heal": lambda: cmd_heal(args.error_details),
+        "resume": lambda: cmd_resume(args.project_id),
+        "status": lambda: cmd_status(args.project_id),
+        "work-plan": cmd_work_plan,
+        "work-approve": cmd_work_approve,
+        "work-iterate": lambda: cmd_work_iterate(args.feedback),
+        "escalate": cmd_escalate,
+        "remediate": cmd_remediate,
+        "remediate-done": lambda: cmd_remediate_done(args.task_ids, args.notes, args.batch),
+        "remediate-verify": cmd_remediate_verify,
+        "subteam-status": lambda: cmd_subteam_status(args.phase),
+        "quality-gate": lambda: cmd_quality_gate_wrapper(args.phase),
+        "pe-gate": lambda: cmd_pe_gate(args.from_phase, args.to_phase),
+        "coe-analyze": lambda: cmd_coe_analyze(args.task, args.validate),
+        "pattern-sweep": lambda: cmd_pattern_sweep(args.task, args.scope),
+        "adr-check": lambda: cmd_adr_check(args.approve, args.list),
+        "adr-list": cmd_adr_list,
+    }
+
+    handler = commands.get(args.command)
+    if handler:
+        handler()
     else:
         parser.print_help()
 
@@ -10,16 +10,18 @@ and corruption recovery for all QRALPH tools.
 Both qralph-orchestrator.py and qralph-healer.py import from here.
 """
 
-import hashlib
+import copy
 import json
 import os
 import sys
-import tempfile
 import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Thread-local flag to track when exclusive lock is held
 _lock_state = threading.local()
@@ -43,7 +45,8 @@ PROJECT_ROOT = Path.cwd()
 QRALPH_DIR = PROJECT_ROOT / ".qralph"
 STATE_FILE = QRALPH_DIR / "current-project.json"
 
-REQUIRED_STATE_FIELDS = {
+# Read-only schema constants shared by every tool that imports this module
+REQUIRED_STATE_FIELDS = MappingProxyType({
     "project_id": str,
     "project_path": str,
     "request": str,
@@ -53,18 +56,27 @@ REQUIRED_STATE_FIELDS = {
     "agents": list,
     "heal_attempts": int,
     "circuit_breakers": dict,
-}
+})
+
+# (field, type) pairs for validate_state's per-call loop
+_REQUIRED_FIELD_TYPES = tuple(REQUIRED_STATE_FIELDS.items())
 
-VALID_PHASES = {"INIT", "DISCOVERING", "REVIEWING", "EXECUTING", "UAT", "COMPLETE",
-                "PLANNING", "USER_REVIEW", "ESCALATE", "VALIDATING",
-                "PLAN", "EXECUTE", "VERIFY",
-                "IDEATE", "PERSONA", "CONCEPT_REVIEW", "SIMPLIFY",
-                "QUALITY_LOOP", "QUALITY_DISCOVERY", "QUALITY_FIX",
-                "POLISH", "LEARN", "BACKTRACK_REPLAN",
-                "DEPLOY", "SMOKE"}
+VALID_PHASES = frozenset({"INIT", "DISCOVERING", "REVIEWING", "EXECUTING", "UAT", "COMPLETE",
+                          "PLANNING", "USER_REVIEW", "ESCALATE", "VALIDATING",
+                          "PLAN", "EXECUTE", "VERIFY",
+                          "IDEATE", "PERSONA", "CONCEPT_REVIEW", "SIMPLIFY",
+                          "QUALITY_LOOP", "QUALITY_DISCOVERY", "QUALITY_FIX",
+                          "POLISH", "LEARN", "BACKTRACK_REPLAN",
+                          "DEPLOY", "SMOKE"})
 
-VALID_SUBTEAM_STATUSES = {"creating", "running", "complete", "failed", "timeout",
-                          "interrupted", "resuming"}
+VALID_SUBTEAM_STATUSES = frozenset({"creating", "running", "complete", "failed", "timeout",
+                                    "interrupted", "resuming"})
+
+# safe_write durability levels:
+#   "none" - atomic rename only; a crash may lose the write but never tears it
+#   "data" - fdatasync the file contents before the rename (default)
+#   "full" - fsync the file, then fsync the parent directory so the rename survives power loss
+DURABILITY_LEVELS = ("none", "data", "full")
 
 DEFAULT_CIRCUIT_BREAKERS = {
     "total_tokens": 0,
@@ -72,12 +84,105 @@ DEFAULT_CIRCUIT_BREAKERS = {
     "error_counts": {},
 }
 
+# repair_state fill-ins; created_at is stamped at repair time instead
+_REPAIR_DEFAULTS = MappingProxyType({
+    "project_id": "unknown",
+    "project_path": str(QRALPH_DIR / "projects" / "unknown"),
+    "request": "",
+    "mode": "coding",
+    "phase": "INIT",
+    "agents": [],
+    "teammates": [],
+    "heal_attempts": 0,
+    "circuit_breakers": DEFAULT_CIRCUIT_BREAKERS,
+    "findings": [],
+    "domains": [],
+    "fix_level": "p0_p1",
+    "remediation_tasks": [],
+    "sub_teams": {},
+    "last_seen_version": "",
+    "pe_overlay": {},
+    "adrs": [],
+    "dod_template": "",
+    "coe_analyses": {},
+})
+_REPAIR_FIELDS = frozenset(_REPAIR_DEFAULTS) | {"created_at"}
+
+
+# Canonical encoder for checksums. Built once: json.dumps() with non-default
+# options constructs a fresh JSONEncoder on every call.
+_CHECKSUM_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+# Empty SHA-256 context; .copy() skips re-initialising the hash constants per call.
+# Built on the first checksum so read-only tools never load hashlib's OpenSSL bindings.
+_SHA256_TEMPLATE = None
+
+# Last (serialization, checksum) pair. A load_state -> save_state cycle that
+# leaves the state untouched serializes to the same text and skips the re-hash.
+_checksum_memo: Dict[str, str] = {}
+
 
 def _compute_checksum(data: dict) -> str:
-    """Compute SHA-256 checksum of state dict for corruption detection (not tamper-proof)."""
-    clean = {k: v for k, v in data.items() if k != "_checksum"}
-    serialized = json.dumps(clean, sort_keys=True, default=str)
-    return hashlib.sha256(serialized.encode()).hexdigest()
+    """Compute SHA-256 checksum of state dict for corruption detection (not tamper-proof).
+
+    Always hashes the full canonical serialization. Per-field hashes cached by
+    object identity would go stale: callers mutate findings, remediation_tasks
+    and sub_teams in place, which keeps id() stable while the content changes.
+    """
+    return _checksum_of(_canonical_json(data))
+
+
+def _canonical_json(data: dict) -> str:
+    """Serialize state without its _checksum, exactly as the checksum covers it."""
+    return _CHECKSUM_ENCODER.encode({k: v for k, v in data.items() if k != "_checksum"})
+
+
+def _checksum_of(serialized: str) -> str:
+    """SHA-256 hex digest of a canonical serialization."""
+    global _SHA256_TEMPLATE
+    if _checksum_memo.get("serialized") == serialized:
+        return _checksum_memo["checksum"]
+    if _SHA256_TEMPLATE is None:
+        import hashlib
+        _SHA256_TEMPLATE = hashlib.sha256()
+    # SHA-256 on purpose: OpenSSL's SHA-NI path outruns hashlib.blake2b/md5, and
+    # BLAKE3/xxHash would add a non-stdlib dependency to every QRALPH tool.
+    hasher = _SHA256_TEMPLATE.copy()
+    hasher.update(serialized.encode())
+    checksum = hasher.hexdigest()
+    _checksum_memo["serialized"] = serialized
+    _checksum_memo["checksum"] = checksum
+    return checksum
+
+
+def _state_file_text(serialized: str, checksum: str) -> str:
+    """Splice _checksum into a canonical serialization as its last key.
+
+    The state file is then the checksummed text plus a fixed suffix, so a
+    save serializes once and load_state can verify the file text directly.
+    """
+    separator = ", " if serialized != "{}" else ""
+    return f'{serialized[:-1]}{separator}"_checksum": "{checksum}"}}'
+
+
+def _stored_checksum_matches(content: str, expected: Any) -> bool:
+    """Check a file written by _state_file_text against its own checksum.
+
+    Returns False for any other layout (older indented files, hand edits);
+    the caller then falls back to re-serializing the parsed state.
+    """
+    suffix = f'"_checksum": "{expected}"}}'
+    text = content.rstrip()
+    if not isinstance(expected, str) or not text.endswith(suffix):
+        return False
+    prefix = text[:-len(suffix)]
+    if prefix.endswith(", "):
+        serialized = prefix[:-2] + "}"
+    elif prefix == "{":
+        serialized = "{}"
+    else:
+        return False
+    return _checksum_of(serialized) == expected
 
 
 def _lock_file(f, exclusive: bool = False):
@@ -127,6 +232,21 @@ def is_exclusive_lock_held() -> bool:
     return getattr(_lock_state, 'held', False)
 
 
+def _read_unlocked(path: Path) -> str:
+    """Read a whole file with one open/fstat/read and no flock.
+
+    Only for callers that already exclude writers (exclusive_state_lock).
+    safe_write replaces files by rename, so the inode behind an open fd is
+    never rewritten and its fstat size is the size that will be read.
+    """
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
 def load_state(state_file: Optional[Path] = None) -> dict:
     """
     Load project state with file locking and checksum validation.
@@ -144,41 +264,50 @@ def load_state(state_file: Optional[Path] = None) -> dict:
         State dict, or empty dict if file missing/corrupt.
     """
     state_file = state_file or STATE_FILE
-    if not state_file.exists():
-        return {}
 
     try:
-        with open(state_file, 'r') as f:
-            _lock_file(f, exclusive=False)
-            try:
-                content = f.read()
-                if not content:
-                    return {}
-                state = json.loads(content)
-
-                # Validate checksum while still holding the lock
-                if "_checksum" in state:
-                    expected = state["_checksum"]
-                    actual = _compute_checksum(state)
-                    if expected != actual:
-                        print(f"Warning: State checksum mismatch (expected {expected}, got {actual}). "
-                              "Returning repaired state.", file=sys.stderr)
-                        repaired = repair_state(state)
-                        return repaired
-
+        if is_exclusive_lock_held():
+            # No writer can run while we hold the exclusive lock
+            content = _read_unlocked(state_file)
+        else:
+            with open(state_file, 'r') as f:
+                _lock_file(f, exclusive=False)
+                try:
+                    content = f.read()
+                finally:
+                    _unlock_file(f)
+        if not content:
+            return {}
+        state = json.loads(content)
+        # Parsed strings are fresh objects; interning the phase lets the
+        # VALID_PHASES lookup and phase-table lookups match on identity
+        if isinstance(state, dict) and isinstance(state.get("phase"), str):
+            state["phase"] = sys.intern(state["phase"])
+
+        if "_checksum" in state:
+            expected = state["_checksum"]
+            if _stored_checksum_matches(content, expected):
                 return state
-            except json.JSONDecodeError as e:
-                print(f"Warning: Invalid JSON in state file: {e}", file=sys.stderr)
-                return {}
-            finally:
-                _unlock_file(f)
+            actual = _compute_checksum(state)
+            if expected != actual:
+                print(f"Warning: State checksum mismatch (expected {expected}, got {actual}). "
+                      "Returning repaired state.", file=sys.stderr)
+                repaired = repair_state(state)
+                return repaired
 
+        return state
+
+    except json.JSONDecodeError as e:
+        print(f"Warning: Invalid JSON in state file: {e}", file=sys.stderr)
+        return {}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
     except Exception as e:
         print(f"Warning: Error loading state: {e}", file=sys.stderr)
         return {}
 
 
-def save_state(state: dict, state_file: Optional[Path] = None):
+def save_state(state: dict, state_file: Optional[Path] = None, durability: str = "data"):
     """
     Save project state with atomic write, file locking, and checksum injection.
 
@@ -187,14 +316,61 @@ def save_state(state: dict, state_file: Optional[Path] = None):
     Args:
         state: State dict to save
         state_file: Path to state file (defaults to current-project.json)
+        durability: One of DURABILITY_LEVELS (see safe_write)
     """
     state_file = state_file or STATE_FILE
+
+    # Inject checksum; the serialization it covers is also the file body
+    serialized = _canonical_json(state)
+    state["_checksum"] = _checksum_of(serialized)
+
+    _write_state(state_file, _state_file_text(serialized, state["_checksum"]), durability)
+
+
+def _write_state(state_file: Path, text: str, durability: str):
+    """Write state file text produced by _state_file_text."""
     state_file.parent.mkdir(parents=True, exist_ok=True)
+    safe_write(state_file, text, durability=durability)
+
 
-    # Inject checksum
-    state["_checksum"] = _compute_checksum(state)
+@contextmanager
+def state_transaction(state_file: Optional[Path] = None, durability: str = "data"):
+    """
+    Load state once, let the block mutate it, and save it once on exit.
+
+    Usage:
+        with state_transaction() as state:
+            state["phase"] = "REVIEWING"
+            state["heal_attempts"] += 1
 
-    safe_write_json(state_file, state)
+    Holds exclusive_state_lock() for the whole block, so any number of field
+    changes cost a single write. Nothing is written when the block raises,
+    when the state is unchanged, or when it is still empty on exit. A block
+    that fills in an empty (missing or unreadable) state does save it.
+    """
+    with exclusive_state_lock():
+        state = load_state(state_file)
+        # load_state has already verified the stored checksum, so it stands in
+        # for the loaded content. A repaired or checksum-less state never
+        # matches and gets rewritten with a fresh checksum.
+        before = state.get("_checksum")
+        yield state
+        if state:
+            serialized = _canonical_json(state)
+            after = _checksum_of(serialized)
+            if after != before:
+                state["_checksum"] = after
+                _write_state(state_file or STATE_FILE, _state_file_text(serialized, after), durability)
+
+
+@lru_cache(maxsize=256)
+def _is_iso_timestamp(value: str) -> bool:
+    """Return True if value parses as an ISO-8601 timestamp (memoized per string)."""
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
 
 
 def validate_state(state: dict) -> List[str]:
@@ -210,7 +386,7 @@ def validate_state(state: dict) -> List[str]:
         errors.append("State is empty")
         return errors
 
-    for field, expected_type in REQUIRED_STATE_FIELDS.items():
+    for field, expected_type in _REQUIRED_FIELD_TYPES:
         if field not in state:
             errors.append(f"Missing required field: {field}")
         elif not isinstance(state[field], expected_type):
@@ -230,10 +406,9 @@ def validate_state(state: dict) -> List[str]:
             errors.append("circuit_breakers.error_counts must be dict")
 
     if "created_at" in state:
-        try:
-            datetime.fromisoformat(state["created_at"])
-        except (ValueError, TypeError):
-            errors.append(f"Invalid ISO timestamp in created_at: {state.get('created_at')}")
+        created_at = state["created_at"]
+        if not isinstance(created_at, str) or not _is_iso_timestamp(created_at):
+            errors.append(f"Invalid ISO timestamp in created_at: {created_at}")
 
     if "heal_attempts" in state:
         if not isinstance(state["heal_attempts"], int) or state["heal_attempts"] < 0:
@@ -255,47 +430,31 @@ def validate_state(state: dict) -> List[str]:
 
 def repair_state(state: dict) -> dict:
     """
-    Fill missing required fields with defaults. Returns repaired copy.
+    Fill missing required fields with defaults.
 
-    Does NOT overwrite existing fields - only fills gaps.
+    Does NOT overwrite existing fields - only fills gaps. A state with no gaps
+    is returned as-is; otherwise a repaired copy is returned and the input is
+    left untouched.
     """
-    repaired = dict(state)
+    missing = _REPAIR_FIELDS.difference(state)
+    cb = state.get("circuit_breakers")
+    if not missing and isinstance(cb, dict) and cb.keys() >= DEFAULT_CIRCUIT_BREAKERS.keys():
+        return state
 
-    defaults = {
-        "project_id": "unknown",
-        "project_path": str(QRALPH_DIR / "projects" / "unknown"),
-        "request": "",
-        "mode": "coding",
-        "phase": "INIT",
-        "created_at": datetime.now().isoformat(),
-        "agents": [],
-        "teammates": [],
-        "heal_attempts": 0,
-        "circuit_breakers": dict(DEFAULT_CIRCUIT_BREAKERS),
-        "findings": [],
-        "domains": [],
-        "fix_level": "p0_p1",
-        "remediation_tasks": [],
-        "sub_teams": {},
-        "last_seen_version": "",
-        "pe_overlay": {},
-        "adrs": [],
-        "dod_template": "",
-        "coe_analyses": {},
-    }
-
-    for field, default in defaults.items():
-        if field not in repaired:
-            repaired[field] = default
+    repaired = dict(state)
+    for field in missing:
+        if field == "created_at":
+            repaired[field] = datetime.now().isoformat()
+        else:
+            # Fresh containers so repaired states never share the defaults
+            repaired[field] = copy.deepcopy(_REPAIR_DEFAULTS[field])
 
     # Repair circuit_breakers sub-fields
-    cb = repaired.get("circuit_breakers", {})
+    cb = repaired["circuit_breakers"]
     if not isinstance(cb, dict):
-        repaired["circuit_breakers"] = dict(DEFAULT_CIRCUIT_BREAKERS)
-    else:
-        for key, default_val in DEFAULT_CIRCUIT_BREAKERS.items():
-            if key not in cb:
-                cb[key] = default_val
+        repaired["circuit_breakers"] = copy.deepcopy(DEFAULT_CIRCUIT_BREAKERS)
+    elif not cb.keys() >= DEFAULT_CIRCUIT_BREAKERS.keys():
+        repaired["circuit_breakers"] = {**copy.deepcopy(DEFAULT_CIRCUIT_BREAKERS), **cb}
 
     return repaired
 
@@ -336,9 +495,12 @@ def validate_state_consistency(state: dict, project_path: Path) -> List[str]:
 
     # agents match output files
     agents = state.get("agents", [])
-    outputs_dir = project_path / "agent-outputs"
-    if outputs_dir.exists() and agents:
-        output_files = {f.stem for f in outputs_dir.glob("*.md")}
+    if agents:
+        try:
+            with os.scandir(project_path / "agent-outputs") as it:
+                output_files = {e.name[:-3] for e in it if e.name.endswith(".md")}
+        except (FileNotFoundError, NotADirectoryError):
+            output_files = set()
         agent_set = set(agents) if isinstance(agents, list) and all(isinstance(a, str) for a in agents) else set()
         orphans = output_files - agent_set
         if orphans:
@@ -355,7 +517,21 @@ def validate_state_consistency(state: dict, project_path: Path) -> List[str]:
     return errors
 
 
-def safe_write(path: Path, content: str):
+def _fsync_dir(directory: Path):
+    """Flush a directory entry (e.g. a fresh rename) to disk. Best effort: no-op where unsupported."""
+    try:
+        dir_fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def safe_write(path: Path, content: Union[str, bytes], durability: str = "data"):
     """
     Atomic file write: write to temp file in same directory, then rename.
 
@@ -363,14 +539,26 @@ def safe_write(path: Path, content: str):
 
     Args:
         path: Target file path
-        content: Content to write
+        content: Text (written as UTF-8) or already-encoded bytes
+        durability: One of DURABILITY_LEVELS. "none" skips the device flush,
+            "data" fdatasyncs the file, "full" also fsyncs the parent directory.
+
+    Raises:
+        ValueError: If durability is not a known level.
     """
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"Invalid durability: {durability}. Must be one of {DURABILITY_LEVELS}")
+
     # Check parent for symlinks BEFORE creating temp file (prevents TOCTOU via symlinked parent)
     if os.path.islink(str(path.parent)):
         raise OSError(f"Refusing to write: parent directory is a symlink: {path.parent}")
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    # Deferred: tempfile pulls in shutil and random, which only writers need
+    import tempfile
+
     tmp_path = None
     try:
         fd, tmp_path = tempfile.mkstemp(
@@ -379,18 +567,23 @@ def safe_write(path: Path, content: str):
             suffix=".tmp"
         )
         try:
-            with os.fdopen(fd, 'w') as f:
-                _lock_file(f, exclusive=True)
-                try:
-                    f.write(content)
-                    f.flush()
-                    os.fsync(f.fileno())
-                finally:
-                    _unlock_file(f)
-            os.chmod(tmp_path, 0o600)
-            if os.path.islink(str(path)):
-                os.unlink(str(path))
-            os.rename(tmp_path, str(path))
+            # mkstemp creates the file 0o600 with O_EXCL, so it is already private
+            # and is written unbuffered and unlocked straight from the encoded bytes.
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                if durability == "full":
+                    os.fsync(fd)
+                elif durability == "data":
+                    getattr(os, "fdatasync", os.fsync)(fd)
+            finally:
+                os.close(fd)
+            # rename() never follows a symlink at the destination: a symlinked
+            # target is itself replaced, atomically, by the regular file
+            os.replace(tmp_path, str(path))
+            if durability == "full":
+                _fsync_dir(path.parent)
         except Exception:
             # Clean up temp file on failure
             if tmp_path:
@@ -404,25 +597,66 @@ def safe_write(path: Path, content: str):
         raise
 
 
-def safe_write_json(path: Path, data: Any):
+def safe_write_json(path: Path, data: Any, verify_readback: bool = False,
+                    durability: str = "data"):
     """
-    Atomic JSON write with roundtrip validation.
+    Atomic JSON write with optional readback verification.
 
-    Writes JSON, reads it back, and verifies content matches.
+    json.dumps only returns text that json.loads accepts, so the content is
+    not re-parsed before writing. With verify_readback, the file is read back
+    after the rename and compared with what was written.
 
     Args:
         path: Target file path
-        data: Data to serialize as JSON
+        data: Data to serialize as JSON (indented by 2)
+        verify_readback: Re-read the written file and raise OSError on mismatch
+        durability: One of DURABILITY_LEVELS (see safe_write)
+
+    Raises:
+        OSError: If verify_readback is set and the file on disk differs.
     """
     content = json.dumps(data, indent=2)
 
-    # Roundtrip validation before writing
-    try:
-        roundtripped = json.loads(content)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"JSON serialization produced invalid JSON: {e}")
+    safe_write(path, content, durability=durability)
+
+    if verify_readback and path.read_text() != content:
+        raise OSError(f"Readback mismatch after writing {path}")
+
+
+def print_json(output: Any) -> None:
+    """Print a command result to stdout: indented for a terminal, compact when piped."""
+    if sys.stdout.isatty():
+        print(json.dumps(output, indent=2))
+    else:
+        print(json.dumps(output, separators=(",", ":")))
+
 
-    safe_write(path, content)
+def safe_read_text(path: Path, default: Optional[str] = None) -> Optional[str]:
+    """
+    Read a text file under a shared lock.
+
+    Use this when the caller needs the raw bytes of a JSON file as well as
+    its parsed form (e.g. to echo it back without re-serializing).
+
+    Args:
+        path: File path to read
+        default: Value to return if file missing or unreadable
+
+    Returns:
+        File content, or default value.
+    """
+    try:
+        with open(path, 'r') as f:
+            _lock_file(f, exclusive=False)
+            try:
+                return f.read()
+            finally:
+                _unlock_file(f)
+    except (FileNotFoundError, NotADirectoryError):
+        return default
+    except Exception as e:
+        print(f"Warning: Error reading {path}: {e}", file=sys.stderr)
+        return default
 
 
 def safe_read_json(path: Path, default: Any = None) -> Any:
@@ -436,9 +670,6 @@ def safe_read_json(path: Path, default: Any = None) -> Any:
     Returns:
         Parsed JSON data, or default value.
     """
-    if not path.exists():
-        return default if default is not None else {}
-
     try:
         with open(path, 'r') as f:
             _lock_file(f, exclusive=False)
@@ -450,6 +681,58 @@ def safe_read_json(path: Path, default: Any = None) -> Any:
                 return default if default is not None else {}
             finally:
                 _unlock_file(f)
+    except (FileNotFoundError, NotADirectoryError):
+        return default if default is not None else {}
     except Exception as e:
         print(f"Warning: Error reading {path}: {e}", file=sys.stderr)
         return default if default is not None else {}
+
+
+def stat_key(path: Union[str, Path]) -> Optional[List[int]]:
+    """(mtime_ns, size) of a path as a JSON-friendly list, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_ttl_cache(path: Path, ttl: float, inputs_of: Callable[[Any], Any]) -> Any:
+    """
+    Return a value saved by save_ttl_cache(), or None if it is stale.
+
+    The entry is stale once it is ttl seconds old, or when inputs_of(value)
+    no longer equals the input fingerprint saved with it.
+
+    Args:
+        path: Cache file path
+        ttl: Maximum entry age in seconds
+        inputs_of: Computes the current input fingerprint for a cached value
+
+    Returns:
+        The cached value, or None if missing, unreadable or stale.
+    """
+    try:
+        entry = json.loads(Path(path).read_text())
+        if not 0 <= time.time() - entry["timestamp"] < ttl:
+            return None
+        value = entry["value"]
+        if entry["inputs"] != inputs_of(value):
+            return None
+        return value
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_ttl_cache(path: Path, value: Any, inputs: Any) -> None:
+    """
+    Persist value and its input fingerprint for load_ttl_cache(); best effort.
+
+    The write is atomic, so a concurrent reader never sees half-written JSON,
+    but skips the device flush: a lost entry is simply recomputed.
+    """
+    entry = {"timestamp": time.time(), "inputs": inputs, "value": value}
+    try:
+        safe_write(path, json.dumps(entry), durability="none")
+    except OSError:
+        pass
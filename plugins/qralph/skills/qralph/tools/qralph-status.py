@@ -9,18 +9,23 @@ Displays real-time status of QRALPH orchestration projects.
 Usage:
     python3 qralph-status.py                  # List all projects
     python3 qralph-status.py <project-id>     # Detailed status for one project
-    python3 qralph-status.py --watch          # Watch mode (refresh every 5s)
+    python3 qralph-status.py --watch          # Watch mode (redraw on change)
     python3 qralph-status.py <id> --watch     # Watch specific project
 """
 
 import argparse
+import io
 import json
 import os
+import re
+import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import importlib.util
 _state_path = Path(__file__).parent / "qralph-state.py"
@@ -35,6 +40,23 @@ _session_spec.loader.exec_module(session_state)
 
 safe_read_json = qralph_state.safe_read_json
 
+# Watch mode stats the watched files this often and redraws as soon as one changes
+WATCH_POLL_SECONDS = 0.25
+
+# Cursor home, clear screen, clear scrollback: the same sequence `clear` emits,
+# written at the start of each watch-mode frame instead of spawning a process
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+
+# SGR color codes, which take no columns on screen
+ANSI_SGR_RE = re.compile(r"\033\[[0-9;]*m")
+
+# Upper bound on threads loading checkpoints for the list view
+LIST_LOAD_WORKERS = 16
+
+# Parsed JSON per (path, projection), keyed on (mtime_ns, size) so unchanged
+# files skip the read+parse
+_STATE_CACHE: Dict[tuple, Tuple[int, int, Optional[Dict]]] = {}
+
 
 # ANSI color codes
 class Colors:
@@ -56,6 +78,26 @@ class Colors:
         Colors.RED = ""
         Colors.CYAN = ""
         Colors.GRAY = ""
+        phase_label.cache_clear()
+        marker_label.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def phase_label(phase: str) -> str:
+    """Phase name in its list-view color, built once per phase (cleared by Colors.disable)."""
+    if phase == "COMPLETE":
+        return f"{Colors.GREEN}{phase}{Colors.RESET}"
+    elif phase in ("REVIEWING", "SYNTHESIS", "UAT"):
+        return f"{Colors.YELLOW}{phase}{Colors.RESET}"
+    elif phase == "ERROR":
+        return f"{Colors.RED}{phase}{Colors.RESET}"
+    return phase
+
+
+@lru_cache(maxsize=2)
+def marker_label(is_current: bool) -> str:
+    """Row marker for the current project, built once (cleared by Colors.disable)."""
+    return f"{Colors.CYAN}▶{Colors.RESET} " if is_current else "  "
 
 
 def get_qralph_root() -> Path:
@@ -64,20 +106,64 @@ def get_qralph_root() -> Path:
     return Path(__file__).parent.parent
 
 
+def load_json_cached(path: Path, project: Optional[Callable[[Dict], Dict]] = None) -> Optional[Dict]:
+    """Read JSON with file locking, reusing the last parse while the file is unchanged.
+
+    One stat per call; the file is only re-read when its mtime or size moves.
+    With ``project``, only its result is cached and the full document is
+    dropped right after parsing.
+    Returns None for missing, empty or unreadable files.
+    """
+    key = (str(path), project)
+    try:
+        st = os.stat(path)
+    except OSError:
+        _STATE_CACHE.pop(key, None)
+        return None
+    cached = _STATE_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    result = safe_read_json(path, None) or None
+    if result is not None and project is not None:
+        result = project(result)
+    _STATE_CACHE[key] = (st.st_mtime_ns, st.st_size, result)
+    return result
+
+
 def load_current_project() -> Optional[Dict]:
     """Load current project metadata (with file locking)."""
     qralph_root = get_qralph_root()
-    current_file = qralph_root / "current-project.json"
-    result = safe_read_json(current_file, None)
-    return result if result else None
+    return load_json_cached(qralph_root / "current-project.json")
 
 
 def load_project_state(project_id: str) -> Optional[Dict]:
     """Load project state from checkpoint (with file locking)."""
     qralph_root = get_qralph_root()
+    return load_json_cached(qralph_root / "projects" / project_id / "checkpoints" / "state.json")
+
+
+def summarize_state(state: Dict) -> Dict:
+    """Project a state dict down to the fields the list view shows."""
+    priority_counts = count_findings_by_priority(state.get("findings", []))
+    return {
+        "phase": state.get("phase", "UNKNOWN"),
+        "mode": state.get("mode", "unknown"),
+        "agent_count": len(state.get("agents", [])),
+        "p0": priority_counts["P0"],
+        "p1": priority_counts["P1"],
+        "cost": state.get("circuit_breakers", {}).get("total_cost_usd", 0.0),
+    }
+
+
+def load_project_summary(project_id: str) -> Optional[Dict]:
+    """Load the list-view summary of a project's checkpoint.
+
+    Cached separately from load_project_state, so the list view keeps a
+    handful of scalars per project rather than every findings payload.
+    """
+    qralph_root = get_qralph_root()
     state_file = qralph_root / "projects" / project_id / "checkpoints" / "state.json"
-    result = safe_read_json(state_file, None)
-    return result if result else None
+    return load_json_cached(state_file, summarize_state)
 
 
 def list_all_projects() -> List[str]:
@@ -85,16 +171,24 @@ def list_all_projects() -> List[str]:
     qralph_root = get_qralph_root()
     projects_dir = qralph_root / "projects"
 
-    if not projects_dir.exists():
+    # scandir's is_dir() uses the readdir entry type instead of a stat per entry
+    try:
+        with os.scandir(projects_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    return [d.name for d in projects_dir.iterdir() if d.is_dir()]
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp once; watch mode re-renders the same created_at every tick."""
+    return datetime.fromisoformat(value)
 
 
 def format_duration(start_time: str) -> str:
     """Format duration from start time to now"""
     try:
-        start = datetime.fromisoformat(start_time)
+        start = _parse_iso(start_time)
         now = datetime.now()
         delta = now - start
 
@@ -159,67 +253,93 @@ def get_agent_status_icon(agent: Dict) -> str:
         return f"{Colors.GRAY}○{Colors.RESET}"
 
 
-def display_list_view():
-    """Display list of all projects"""
+def render_list_view() -> str:
+    """Render the list of all projects as one frame of text"""
+    buf = io.StringIO()
     projects = list_all_projects()
     current = load_current_project()
     current_id = current.get("project_id") if current else None
 
-    print(f"{Colors.BOLD}QRALPH Projects Status{Colors.RESET}")
-    print("=" * 80)
+    print(f"{Colors.BOLD}QRALPH Projects Status{Colors.RESET}", file=buf)
+    print("=" * 80, file=buf)
 
     if not projects:
-        print("No projects found.")
-        return
+        print("No projects found.", file=buf)
+        return buf.getvalue()
 
     # Header
-    print(f"{'ID':<25} | {'Phase':<12} | {'Mode':<10} | {'Agents':<7} | {'P0':<4} | {'P1':<4} | {'Cost':<8}")
-    print("-" * 80)
+    print(f"{'ID':<25} | {'Phase':<12} | {'Mode':<10} | {'Agents':<7} | {'P0':<4} | {'P1':<4} | {'Cost':<8}", file=buf)
+    print("-" * 80, file=buf)
 
-    for project_id in sorted(projects):
-        state = load_project_state(project_id)
+    # Loads are independent and I/O-bound, so overlap them; rendering stays serial
+    project_ids = sorted(projects)
+    with ThreadPoolExecutor(max_workers=min(LIST_LOAD_WORKERS, len(project_ids))) as pool:
+        summaries = dict(zip(project_ids, pool.map(load_project_summary, project_ids)))
 
-        if not state:
+    for project_id, summary in summaries.items():
+        if not summary:
             # Minimal display for projects without state
-            marker = f"{Colors.CYAN}▶{Colors.RESET} " if project_id == current_id else "  "
-            print(f"{marker}{project_id:<23} | {'NO STATE':<12} | {'-':<10} | {'-':<7} | {'-':<4} | {'-':<4} | {'-':<8}")
+            marker = marker_label(project_id == current_id)
+            print(f"{marker}{project_id:<23} | {'NO STATE':<12} | {'-':<10} | {'-':<7} | {'-':<4} | {'-':<4} | {'-':<8}", file=buf)
             continue
 
-        phase = state.get("phase", "UNKNOWN")
-        mode = state.get("mode", "unknown")
-        agents = state.get("agents", [])
-        findings = state.get("findings", [])
-        circuit_breakers = state.get("circuit_breakers", {})
-
-        priority_counts = count_findings_by_priority(findings)
-        cost = circuit_breakers.get("total_cost_usd", 0.0)
-
-        # Color code phase
-        if phase == "COMPLETE":
-            phase_str = f"{Colors.GREEN}{phase}{Colors.RESET}"
-        elif phase in ["REVIEWING", "SYNTHESIS", "UAT"]:
-            phase_str = f"{Colors.YELLOW}{phase}{Colors.RESET}"
-        elif phase == "ERROR":
-            phase_str = f"{Colors.RED}{phase}{Colors.RESET}"
-        else:
-            phase_str = phase
+        phase = summary["phase"]
+        mode = summary["mode"]
+        cost = summary["cost"]
 
-        marker = f"{Colors.CYAN}▶{Colors.RESET} " if project_id == current_id else "  "
+        phase_str = phase_label(str(phase))
+        marker = marker_label(project_id == current_id)
 
-        print(f"{marker}{project_id:<23} | {phase_str:<20} | {mode:<10} | {len(agents):<7} | {priority_counts['P0']:<4} | {priority_counts['P1']:<4} | ${cost:<7.2f}")
+        print(f"{marker}{project_id:<23} | {phase_str:<20} | {mode:<10} | {summary['agent_count']:<7} | {summary['p0']:<4} | {summary['p1']:<4} | ${cost:<7.2f}", file=buf)
 
-    print()
+    print(file=buf)
     if current_id:
-        print(f"{Colors.CYAN}▶{Colors.RESET} = Current project")
+        print(f"{Colors.CYAN}▶{Colors.RESET} = Current project", file=buf)
+    return buf.getvalue()
 
 
-def display_detailed_view(project_id: str):
-    """Display detailed status for a single project"""
+def write_frame(text: str):
+    """Write a rendered frame with a single write and flush."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def diff_frame(previous: Optional[List[str]], lines: List[str], size: os.terminal_size) -> str:
+    """Terminal output that turns the previous frame's lines into ``lines``.
+
+    Only rows whose text changed are rewritten (cursor to row, text, clear to
+    end of line), so an unchanged dashboard costs a few bytes per refresh.
+    Falls back to a full clear-and-redraw for the first frame, or whenever a
+    line could wrap or the frame could scroll, since row positions would no
+    longer match line numbers. Leaves the cursor on the row after the frame.
+    """
+    if (previous is None or len(lines) >= size.lines
+            or any(len(ANSI_SGR_RE.sub("", line)) >= size.columns for line in lines)):
+        return CLEAR_SCREEN + "\n".join(lines) + "\n"
+
+    out = []
+    for row, line in enumerate(lines, start=1):
+        if row > len(previous) or previous[row - 1] != line:
+            out.append(f"\033[{row};1H{line}\033[K")
+    if len(lines) < len(previous):
+        out.append(f"\033[{len(lines) + 1};1H\033[J")
+    out.append(f"\033[{len(lines) + 1};1H")
+    return "".join(out)
+
+
+def display_list_view():
+    """Display list of all projects"""
+    write_frame(render_list_view())
+
+
+def render_detailed_view(project_id: str) -> str:
+    """Render detailed status for a single project as one frame of text"""
+    buf = io.StringIO()
     state = load_project_state(project_id)
 
     if not state:
-        print(f"{Colors.RED}Error:{Colors.RESET} No state found for project {project_id}")
-        return
+        print(f"{Colors.RED}Error:{Colors.RESET} No state found for project {project_id}", file=buf)
+        return buf.getvalue()
 
     phase = state.get("phase", "UNKNOWN")
     mode = state.get("mode", "unknown")
@@ -235,8 +355,8 @@ def display_detailed_view(project_id: str):
     error_counts = circuit_breakers.get("error_counts", {})
 
     # Header
-    print(f"{Colors.BOLD}QRALPH Status: {project_id}{Colors.RESET}")
-    print("=" * 80)
+    print(f"{Colors.BOLD}QRALPH Status: {project_id}{Colors.RESET}", file=buf)
+    print("=" * 80, file=buf)
 
     # Phase and progress
     current_phase, total_phases = get_phase_progress(phase)
@@ -249,24 +369,24 @@ def display_detailed_view(project_id: str):
     else:
         phase_str = f"{phase} ({current_phase}/{total_phases})"
 
-    print(f"Phase: {phase_str}")
-    print(f"Mode: {mode}")
-    print(f"Request: {request}")
-    print(f"Started: {created_at}")
-    print(f"Elapsed: {format_duration(created_at)}")
-    print()
+    print(f"Phase: {phase_str}", file=buf)
+    print(f"Mode: {mode}", file=buf)
+    print(f"Request: {request}", file=buf)
+    print(f"Started: {created_at}", file=buf)
+    print(f"Elapsed: {format_duration(created_at)}", file=buf)
+    print(file=buf)
 
     # Circuit Breakers
-    print(f"{Colors.BOLD}Circuit Breakers:{Colors.RESET}")
-    print(f"  Tokens: {tokens:,} / 500,000 ({format_percentage(tokens, 500000)})")
-    print(f"  Cost: ${cost:.2f} / $40.00 ({format_percentage(cost, 40.0)})")
-    print(f"  Errors: {len(error_counts)} unique")
-    print(f"  Heals: {heal_attempts} / 5")
-    print()
+    print(f"{Colors.BOLD}Circuit Breakers:{Colors.RESET}", file=buf)
+    print(f"  Tokens: {tokens:,} / 500,000 ({format_percentage(tokens, 500000)})", file=buf)
+    print(f"  Cost: ${cost:.2f} / $40.00 ({format_percentage(cost, 40.0)})", file=buf)
+    print(f"  Errors: {len(error_counts)} unique", file=buf)
+    print(f"  Heals: {heal_attempts} / 5", file=buf)
+    print(file=buf)
 
     # Agents
     if agents:
-        print(f"{Colors.BOLD}Agents:{Colors.RESET}")
+        print(f"{Colors.BOLD}Agents:{Colors.RESET}", file=buf)
         agent_line = []
         for agent in agents:
             if isinstance(agent, dict):
@@ -276,38 +396,65 @@ def display_detailed_view(project_id: str):
                 name = str(agent)
                 icon = get_agent_status_icon({})
             agent_line.append(f"[{icon}] {name}")
-        print("  " + "  ".join(agent_line))
-        print()
+        print("  " + "  ".join(agent_line), file=buf)
+        print(file=buf)
 
     # Findings
     priority_counts = count_findings_by_priority(findings)
-    print(f"{Colors.BOLD}Findings:{Colors.RESET} ", end="")
-    print(f"{Colors.RED}{priority_counts['P0']} P0{Colors.RESET}, ", end="")
-    print(f"{Colors.YELLOW}{priority_counts['P1']} P1{Colors.RESET}, ", end="")
-    print(f"{priority_counts['P2']} P2")
-    print()
+    print(f"{Colors.BOLD}Findings:{Colors.RESET} ", end="", file=buf)
+    print(f"{Colors.RED}{priority_counts['P0']} P0{Colors.RESET}, ", end="", file=buf)
+    print(f"{Colors.YELLOW}{priority_counts['P1']} P1{Colors.RESET}, ", end="", file=buf)
+    print(f"{priority_counts['P2']} P2", file=buf)
+    print(file=buf)
 
     # Errors (if any)
     if error_counts:
-        print(f"{Colors.BOLD}Recent Errors:{Colors.RESET}")
+        print(f"{Colors.BOLD}Recent Errors:{Colors.RESET}", file=buf)
         for error_msg, count in list(error_counts.items())[:3]:
-            print(f"  [{count}x] {error_msg[:60]}...")
-        print()
+            print(f"  [{count}x] {error_msg[:60]}...", file=buf)
+        print(file=buf)
 
     # Last activity indicator
     if phase == "COMPLETE":
-        print(f"{Colors.GREEN}Status: Project complete{Colors.RESET}")
+        print(f"{Colors.GREEN}Status: Project complete{Colors.RESET}", file=buf)
     elif phase == "ERROR":
-        print(f"{Colors.RED}Status: Project encountered errors{Colors.RESET}")
+        print(f"{Colors.RED}Status: Project encountered errors{Colors.RESET}", file=buf)
     elif agents and any(isinstance(a, dict) and a.get("status") == "running" for a in agents):
-        print(f"{Colors.YELLOW}Status: Agents running...{Colors.RESET}")
+        print(f"{Colors.YELLOW}Status: Agents running...{Colors.RESET}", file=buf)
     else:
-        print(f"{Colors.GRAY}Status: Waiting for agent outputs...{Colors.RESET}")
+        print(f"{Colors.GRAY}Status: Waiting for agent outputs...{Colors.RESET}", file=buf)
+    return buf.getvalue()
+
+
+def display_detailed_view(project_id: str):
+    """Display detailed status for a single project"""
+    write_frame(render_detailed_view(project_id))
+
 
+def watch_signature(project_id: Optional[str] = None) -> tuple:
+    """Cheap change signature for watch mode: (path, mtime_ns, size) per watched file.
 
-def clear_screen():
-    """Clear terminal screen using ANSI escape sequences (cross-platform, no subprocess)."""
-    print("\033[2J\033[H", end="", flush=True)
+    Covers current-project.json plus the watched project's state.json, or
+    every project's state.json and the projects directory itself (so new
+    projects show up) when no project is given. Costs one stat per file.
+    """
+    qralph_root = get_qralph_root()
+    projects_dir = qralph_root / "projects"
+    paths = [qralph_root / "current-project.json"]
+    if project_id:
+        paths.append(projects_dir / project_id / "checkpoints" / "state.json")
+    else:
+        paths.append(projects_dir)
+        paths.extend(projects_dir / pid / "checkpoints" / "state.json" for pid in sorted(list_all_projects()))
+
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
 
 
 def main():
@@ -332,14 +479,14 @@ Examples:
     parser.add_argument(
         "--watch",
         action="store_true",
-        help="Watch mode: auto-refresh (default 2s, override with --interval)"
+        help="Watch mode: redraw when state changes (detail view also every --interval)"
     )
 
     parser.add_argument(
         "--interval",
         type=float,
         default=float(os.environ.get("QRALPH_STATUS_INTERVAL", "2")),
-        help="Watch refresh interval in seconds (default: 2, env: QRALPH_STATUS_INTERVAL)"
+        help="Detail view refresh interval in seconds (default: 2, env: QRALPH_STATUS_INTERVAL)"
     )
 
     parser.add_argument(
@@ -355,17 +502,33 @@ Examples:
 
     try:
         if args.watch:
-            # Watch mode
+            # Watch mode: redraw when a watched file changes. The detail view
+            # also redraws every interval to keep its elapsed time current.
+            last_signature = None
+            last_lines = None
+            last_size = None
+            next_refresh = 0.0
             while True:
-                clear_screen()
-
-                if args.project_id:
-                    display_detailed_view(args.project_id)
-                else:
-                    display_list_view()
-
-                print(f"\n{Colors.GRAY}Refreshing every {args.interval}s... (Ctrl+C to exit){Colors.RESET}")
-                time.sleep(args.interval)
+                signature = watch_signature(args.project_id)
+                now = time.monotonic()
+                if signature != last_signature or (args.project_id and now >= next_refresh):
+                    if args.project_id:
+                        frame = render_detailed_view(args.project_id)
+                    else:
+                        frame = render_list_view()
+
+                    footer = f"{Colors.GRAY}Watching for changes... (Ctrl+C to exit){Colors.RESET}"
+                    lines = frame.rstrip("\n").split("\n") + ["", footer]
+                    size = shutil.get_terminal_size()
+                    if size != last_size:
+                        last_lines = None  # resized: row positions are stale
+                    # One write per refresh, touching only the rows that changed
+                    write_frame(diff_frame(last_lines, lines, size))
+                    last_lines = lines
+                    last_size = size
+                    last_signature = signature
+                    next_refresh = now + args.interval
+                time.sleep(min(args.interval, WATCH_POLL_SECONDS))
         else:
             # Single display
             if args.project_id:
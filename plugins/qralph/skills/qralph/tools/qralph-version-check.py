@@ -8,6 +8,7 @@ Compares:
 
 Usage:
   python3 .qralph/tools/qralph-version-check.py check
+  python3 .qralph/tools/qralph-version-check.py check --force  # Ignore the cached result
   python3 .qralph/tools/qralph-version-check.py sync       # Copy cache -> project-local
   python3 .qralph/tools/qralph-version-check.py --json      # Machine-readable output
 """
@@ -16,61 +17,131 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import importlib.util
 import json
 import os
 import re
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Import shared state module
+_state_path = Path(__file__).parent / "qralph-state.py"
+_state_spec = importlib.util.spec_from_file_location("qralph_state", _state_path)
+qralph_state = importlib.util.module_from_spec(_state_spec)
+_state_spec.loader.exec_module(qralph_state)
+
 PLUGIN_CACHE_BASE = Path.home() / ".claude" / "plugins" / "cache" / "sparkry-claude-skills" / "orchestration-workflow"
 PLUGIN_NAME = "orchestration-workflow"
 SKILL_SUBPATH = Path("skills") / "qralph"
+SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+# Matched against SKILL.md bytes, so the file is never decoded
+SKILL_VERSION_RE = re.compile(rb"# QRALPH v(\d+\.\d+\.\d+)")
+# Raised when opening a path that is absent or not a regular file
+_MISSING_FILE_ERRORS = (FileNotFoundError, NotADirectoryError, IsADirectoryError)
+CHECK_CACHE_NAME = ".version-check-cache.json"
+CHECK_CACHE_TTL_SECONDS = 60
 
 
 def find_project_root() -> Path:
-    """Walk up from CWD to find .qralph/ directory."""
-    p = Path.cwd()
-    while p != p.parent:
-        if (p / ".qralph").is_dir():
-            return p
-        p = p.parent
-    return Path.cwd()
+    """Walk up from CWD to find .qralph/ directory; falls back to CWD itself."""
+    return _find_project_root(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _find_project_root(cwd: str) -> Path:
+    """find_project_root() for a given CWD, cached per directory.
 
+    Keyed on CWD so a chdir within the process resolves afresh. Walks plain
+    strings with one stat per level; the filesystem root itself is not
+    checked.
+    """
+    p = cwd
+    parent = os.path.dirname(p)
+    while parent != p:
+        if os.path.isdir(os.path.join(p, ".qralph")):
+            return Path(p)
+        p, parent = parent, os.path.dirname(parent)
+    return Path(cwd)
 
+
+@lru_cache(maxsize=256)
 def parse_semver(v: str) -> tuple:
     """Parse version string into comparable tuple."""
-    m = re.match(r"(\d+)\.(\d+)\.(\d+)", v.strip())
+    m = SEMVER_RE.match(v.strip())
     if not m:
         return (0, 0, 0)
     return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
 
 
+def _file_sha256(path) -> str:
+    """SHA-256 of a file's bytes, hashed straight from the file handle."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, "sha256")
+        else:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sha12(path: Path) -> str:
+    """Short SHA-256 of a file, as shown in check output."""
+    return _file_sha256(path)[:12]
+
+
+def _needs_copy(src, dst) -> bool:
+    """True unless dst already holds src's bytes.
+
+    copy2 preserves mtime, so a previously synced pair matches on size and
+    mtime without reading either file; only same-size files with differing
+    mtimes are hashed. When those hash equal, dst takes src's mtime so the
+    next sync matches without hashing.
+    """
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    src_st = os.stat(src)
+    if src_st.st_size != dst_st.st_size:
+        return True
+    if src_st.st_mtime_ns == dst_st.st_mtime_ns:
+        return False
+    if _file_sha256(src) != _file_sha256(dst):
+        return True
+    try:
+        os.utime(dst, ns=(dst_st.st_atime_ns, src_st.st_mtime_ns))
+    except OSError:
+        pass
+    return False
+
+
 def get_cache_latest() -> dict:
     """Find the latest version in the plugin cache."""
-    if not PLUGIN_CACHE_BASE.is_dir():
+    try:
+        with os.scandir(PLUGIN_CACHE_BASE) as entries:
+            versions = [(parse_semver(e.name), e.name, e.path) for e in entries
+                        if SEMVER_RE.match(e.name) and e.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
         return {"version": None, "path": None, "error": "Plugin cache not found"}
 
-    versions = []
-    for d in PLUGIN_CACHE_BASE.iterdir():
-        if d.is_dir() and re.match(r"\d+\.\d+\.\d+", d.name):
-            versions.append((parse_semver(d.name), d.name, d))
-
     if not versions:
         return {"version": None, "path": None, "error": "No versions in cache"}
 
-    versions.sort(reverse=True)
-    best = versions[0]
-    return {"version": best[1], "path": str(best[2]), "error": None}
+    best = max(versions)
+    return {"version": best[1], "path": best[2], "error": None}
 
 
 def get_project_version(project_root: Path) -> dict:
     """Read the project's .qralph/VERSION file."""
     vfile = project_root / ".qralph" / "VERSION"
-    if not vfile.is_file():
+    try:
+        version = vfile.read_text().strip()
+    except _MISSING_FILE_ERRORS:
         return {"version": None, "path": str(vfile), "error": "VERSION file not found"}
-    version = vfile.read_text().strip()
     return {"version": version, "path": str(vfile), "error": None}
 
 
@@ -78,13 +149,15 @@ def get_project_local_skill(project_root: Path) -> dict:
     """Check the project-local SKILL.md copy."""
     skill_dir = project_root / ".claude" / "skills" / "project-orchestration" / "qralph"
     skill_file = skill_dir / "SKILL.md"
-    if not skill_file.is_file():
+    # One read serves both the version header and the hash
+    try:
+        data = skill_file.read_bytes()
+    except _MISSING_FILE_ERRORS:
         return {"exists": False, "path": str(skill_file), "version": None, "hash": None}
 
-    content = skill_file.read_text()
-    m = re.search(r"# QRALPH v(\d+\.\d+\.\d+)", content)
-    version = m.group(1) if m else None
-    h = hashlib.sha256(content.encode()).hexdigest()[:12]
+    m = SKILL_VERSION_RE.search(data)
+    version = m.group(1).decode("ascii") if m else None
+    h = hashlib.sha256(data).hexdigest()[:12]
     return {"exists": True, "path": str(skill_file), "version": version, "hash": h}
 
 
@@ -92,14 +165,65 @@ def get_cache_skill_hash(cache_path: str) -> str | None:
     """Hash the cache SKILL.md for comparison."""
     if not cache_path:
         return None
-    skill_file = Path(cache_path) / SKILL_SUBPATH / "SKILL.md"
-    if not skill_file.is_file():
+    try:
+        return _sha12(os.path.join(cache_path, SKILL_SUBPATH, "SKILL.md"))
+    except _MISSING_FILE_ERRORS:
         return None
-    return hashlib.sha256(skill_file.read_text().encode()).hexdigest()[:12]
 
 
-def check(project_root: Path, as_json: bool = False) -> dict:
-    """Run version check and return status."""
+def _check_inputs_key(project_root: Path, cache_path: str | None) -> list:
+    """Stat fingerprint of every input check() reads.
+
+    A new or removed cache version changes the cache base directory's mtime;
+    sync or a manual edit changes the file entries.
+    """
+    paths = [
+        PLUGIN_CACHE_BASE,
+        project_root / ".qralph" / "VERSION",
+        project_root / ".claude" / "skills" / "project-orchestration" / "qralph" / "SKILL.md",
+    ]
+    if cache_path:
+        paths.append(Path(cache_path) / SKILL_SUBPATH / "SKILL.md")
+    return [qralph_state.stat_key(p) for p in paths]
+
+
+def _load_cached_check(project_root: Path) -> dict | None:
+    """Return the last check() result if it is within the TTL and inputs are unchanged."""
+    return qralph_state.load_ttl_cache(
+        project_root / ".qralph" / CHECK_CACHE_NAME, CHECK_CACHE_TTL_SECONDS,
+        lambda result: _check_inputs_key(project_root, result.get("cache_path")))
+
+
+def _save_cached_check(project_root: Path, result: dict) -> None:
+    """Persist a check() result; best effort, and only inside an existing .qralph/."""
+    qralph_dir = project_root / ".qralph"
+    if qralph_dir.is_dir():
+        qralph_state.save_ttl_cache(qralph_dir / CHECK_CACHE_NAME, result,
+                                    _check_inputs_key(project_root, result.get("cache_path")))
+
+
+def check(project_root: Path, as_json: bool = False, force: bool = False) -> dict:
+    """Run version check and return status.
+
+    A result computed within the last CHECK_CACHE_TTL_SECONDS is reused while
+    none of the checked files have changed; force=True always recomputes.
+    """
+    if not force:
+        cached = _load_cached_check(project_root)
+        if cached is not None:
+            return cached
+
+    result = _run_check(project_root)
+    _save_cached_check(project_root, result)
+    return result
+
+
+def _run_check(project_root: Path) -> dict:
+    """Compare cache, project VERSION and project-local SKILL.md.
+
+    The helpers open their files directly instead of stat-ing first, so a
+    full check costs one scandir of the plugin cache plus one open per file.
+    """
     cache = get_cache_latest()
     project_ver = get_project_version(project_root)
     local_skill = get_project_local_skill(project_root)
@@ -165,53 +289,71 @@ def sync(project_root: Path) -> dict:
     version_file = project_root / ".qralph" / "VERSION"
 
     synced = []
+    unchanged = []
+
+    def copy_if_changed(src, dst):
+        if _needs_copy(src, dst):
+            shutil.copy2(src, dst)
+            synced.append(dst)
+        else:
+            unchanged.append(dst)
 
     # Sync SKILL.md
     src = cache_skill_dir / "SKILL.md"
     dst = local_skill_dir / "SKILL.md"
     if src.is_file():
         local_skill_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(src), str(dst))
-        synced.append(str(dst))
+        copy_if_changed(str(src), str(dst))
 
     # Sync tools
     cache_tools = cache_skill_dir / "tools"
     local_tools = project_root / ".qralph" / "tools"
     if cache_tools.is_dir():
         local_tools.mkdir(parents=True, exist_ok=True)
-        for f in cache_tools.iterdir():
-            if f.is_file() and f.suffix == ".py":
-                shutil.copy2(str(f), str(local_tools / f.name))
-                synced.append(str(local_tools / f.name))
+        local_tools_str = os.fspath(local_tools)
+        with os.scandir(cache_tools) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".py"):
+                    copy_if_changed(entry.path, os.path.join(local_tools_str, entry.name))
 
     # Sync templates
     cache_templates = cache_skill_dir / "templates"
     local_templates = project_root / ".qralph" / "templates"
     if cache_templates.is_dir():
         local_templates.mkdir(parents=True, exist_ok=True)
-        for f in cache_templates.iterdir():
-            if f.is_file():
-                shutil.copy2(str(f), str(local_templates / f.name))
-                synced.append(str(local_templates / f.name))
+        local_templates_str = os.fspath(local_templates)
+        with os.scandir(cache_templates) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    copy_if_changed(entry.path, os.path.join(local_templates_str, entry.name))
 
     # Update VERSION
     if cache["version"]:
         version_file.write_text(cache["version"] + "\n")
         synced.append(str(version_file))
 
-    return {"success": True, "version": cache["version"], "synced_files": synced}
+    # The next check must see the synced files
+    try:
+        os.unlink(project_root / ".qralph" / CHECK_CACHE_NAME)
+    except FileNotFoundError:
+        pass
+
+    return {"success": True, "version": cache["version"], "synced_files": synced,
+            "unchanged_files": unchanged}
 
 
 def main():
     parser = argparse.ArgumentParser(description="QRALPH version check")
     parser.add_argument("command", nargs="?", default="check", choices=["check", "sync"])
     parser.add_argument("--json", action="store_true", help="JSON output")
+    parser.add_argument("--force", action="store_true",
+                        help=f"Ignore a check result cached within the last {CHECK_CACHE_TTL_SECONDS}s")
     args = parser.parse_args()
 
     project_root = find_project_root()
 
     if args.command == "check":
-        result = check(project_root, as_json=args.json)
+        result = check(project_root, as_json=args.json, force=args.force)
         if args.json:
             print(json.dumps(result, indent=2))
         else:
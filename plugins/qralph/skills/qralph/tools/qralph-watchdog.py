@@ -6,15 +6,22 @@ QRALPH Watchdog - Health checks, agent monitoring, and phase precondition valida
 
 Commands:
     python3 qralph-watchdog.py check                         # Run all health checks
+    python3 qralph-watchdog.py check --no-cache              # ...ignoring a cached result
     python3 qralph-watchdog.py check-agents                  # Check agent execution status
     python3 qralph-watchdog.py check-state                   # Validate state integrity
     python3 qralph-watchdog.py check-preconditions <phase>   # Pre-transition validation
+    python3 qralph-watchdog.py serve                         # Read commands from stdin, one per line
 """
 
 import argparse
+import contextlib
 import json
 import os
+import re
+import shlex
 import sys
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -27,6 +34,7 @@ qralph_state = importlib.util.module_from_spec(_state_spec)
 _state_spec.loader.exec_module(qralph_state)
 
 safe_read_json = qralph_state.safe_read_json
+_print_json = qralph_state.print_json
 
 # Import shared registry for AGENT_REGISTRY
 _registry_path = Path(__file__).parent / "qralph-registry.py"
@@ -34,6 +42,9 @@ _registry_spec = importlib.util.spec_from_file_location("qralph_registry", _regi
 qralph_registry = importlib.util.module_from_spec(_registry_spec)
 _registry_spec.loader.exec_module(qralph_registry)
 
+# Shared registry data (canonical definitions in qralph-registry.py)
+AGENT_REGISTRY = qralph_registry.AGENT_REGISTRY
+
 # Constants
 PROJECT_ROOT = Path.cwd()
 QRALPH_DIR = PROJECT_ROOT / ".qralph"
@@ -47,10 +58,29 @@ AGENT_TIMEOUTS = {
     "default": int(os.environ.get("QRALPH_TIMEOUT_DEFAULT", "300")),
 }
 
+# `check` results are reused for this long while their inputs are unchanged
+CHECK_CACHE_NAME = ".watchdog-cache.json"
+CHECK_CACHE_TTL_SECONDS = 2.0
+
+# Every string datetime.fromisoformat() accepts starts with a four-digit year;
+# the rest (extended, basic or week date) is left to fromisoformat itself
+ISO_DATE_PREFIX_RE = re.compile(r"\d{4}")
+
 # Agent criticality levels
 CRITICAL_AGENTS = {"security-reviewer", "architecture-advisor", "sde-iii", "pe-reviewer"}
 NON_CRITICAL_AGENTS = {"docs-writer", "code-quality-auditor"}
 
+# Per-agent policy: (empty-output level, empty-output action, escalation action)
+DEFAULT_AGENT_POLICY = ("warning", "skip", "retry_once")
+AGENT_POLICY = {
+    **{name: ("critical", "retry", "retry_then_alert") for name in CRITICAL_AGENTS},
+    **{name: ("warning", "skip", "skip") for name in NON_CRITICAL_AGENTS},
+}
+
+# Phases check_state_integrity accepts
+VALID_PHASES = frozenset({"INIT", "DISCOVERING", "REVIEWING", "EXECUTING", "UAT", "COMPLETE",
+                          "PLANNING", "USER_REVIEW", "ESCALATE", "VALIDATING"})
+
 # Escalation path for stuck agents
 ESCALATION_STEPS = ["timeout", "retry_once", "skip_if_non_critical", "defer", "alert_user"]
 
@@ -65,6 +95,21 @@ PHASE_PRECONDITIONS = {
 }
 
 
+def _is_iso_timestamp(value: Any) -> bool:
+    """True if value parses as an ISO timestamp.
+
+    Values without a leading four-digit year are rejected by a regex match,
+    so only near-miss strings pay for a raised ValueError.
+    """
+    if not isinstance(value, str) or not ISO_DATE_PREFIX_RE.match(value):
+        return False
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
 def _get_project_path(state: dict) -> Optional[Path]:
     """Get project path from state."""
     path_str = state.get("project_path", "")
@@ -74,7 +119,35 @@ def _get_project_path(state: dict) -> Optional[Path]:
     return None
 
 
-def check_agent_health(state: dict, project_path: Path) -> List[Dict[str, Any]]:
+# Default for the optional ``outputs`` argument: scan agent-outputs/ on demand
+_NOT_SCANNED = object()
+
+
+def _scan_outputs(outputs_dir: Path) -> Optional[Dict[str, os.DirEntry]]:
+    """Map agent name -> DirEntry for each .md file in agent-outputs/.
+
+    One scandir pass; entries cache their stat() for callers that need sizes.
+    Returns None when the directory does not exist.
+    """
+    try:
+        with os.scandir(outputs_dir) as entries:
+            return {e.name[:-3]: e for e in entries
+                    if e.name.endswith(".md") and e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _has_outputs(outputs_dir: Path) -> bool:
+    """True if agent-outputs/ holds at least one .md file; stops at the first."""
+    try:
+        with os.scandir(outputs_dir) as entries:
+            return any(e.name.endswith(".md") and e.is_file() for e in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def check_agent_health(state: dict, project_path: Path,
+                       outputs=_NOT_SCANNED) -> List[Dict[str, Any]]:
     """
     Check health of each agent's output.
 
@@ -82,23 +155,64 @@ def check_agent_health(state: dict, project_path: Path) -> List[Dict[str, Any]]:
     - Output file exists
     - Modification time vs timeout
     - File size (empty = failed silently)
+
+    ``outputs`` is a _scan_outputs() result to reuse; agent-outputs/ is
+    scanned here when it is omitted.
+    """
+    return _inspect_agents(state, project_path, outputs)[0]
+
+
+def _output_status(size: Optional[int]) -> str:
+    """Status label for an agent output of the given size (None = no file)."""
+    if size is None:
+        return "pending"
+    return "complete" if size > 100 else ("empty" if size == 0 else "partial")
+
+
+def _inspect_agents(state: dict, project_path: Path,
+                    outputs=_NOT_SCANNED) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    One pass over the agents' outputs, returning (issues, statuses).
+
+    Issues are check_agent_health()'s; statuses are cmd_check_agents()'s
+    per-agent summary. Each output file is stat'd at most once.
     """
     issues = []
+    statuses = []
     agents = state.get("agents", [])
-    outputs_dir = project_path / "agent-outputs"
+    if not agents:
+        return issues, statuses  # No agents dispatched yet, nothing to inspect
+    if outputs is _NOT_SCANNED:
+        outputs = _scan_outputs(project_path / "agent-outputs")
 
-    if not outputs_dir.exists():
+    outputs_missing = outputs is None
+    if outputs_missing:
         issues.append({
             "level": "error",
             "agent": "all",
             "message": "agent-outputs directory missing",
         })
-        return issues
+        outputs = {}
 
+    now = time.time()
     for agent_name in agents:
-        output_file = outputs_dir / f"{agent_name}.md"
+        # The scan answered existence; one stat answers size and age
+        entry = outputs.get(agent_name)
+        try:
+            st = entry.stat() if entry is not None else None
+        except FileNotFoundError:  # removed since the scan
+            st = None
+        file_size = st.st_size if st is not None else None
+        statuses.append({
+            "agent": agent_name,
+            "status": _output_status(file_size),
+            "output_size": file_size or 0,
+            "critical": agent_name in CRITICAL_AGENTS,
+        })
 
-        if not output_file.exists():
+        if st is None:
+            if outputs_missing:
+                continue  # Covered by the directory-level error
             issues.append({
                 "level": "warning",
                 "agent": agent_name,
@@ -107,23 +221,22 @@ def check_agent_health(state: dict, project_path: Path) -> List[Dict[str, Any]]:
             continue
 
         # Check file size
-        file_size = output_file.stat().st_size
         if file_size == 0:
-            criticality = "critical" if agent_name in CRITICAL_AGENTS else "warning"
+            level, action, _ = AGENT_POLICY.get(agent_name, DEFAULT_AGENT_POLICY)
             issues.append({
-                "level": criticality,
+                "level": level,
                 "agent": agent_name,
                 "message": "Output file is empty (agent failed silently)",
-                "action": "retry" if agent_name in CRITICAL_AGENTS else "skip",
+                "action": action,
             })
             continue
 
         # Check modification time
-        mtime = output_file.stat().st_mtime
-        age_seconds = (datetime.now().timestamp() - mtime)
+        mtime = st.st_mtime
+        age_seconds = now - mtime
 
         # Determine timeout based on agent's model tier
-        agent_info = qralph_registry.AGENT_REGISTRY.get(agent_name, {})
+        agent_info = AGENT_REGISTRY.get(agent_name, {})
         model = agent_info.get("model", "default")
         timeout = AGENT_TIMEOUTS.get(model, AGENT_TIMEOUTS["default"])
 
@@ -135,13 +248,16 @@ def check_agent_health(state: dict, project_path: Path) -> List[Dict[str, Any]]:
                 "timeout": timeout,
             })
 
-    return issues
+    return issues, statuses
 
 
-def check_state_integrity(state: dict, project_path: Path) -> List[Dict[str, Any]]:
+def check_state_integrity(state: dict, project_path: Path,
+                          outputs=_NOT_SCANNED) -> List[Dict[str, Any]]:
     """
     Validate state consistency against filesystem.
 
+    ``outputs`` is as for check_agent_health().
+
     Checks:
     - project_path exists
     - project_id matches directory name
@@ -172,9 +288,7 @@ def check_state_integrity(state: dict, project_path: Path) -> List[Dict[str, Any
 
     # Check phase validity
     phase = state.get("phase", "")
-    valid_phases = {"INIT", "DISCOVERING", "REVIEWING", "EXECUTING", "UAT", "COMPLETE",
-                    "PLANNING", "USER_REVIEW", "ESCALATE", "VALIDATING"}
-    if phase and phase not in valid_phases:
+    if phase and phase not in VALID_PHASES:
         issues.append({
             "level": "error",
             "check": "phase",
@@ -183,11 +297,11 @@ def check_state_integrity(state: dict, project_path: Path) -> List[Dict[str, Any
 
     # Check agents match output files
     agents = state.get("agents", [])
-    outputs_dir = project_path / "agent-outputs"
-    if outputs_dir.exists():
-        output_files = {f.stem for f in outputs_dir.glob("*.md")}
+    if outputs is _NOT_SCANNED:
+        outputs = _scan_outputs(project_path / "agent-outputs")
+    if outputs is not None:
         agent_set = set(agents)
-        orphan_outputs = output_files - agent_set
+        orphan_outputs = {name for name in outputs if name not in agent_set}
         if orphan_outputs:
             issues.append({
                 "level": "info",
@@ -213,131 +327,125 @@ def check_state_integrity(state: dict, project_path: Path) -> List[Dict[str, Any
 
     # Check created_at timestamp
     created_at = state.get("created_at", "")
-    if created_at:
-        try:
-            datetime.fromisoformat(created_at)
-        except (ValueError, TypeError):
-            issues.append({
-                "level": "warning",
-                "check": "created_at",
-                "message": f"Invalid ISO timestamp: {created_at}",
-            })
+    if created_at and not _is_iso_timestamp(created_at):
+        issues.append({
+            "level": "warning",
+            "check": "created_at",
+            "message": f"Invalid ISO timestamp: {created_at}",
+        })
 
     return issues
 
 
-def check_phase_preconditions(phase: str, state: dict, project_path: Path) -> List[Dict[str, Any]]:
-    """
-    Check preconditions before a phase transition.
+# Phase precondition predicates: (state, project_path, outputs) -> unmet message or None.
+# ``outputs`` is as for check_agent_health(), possibly _NOT_SCANNED.
 
-    Returns list of unmet preconditions.
-    """
-    issues = []
-    preconditions = PHASE_PRECONDITIONS.get(phase, [])
+def _precond_project_path_exists(state, project_path, outputs):
+    if not project_path.exists():
+        return "Project directory does not exist"
 
-    for precond in preconditions:
-        if precond == "project_path_exists":
-            if not project_path.exists():
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "Project directory does not exist",
-                })
 
-        elif precond == "request_non_empty":
-            request = state.get("request", "")
-            if not request or not request.strip():
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "Request is empty",
-                })
+def _precond_request_non_empty(state, project_path, outputs):
+    request = state.get("request", "")
+    if not request or not request.strip():
+        return "Request is empty"
 
-        elif precond == "discovery_results_exist":
-            discovery_file = project_path / "discovered-plugins.json"
-            if not discovery_file.exists():
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "Discovery results file not found",
-                })
 
-        elif precond == "at_least_one_capability":
-            domains = state.get("domains", [])
-            if not domains:
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "No relevant domains/capabilities detected",
-                })
+def _precond_discovery_results_exist(state, project_path, outputs):
+    if not (project_path / "discovered-plugins.json").exists():
+        return "Discovery results file not found"
 
-        elif precond == "synthesis_exists":
-            if not (project_path / "SYNTHESIS.md").exists():
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "SYNTHESIS.md not found",
-                })
 
-        elif precond == "execution_artifacts_exist":
-            # Check for agent outputs or implementation artifacts
-            outputs_dir = project_path / "agent-outputs"
-            if not outputs_dir.exists() or not list(outputs_dir.glob("*.md")):
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "No execution artifacts found in agent-outputs/",
-                })
+def _precond_at_least_one_capability(state, project_path, outputs):
+    if not state.get("domains", []):
+        return "No relevant domains/capabilities detected"
 
-        elif precond == "uat_exists":
-            if not (project_path / "UAT.md").exists():
-                issues.append({
-                    "precondition": precond,
-                    "met": False,
-                    "message": "UAT.md not found",
-                })
 
-        elif precond == "reviewing_result_exists":
-            result_file = project_path / "phase-outputs" / "REVIEWING-result.json"
-            if not result_file.exists():
-                # Not a hard failure — may be using flat teams (v4.0 compat)
-                pass
-
-        elif precond == "automated_tests_passing":
-            # Check for EXECUTING result with no work_remaining
-            exec_result = project_path / "phase-outputs" / "EXECUTING-result.json"
-            if exec_result.exists():
-                result_data = safe_read_json(exec_result, {})
-                work_remaining = result_data.get("work_remaining")
-                if work_remaining:
-                    issues.append({
-                        "precondition": precond,
-                        "met": False,
-                        "message": f"Work remaining: {work_remaining}",
-                    })
-
-        elif precond == "coe_analysis_exists":
-            # v5.0: Check that COE analyses exist for EXECUTING tasks
-            # This is a soft check -- warn but don't block
-            pe_data = state.get("pe_overlay", {})
-            if pe_data:  # Only check if PE overlay is active
-                coe_dir = project_path / "coe-analyses"
-                tasks = state.get("remediation_tasks", [])
-                fixed_tasks = [t for t in tasks if t.get("status") == "fixed"]
-                if fixed_tasks and not coe_dir.exists():
-                    issues.append({
-                        "precondition": precond,
-                        "met": False,
-                        "message": "Fixed tasks exist but no COE analyses found",
-                    })
-
-        elif precond == "adrs_loaded":
-            # v5.0: Check that ADRs were loaded during INIT->DISCOVERING
-            # This is a soft check -- auto-passes if PE overlay not active
-            pe_data = state.get("pe_overlay", {})
-            if pe_data and "adrs" not in pe_data:
-                # PE overlay is active but ADRs weren't loaded -- warning only
-                pass  # Not a hard failure, ADRs are optional
+def _precond_synthesis_exists(state, project_path, outputs):
+    if not (project_path / "SYNTHESIS.md").exists():
+        return "SYNTHESIS.md not found"
+
+
+def _precond_execution_artifacts_exist(state, project_path, outputs):
+    # Check for agent outputs or implementation artifacts
+    if outputs is _NOT_SCANNED:
+        has_outputs = _has_outputs(project_path / "agent-outputs")
+    else:
+        has_outputs = bool(outputs)
+    if not has_outputs:
+        return "No execution artifacts found in agent-outputs/"
+
+
+def _precond_uat_exists(state, project_path, outputs):
+    if not (project_path / "UAT.md").exists():
+        return "UAT.md not found"
+
+
+def _precond_reviewing_result_exists(state, project_path, outputs):
+    # Not a hard failure — may be using flat teams (v4.0 compat),
+    # so phase-outputs/REVIEWING-result.json is not even stat'd
+    return None
+
+
+def _precond_automated_tests_passing(state, project_path, outputs):
+    # Check for EXECUTING result with no work_remaining; a missing
+    # result file reads as {} and passes
+    exec_result = project_path / "phase-outputs" / "EXECUTING-result.json"
+    work_remaining = safe_read_json(exec_result, {}).get("work_remaining")
+    if work_remaining:
+        return f"Work remaining: {work_remaining}"
+
+
+def _precond_coe_analysis_exists(state, project_path, outputs):
+    # v5.0: Check that COE analyses exist for EXECUTING tasks
+    # This is a soft check -- warn but don't block
+    if not state.get("pe_overlay", {}):
+        return None  # Only check if PE overlay is active
+    tasks = state.get("remediation_tasks", [])
+    if any(t.get("status") == "fixed" for t in tasks) and not (project_path / "coe-analyses").exists():
+        return "Fixed tasks exist but no COE analyses found"
+
+
+def _precond_adrs_loaded(state, project_path, outputs):
+    # v5.0: ADRs are loaded during INIT->DISCOVERING, but they are optional:
+    # an active PE overlay without ADRs is not a hard failure
+    return None
+
+
+PRECOND_CHECKS = {
+    "project_path_exists": _precond_project_path_exists,
+    "request_non_empty": _precond_request_non_empty,
+    "discovery_results_exist": _precond_discovery_results_exist,
+    "at_least_one_capability": _precond_at_least_one_capability,
+    "synthesis_exists": _precond_synthesis_exists,
+    "execution_artifacts_exist": _precond_execution_artifacts_exist,
+    "uat_exists": _precond_uat_exists,
+    "reviewing_result_exists": _precond_reviewing_result_exists,
+    "automated_tests_passing": _precond_automated_tests_passing,
+    "coe_analysis_exists": _precond_coe_analysis_exists,
+    "adrs_loaded": _precond_adrs_loaded,
+}
+
+
+def check_phase_preconditions(phase: str, state: dict, project_path: Path,
+                              outputs=_NOT_SCANNED) -> List[Dict[str, Any]]:
+    """
+    Check preconditions before a phase transition.
+
+    Returns list of unmet preconditions. ``outputs`` is as for
+    check_agent_health(). Each precondition dispatches through
+    PRECOND_CHECKS; unknown names are skipped.
+    """
+    issues = []
+    for precond in PHASE_PRECONDITIONS.get(phase, []):
+        check = PRECOND_CHECKS.get(precond)
+        message = check(state, project_path, outputs) if check else None
+        if message:
+            issues.append({
+                "precondition": precond,
+                "met": False,
+                "message": message,
+            })
 
     return issues
 
@@ -356,13 +464,17 @@ def check_subteam_health(state: dict, project_path: Path) -> List[Dict[str, Any]
         # Check result file path is valid
         result_file = project_path / "phase-outputs" / f"{phase}-result.json"
         if status in ("complete", "failed"):
-            if not result_file.exists():
+            try:
+                result_size = os.stat(result_file).st_size
+            except (FileNotFoundError, NotADirectoryError):
+                result_size = None
+            if result_size is None:
                 issues.append({
                     "level": "warning",
                     "phase": phase,
                     "message": f"Sub-team {phase} marked {status} but result file missing",
                 })
-            elif result_file.stat().st_size == 0:
+            elif result_size == 0:
                 issues.append({
                     "level": "error",
                     "phase": phase,
@@ -390,12 +502,7 @@ def check_subteam_health(state: dict, project_path: Path) -> List[Dict[str, Any]
 
 def get_escalation_action(agent_name: str, issue: dict) -> str:
     """Determine escalation action for a stuck/failed agent."""
-    if agent_name in CRITICAL_AGENTS:
-        return "retry_then_alert"
-    elif agent_name in NON_CRITICAL_AGENTS:
-        return "skip"
-    else:
-        return "retry_once"
+    return AGENT_POLICY.get(agent_name, DEFAULT_AGENT_POLICY)[2]
 
 
 def check_pe_overlay_health(state: dict, project_path: Path) -> List[Dict[str, Any]]:
@@ -440,37 +547,81 @@ def check_pe_overlay_health(state: dict, project_path: Path) -> List[Dict[str, A
     return issues
 
 
-def cmd_check():
-    """Run all health checks."""
+def _check_inputs_key(project_path: Path) -> List[Optional[List[int]]]:
+    """Stat fingerprint of the state file and the project directories cmd_check reads.
+
+    Directory mtimes change when files are added or removed; growth of an
+    existing output file is only picked up once the TTL lapses.
+    """
+    return [qralph_state.stat_key(p) for p in (CURRENT_PROJECT_FILE, project_path,
+                                               project_path / "agent-outputs",
+                                               project_path / "phase-outputs")]
+
+
+def _load_cached_check() -> Optional[dict]:
+    """Return the last cmd_check output if it is within the TTL and inputs are unchanged."""
+    cached = qralph_state.load_ttl_cache(
+        QRALPH_DIR / CHECK_CACHE_NAME, CHECK_CACHE_TTL_SECONDS,
+        lambda value: _check_inputs_key(Path(value["project_path"])))
+    return cached["output"] if cached else None
+
+
+def _save_cached_check(project_path: Path, output: dict) -> None:
+    """Persist a cmd_check output for _load_cached_check(); best effort."""
+    qralph_state.save_ttl_cache(QRALPH_DIR / CHECK_CACHE_NAME,
+                                {"project_path": str(project_path), "output": output},
+                                _check_inputs_key(project_path))
+
+
+def cmd_check(force: bool = False):
+    """Run all health checks.
+
+    Repeat calls within CHECK_CACHE_TTL_SECONDS reuse the previous output
+    while the inputs' stat fingerprint is unchanged; force=True recomputes.
+    """
+    if not force:
+        cached = _load_cached_check()
+        if cached is not None:
+            _print_json(cached)
+            return cached
+
     state = safe_read_json(CURRENT_PROJECT_FILE, {})
     if not state:
-        print(json.dumps({"error": "No active project"}))
+        _print_json({"error": "No active project"})
         return
 
     project_path = _get_project_path(state)
     if not project_path:
-        print(json.dumps({"error": "Project path not found"}))
+        _print_json({"error": "Project path not found"})
         return
 
-    agent_issues = check_agent_health(state, project_path)
-    state_issues = check_state_integrity(state, project_path)
-    subteam_issues = check_subteam_health(state, project_path)
+    # One listing of agent-outputs/ serves every check
+    outputs = _scan_outputs(project_path / "agent-outputs")
+    state_issues = check_state_integrity(state, project_path, outputs)
+    project_gone = any(i["level"] == "critical" and i.get("check") == "project_path"
+                       for i in state_issues)
+    if project_gone:
+        # Nothing on disk left to inspect; the critical issue says why
+        agent_issues, subteam_issues = [], []
+    else:
+        agent_issues = check_agent_health(state, project_path, outputs)
+        subteam_issues = check_subteam_health(state, project_path)
     pe_issues = check_pe_overlay_health(state, project_path)
 
     all_issues = agent_issues + state_issues + subteam_issues + pe_issues
-    critical_count = sum(1 for i in all_issues if i.get("level") == "critical")
-    error_count = sum(1 for i in all_issues if i.get("level") == "error")
+    levels = Counter(i.get("level") for i in all_issues)
 
     output = {
-        "status": "healthy" if not critical_count else "unhealthy",
+        "status": "healthy" if not levels["critical"] else "unhealthy",
         "project_id": state.get("project_id"),
         "phase": state.get("phase"),
-        "critical_issues": critical_count,
-        "error_issues": error_count,
-        "warning_issues": sum(1 for i in all_issues if i.get("level") == "warning"),
+        "critical_issues": levels["critical"],
+        "error_issues": levels["error"],
+        "warning_issues": levels["warning"],
         "issues": all_issues,
     }
-    print(json.dumps(output, indent=2))
+    _save_cached_check(project_path, output)
+    _print_json(output)
     return output
 
 
@@ -478,34 +629,16 @@ def cmd_check_agents():
     """Check agent execution status."""
     state = safe_read_json(CURRENT_PROJECT_FILE, {})
     if not state:
-        print(json.dumps({"error": "No active project"}))
+        _print_json({"error": "No active project"})
         return
 
     project_path = _get_project_path(state)
     if not project_path:
-        print(json.dumps({"error": "Project path not found"}))
+        _print_json({"error": "Project path not found"})
         return
 
-    issues = check_agent_health(state, project_path)
-
-    # Build agent status summary
     agents = state.get("agents", [])
-    outputs_dir = project_path / "agent-outputs"
-    agent_statuses = []
-    for agent in agents:
-        output_file = outputs_dir / f"{agent}.md" if outputs_dir.exists() else None
-        status = "pending"
-        size = 0
-        if output_file and output_file.exists():
-            size = output_file.stat().st_size
-            status = "complete" if size > 100 else ("empty" if size == 0 else "partial")
-
-        agent_statuses.append({
-            "agent": agent,
-            "status": status,
-            "output_size": size,
-            "critical": agent in CRITICAL_AGENTS,
-        })
+    issues, agent_statuses = _inspect_agents(state, project_path)
 
     output = {
         "status": "checked",
@@ -514,7 +647,7 @@ def cmd_check_agents():
         "total_agents": len(agents),
         "complete": sum(1 for a in agent_statuses if a["status"] == "complete"),
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
@@ -522,7 +655,7 @@ def cmd_check_state():
     """Validate state integrity."""
     state = safe_read_json(CURRENT_PROJECT_FILE, {})
     if not state:
-        print(json.dumps({"error": "No active project"}))
+        _print_json({"error": "No active project"})
         return
 
     project_path = _get_project_path(state)
@@ -533,7 +666,7 @@ def cmd_check_state():
             "issues": [{"level": "critical", "check": "project_path",
                         "message": f"Project path does not exist: {state.get('project_path')}"}],
         }
-        print(json.dumps(output, indent=2))
+        _print_json(output)
         return output
 
     issues = check_state_integrity(state, project_path)
@@ -548,7 +681,7 @@ def cmd_check_state():
         "project_id": state.get("project_id"),
         "issues": issues,
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
@@ -556,12 +689,12 @@ def cmd_check_preconditions(phase: str):
     """Check preconditions for a phase transition."""
     state = safe_read_json(CURRENT_PROJECT_FILE, {})
     if not state:
-        print(json.dumps({"error": "No active project"}))
+        _print_json({"error": "No active project"})
         return
 
     project_path = _get_project_path(state)
     if not project_path:
-        print(json.dumps({"error": "Project path not found"}))
+        _print_json({"error": "Project path not found"})
         return
 
     unmet = check_phase_preconditions(phase, state, project_path)
@@ -574,32 +707,85 @@ def cmd_check_preconditions(phase: str):
         "can_proceed": can_proceed,
         "unmet_preconditions": unmet,
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="QRALPH Watchdog")
     subparsers = parser.add_subparsers(dest="command")
 
-    subparsers.add_parser("check", help="Run all health checks")
+    check_parser = subparsers.add_parser("check", help="Run all health checks")
+    check_parser.add_argument("--no-cache", dest="force", action="store_true",
+                              help=f"Ignore a result cached within the last {CHECK_CACHE_TTL_SECONDS:g}s")
     subparsers.add_parser("check-agents", help="Check agent execution status")
     subparsers.add_parser("check-state", help="Validate state integrity")
 
     precond_parser = subparsers.add_parser("check-preconditions", help="Check phase preconditions")
     precond_parser.add_argument("phase", help="Target phase")
 
+    subparsers.add_parser("serve", help="Run commands read one per line from stdin")
+    return parser
+
+
+def _run_command(args: argparse.Namespace) -> bool:
+    """Run one parsed check command; False if args.command is not one."""
+    commands = {
+        "check": lambda: cmd_check(args.force),
+        "check-agents": cmd_check_agents,
+        "check-state": cmd_check_state,
+        "check-preconditions": lambda: cmd_check_preconditions(args.phase),
+    }
+
+    handler = commands.get(args.command)
+    if not handler:
+        return False
+    handler()
+    return True
+
+
+def cmd_serve(parser: argparse.ArgumentParser):
+    """Answer check commands read one per line from stdin, one JSON line each.
+
+    Lets a caller that polls repeatedly keep one watchdog process open instead
+    of paying interpreter startup and module loading per check. Blank lines
+    are ignored; anything that is not a check command, and any command that
+    raises, gets an error reply. argparse output such as --help goes to
+    stderr so stdout stays one JSON line per command.
+    """
+    for line in sys.stdin:
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            argv, error = None, str(e)
+        else:
+            error = f"Unknown command: {line.strip()}"
+        if argv == []:
+            continue
+        handled = False
+        if argv is not None:
+            try:
+                with contextlib.redirect_stdout(sys.stderr):
+                    args = parser.parse_args(argv)
+            except SystemExit:  # argparse already reported the problem on stderr
+                args = None
+            if args is not None:
+                try:
+                    handled = _run_command(args)
+                except Exception as e:
+                    error = str(e)
+        if not handled:
+            _print_json({"error": error})
+        sys.stdout.flush()
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
-    if args.command == "check":
-        cmd_check()
-    elif args.command == "check-agents":
-        cmd_check_agents()
-    elif args.command == "check-state":
-        cmd_check_state()
-    elif args.command == "check-preconditions":
-        cmd_check_preconditions(args.phase)
-    else:
+    if args.command == "serve":
+        cmd_serve(parser)
+    elif not _run_command(args):
         parser.print_help()
 
 
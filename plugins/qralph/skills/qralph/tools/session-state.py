@@ -22,11 +22,15 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Safe project ID pattern: digits, lowercase, hyphens only
 SAFE_PROJECT_ID = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_\-]{0,99}$')
 
+# STATE.md patterns, compiled once at import
+_SESSION_LOG_ROW_RE = re.compile(r'^\| \d+', re.MULTILINE)
+_LAST_UPDATED_RE = re.compile(r'\| Last Updated \| .+ \|')
+
 # Import shared state module
 import importlib.util
 _state_path = Path(__file__).parent / "qralph-state.py"
@@ -37,6 +41,7 @@ _state_spec.loader.exec_module(qralph_state)
 safe_write = qralph_state.safe_write
 safe_write_json = qralph_state.safe_write_json
 safe_read_json = qralph_state.safe_read_json
+_print_json = qralph_state.print_json
 
 # Constants
 PROJECT_ROOT = Path.cwd()
@@ -48,9 +53,70 @@ CURRENT_PROJECT_FILE = QRALPH_DIR / "current-project.json"
 QRALPH_PHASES = [
     "INIT", "DISCOVERING", "REVIEWING", "EXECUTING", "UAT", "COMPLETE",
 ]
+# Phase -> position in QRALPH_PHASES
+_PHASE_INDEX = {phase: i for i, phase in enumerate(QRALPH_PHASES)}
 
 CLAUDE_MD_SECTION_HEADER = "## QRALPH Project State"
 
+# Bound, in characters, on git diff --stat text embedded in STATE.md and output
+MAX_DIFF_STAT_CHARS = 4096
+
+# STATE.md sections start with a "## Title" line
+STATE_MD_SECTION_PREFIX = "## "
+# Sections session-state writes; their header lines also close a stray fence
+STATE_MD_SECTIONS = (
+    "Meta", "Execution Plan", "Current Step Detail",
+    "Uncommitted Work", "Session Log", "Next Session Instructions",
+)
+_KNOWN_SECTION_LINES = frozenset(STATE_MD_SECTION_PREFIX + title for title in STATE_MD_SECTIONS)
+# Searched in STATE.md bytes, so only the found section is decoded
+_NEXT_INSTRUCTIONS_HEADER = b"## Next Session Instructions"
+
+# STATE.md skeleton written by create-state, filled with str.format_map
+_STATE_MD_TEMPLATE = """# QRALPH Project State: {project_id}
+
+## Meta
+
+| Field | Value |
+|-------|-------|
+| Project ID | {project_id} |
+| Request | {request} |
+| Mode | {mode} |
+| Created | {created} |
+| Last Updated | {now} |
+| Status | active |
+
+## Execution Plan
+
+{checklist}
+
+## Current Step Detail
+{recovery_note}
+**Phase**: {phase}
+**Agents**: {agents}
+**Notes**: Initial state created
+
+## Uncommitted Work
+
+_No uncommitted work detected._
+
+## Session Log
+
+| Session | Date | Duration | Phase Start | Phase End | Notes |
+|---------|------|----------|-------------|-----------|-------|
+| 1 | {date} | - | {phase} | {phase} | State created |
+
+## Next Session Instructions
+
+1. Read this STATE.md at session start
+2. Check current phase and continue from where you left off
+3. Review any uncommitted work alerts
+4. Update checklist as phases complete
+
+---
+*Generated by session-state.py at {now}*
+"""
+
 
 def _validate_project_id(project_id: str) -> bool:
     """Validate project_id contains only safe characters."""
@@ -58,13 +124,26 @@ def _validate_project_id(project_id: str) -> bool:
 
 
 def _get_project_path(project_id: str) -> Optional[Path]:
-    """Resolve project path from ID or partial match."""
+    """Resolve project path from ID or partial match.
+
+    One scandir of the projects directory; an exact name wins over a
+    prefix match, and only directories count.
+    """
     if not _validate_project_id(project_id):
         return None
-    if not PROJECTS_DIR.exists():
+    prefix_match = None
+    try:
+        with os.scandir(PROJECTS_DIR) as entries:
+            for entry in entries:
+                if not entry.name.startswith(project_id) or not entry.is_dir():
+                    continue
+                if entry.name == project_id:
+                    return Path(entry.path)
+                if prefix_match is None:
+                    prefix_match = entry.path
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    matches = list(PROJECTS_DIR.glob(f"{project_id}*"))
-    return matches[0] if matches else None
+    return Path(prefix_match) if prefix_match else None
 
 
 def _get_state_md_path(project_path: Path) -> Path:
@@ -72,15 +151,23 @@ def _get_state_md_path(project_path: Path) -> Path:
 
 
 def _get_git_diff_stat() -> str:
-    """Get git diff --stat output for uncommitted work detection."""
+    """Get git diff --stat output for uncommitted work detection.
+
+    Output over MAX_DIFF_STAT_CHARS is cut at a line boundary and marked
+    as truncated.
+    """
     try:
         result = subprocess.run(
             ["git", "diff", "--stat"],
             capture_output=True, text=True, timeout=10
         )
-        return result.stdout.strip()
     except Exception:
         return ""
+    out = result.stdout
+    if len(out) > MAX_DIFF_STAT_CHARS:
+        cut = out.rfind("\n", 0, MAX_DIFF_STAT_CHARS)
+        out = out[:cut if cut != -1 else MAX_DIFF_STAT_CHARS] + "\n... (truncated)"
+    return out.strip()
 
 
 def _get_git_log_oneline(n: int = 5) -> str:
@@ -95,18 +182,63 @@ def _get_git_log_oneline(n: int = 5) -> str:
         return ""
 
 
+def _parse_sections(content: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Split STATE.md into (preamble, [(section title, body), ...]) in one line scan.
+
+    A section starts at a "## Title" line outside ``` fences, so a header-like
+    line in embedded git output cannot split a section. The header of a
+    known section (STATE_MD_SECTIONS) always starts one and ends any open
+    fence, so an unclosed fence cannot swallow the rest of the file. Each
+    body is every line after its header up to the next one. Sections stay
+    in file order, duplicate titles included, so _render_sections()
+    reproduces the input exactly.
+    """
+    preamble = []
+    sections = []
+    body = preamble
+    in_fence = False
+    for line in content.splitlines(keepends=True):
+        if line.startswith("```"):
+            in_fence = not in_fence
+        elif line.rstrip("\r\n") in _KNOWN_SECTION_LINES or (
+                not in_fence and line.startswith(STATE_MD_SECTION_PREFIX)):
+            in_fence = False
+            body = []
+            sections.append((line[len(STATE_MD_SECTION_PREFIX):].strip(), body))
+            continue
+        body.append(line)
+    return "".join(preamble), [(title, "".join(lines)) for title, lines in sections]
+
+
+def _render_sections(preamble: str, sections: List[Tuple[str, str]]) -> str:
+    """Inverse of _parse_sections()."""
+    return "".join([preamble] + [f"{STATE_MD_SECTION_PREFIX}{title}\n{body}"
+                                 for title, body in sections])
+
+
+def _update_section(sections: List[Tuple[str, str]], title: str,
+                    update: Callable[[str], str]) -> None:
+    """Replace the body of the first section named title with update(body).
+
+    Later sections with the same title, and a missing title, are left alone.
+    """
+    for i, (name, body) in enumerate(sections):
+        if name == title:
+            sections[i] = (name, update(body))
+            return
+
+
 def _format_checklist(phases: List[str], current_phase: str) -> str:
-    """Generate markdown checklist from phases."""
-    lines = []
-    phase_reached = False
-    for phase in phases:
-        if phase == current_phase:
-            phase_reached = True
-            lines.append(f"- [ ] **{phase}** (current)")
-        elif not phase_reached:
-            lines.append(f"- [x] {phase}")
-        else:
-            lines.append(f"- [ ] {phase}")
+    """Generate markdown checklist from phases.
+
+    Phases before the current one are checked; an unknown phase checks all.
+    """
+    i = phases.index(current_phase) if current_phase in phases else len(phases)
+    lines = [f"- [x] {phase}" for phase in phases[:i]]
+    if i < len(phases):
+        lines.append(f"- [ ] **{current_phase}** (current)")
+        lines.extend(f"- [ ] {phase}" for phase in phases[i + 1:])
     return "\n".join(lines)
 
 
@@ -121,76 +253,50 @@ def cmd_create_state(project_id: str):
         return _cmd_create_state_locked(project_id)
 
 
-def _cmd_create_state_locked(project_id: str):
-    """Inner create-state logic, called under exclusive lock."""
+def _cmd_create_state_locked(project_id: str, state: Optional[dict] = None,
+                             recovery_note: str = ""):
+    """Inner create-state logic, called under exclusive lock.
+
+    Callers that already hold the loaded current-project state pass it in;
+    it is then updated in place rather than re-read from disk. A
+    recovery_note is rendered under the Current Step Detail header.
+    """
     project_path = _get_project_path(project_id)
     if not project_path:
         print(json.dumps({"error": f"Project not found: {project_id}"}))
         return
 
-    state = qralph_state.load_state(CURRENT_PROJECT_FILE)
+    if state is None:
+        state = qralph_state.load_state(CURRENT_PROJECT_FILE)
     state_md_path = _get_state_md_path(project_path)
 
     # Don't overwrite existing STATE.md (idempotent)
     if state_md_path.exists():
-        print(json.dumps({
+        output = {
             "status": "exists",
             "state_file": str(state_md_path),
             "message": "STATE.md already exists",
-        }))
-        return
+        }
+        print(json.dumps(output))
+        return output
 
     now = datetime.now().isoformat()
     request = state.get("request", "")
-    mode = state.get("mode", "coding")
     current_phase = state.get("phase", "INIT")
     agents = state.get("agents", [])
 
-    checklist = _format_checklist(QRALPH_PHASES, current_phase)
-
-    state_md = f"""# QRALPH Project State: {project_id}
-
-## Meta
-
-| Field | Value |
-|-------|-------|
-| Project ID | {project_id} |
-| Request | {request} |
-| Mode | {mode} |
-| Created | {state.get('created_at', now)} |
-| Last Updated | {now} |
-| Status | active |
-
-## Execution Plan
-
-{checklist}
-
-## Current Step Detail
-
-**Phase**: {current_phase}
-**Agents**: {', '.join(agents) if agents else 'Not yet selected'}
-**Notes**: Initial state created
-
-## Uncommitted Work
-
-_No uncommitted work detected._
-
-## Session Log
-
-| Session | Date | Duration | Phase Start | Phase End | Notes |
-|---------|------|----------|-------------|-----------|-------|
-| 1 | {datetime.now().strftime('%Y-%m-%d')} | - | {current_phase} | {current_phase} | State created |
-
-## Next Session Instructions
-
-1. Read this STATE.md at session start
-2. Check current phase and continue from where you left off
-3. Review any uncommitted work alerts
-4. Update checklist as phases complete
-
----
-*Generated by session-state.py at {now}*
-"""
+    state_md = _STATE_MD_TEMPLATE.format_map({
+        "project_id": project_id,
+        "request": request,
+        "mode": state.get("mode", "coding"),
+        "created": state.get("created_at", now),
+        "now": now,
+        "date": now[:10],
+        "checklist": _format_checklist(QRALPH_PHASES, current_phase),
+        "phase": current_phase,
+        "agents": ", ".join(agents) if agents else "Not yet selected",
+        "recovery_note": recovery_note,
+    })
 
     safe_write(state_md_path, state_md)
 
@@ -201,7 +307,7 @@ _No uncommitted work detected._
         state["title"] = request[:80] if request else project_id
         state["last_session"] = now
         state["total_steps"] = len(QRALPH_PHASES)
-        state["current_step"] = QRALPH_PHASES.index(current_phase) + 1 if current_phase in QRALPH_PHASES else 1
+        state["current_step"] = _PHASE_INDEX.get(current_phase, 0) + 1
         safe_write_json(CURRENT_PROJECT_FILE, state)
 
     output = {
@@ -210,16 +316,18 @@ _No uncommitted work detected._
         "project_id": project_id,
         "phase": current_phase,
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
-def cmd_session_start():
+def cmd_session_start(include_git: bool = True):
     """
     REQ-STATE-004: Output session context on start.
 
     Reads current-project.json then STATE.md, outputs JSON summary
     (<2000 tokens) with next instructions, step progress, uncommitted work alerts.
+    With include_git=False the git diff is skipped and the uncommitted work
+    fields are null.
     """
     state = qralph_state.load_state(CURRENT_PROJECT_FILE)
     if not state:
@@ -244,24 +352,26 @@ def cmd_session_start():
 
     state_md_path = _get_state_md_path(project_path)
 
-    # Check for uncommitted work
-    git_diff = _get_git_diff_stat()
-    uncommitted_alert = bool(git_diff)
+    # Check for uncommitted work, unless the caller opted out of git
+    git_diff = _get_git_diff_stat() if include_git else None
+    uncommitted_alert = bool(git_diff) if include_git else None
 
-    # Parse STATE.md for next instructions
+    # Parse STATE.md for next instructions; a missing file leaves them empty
     next_instructions = ""
-    if state_md_path.exists():
-        try:
-            content = state_md_path.read_text()
-            match = re.search(r'## Next Session Instructions\s*\n(.*?)(?=\n---|\Z)', content, re.DOTALL)
-            if match:
-                next_instructions = match.group(1).strip()
-        except Exception:
-            pass
+    try:
+        content = state_md_path.read_bytes()
+        start = content.find(_NEXT_INSTRUCTIONS_HEADER)
+        if start != -1:
+            start += len(_NEXT_INSTRUCTIONS_HEADER)
+            end = content.find(b"\n---", start)
+            section = content[start:end] if end != -1 else content[start:]
+            next_instructions = section.decode("utf-8", errors="replace").strip()
+    except Exception:
+        pass
 
     phase = state.get("phase", "INIT")
     total_steps = len(QRALPH_PHASES)
-    current_step = QRALPH_PHASES.index(phase) + 1 if phase in QRALPH_PHASES else 0
+    current_step = _PHASE_INDEX.get(phase, -1) + 1
 
     # Check for sub-team recovery (v4.1)
     sub_teams = state.get("sub_teams", {})
@@ -294,7 +404,7 @@ def cmd_session_start():
     if recovery_notice:
         output["recovery_notice"] = recovery_notice
 
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
@@ -320,68 +430,51 @@ def _cmd_session_end_locked(project_id: str):
     state_md_path = _get_state_md_path(project_path)
 
     if not state_md_path.exists():
-        _cmd_create_state_locked(project_id)
+        # Shares this command's state, so its state_file/title updates are kept
+        _cmd_create_state_locked(project_id, state)
 
     now = datetime.now()
     phase = state.get("phase", "INIT")
     git_diff = _get_git_diff_stat()
 
-    # Read current STATE.md
+    # Read current STATE.md and split it into sections once
     try:
         content = state_md_path.read_text()
     except Exception:
         content = ""
+    preamble, sections = _parse_sections(content)
 
     # Update checklist
-    new_checklist = _format_checklist(QRALPH_PHASES, phase)
-    content = re.sub(
-        r'## Execution Plan\s*\n(.*?)(?=\n## )',
-        f"## Execution Plan\n\n{new_checklist}\n\n",
-        content, flags=re.DOTALL
-    )
+    checklist = f"\n{_format_checklist(QRALPH_PHASES, phase)}\n\n"
+    _update_section(sections, "Execution Plan", lambda _: checklist)
 
     # Update current step detail
     agents = state.get("agents", [])
-    step_detail = f"""**Phase**: {phase}
+    step_detail = f"""
+**Phase**: {phase}
 **Agents**: {', '.join(agents) if agents else 'Not yet selected'}
-**Notes**: Session ended at {now.strftime('%H:%M:%S')}"""
+**Notes**: Session ended at {now.strftime('%H:%M:%S')}
 
-    content = re.sub(
-        r'## Current Step Detail\s*\n(.*?)(?=\n## )',
-        f"## Current Step Detail\n\n{step_detail}\n\n",
-        content, flags=re.DOTALL
-    )
+"""
+    _update_section(sections, "Current Step Detail", lambda _: step_detail)
 
     # Update uncommitted work
     if git_diff:
         uncommitted = f"**Warning**: Uncommitted changes detected:\n\n```\n{git_diff}\n```\n"
     else:
         uncommitted = "_No uncommitted work detected._\n"
+    _update_section(sections, "Uncommitted Work", lambda _: f"\n{uncommitted}\n")
 
-    content = re.sub(
-        r'## Uncommitted Work\s*\n(.*?)(?=\n## )',
-        f"## Uncommitted Work\n\n{uncommitted}\n",
-        content, flags=re.DOTALL
-    )
-
-    # Append session log row (count only data rows in Session Log table)
-    log_section = re.search(r'## Session Log\s*\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
-    if log_section:
-        data_rows = re.findall(r'^\| \d+', log_section.group(1), re.MULTILINE)
-        session_count = len(data_rows) + 1
-    else:
-        session_count = 1
-    log_row = f"| {session_count} | {now.strftime('%Y-%m-%d')} | - | {phase} | {phase} | Session end |\n"
-
-    # Insert before the closing --- in the session log
-    content = re.sub(
-        r'(## Session Log.*?)(---)',
-        lambda m: m.group(1) + log_row + "\n" + m.group(2),
-        content, flags=re.DOTALL
-    )
-
-    # Update next session instructions
-    next_phase_idx = QRALPH_PHASES.index(phase) + 1 if phase in QRALPH_PHASES else 0
+    # Append session log row after the last row of the Session Log table
+    def append_log_row(log: str) -> str:
+        session_count = len(_SESSION_LOG_ROW_RE.findall(log)) + 1
+        log_row = f"| {session_count} | {now.strftime('%Y-%m-%d')} | - | {phase} | {phase} | Session end |\n"
+        return log.rstrip("\n") + "\n" + log_row + "\n"
+
+    _update_section(sections, "Session Log", append_log_row)
+
+    # Update next session instructions, keeping the footer after them
+    next_phase_idx = _PHASE_INDEX.get(phase, -1) + 1
     next_phase = QRALPH_PHASES[next_phase_idx] if next_phase_idx < len(QRALPH_PHASES) else "COMPLETE"
 
     next_instructions = f"""1. Read this STATE.md at session start
@@ -394,29 +487,31 @@ def _cmd_session_end_locked(project_id: str):
     if phase == "COMPLETE":
         next_instructions = "Project is complete. Review SUMMARY.md and SYNTHESIS.md."
 
-    content = re.sub(
-        r'## Next Session Instructions\s*\n(.*?)(?=\n---)',
-        f"## Next Session Instructions\n\n{next_instructions}\n\n",
-        content, flags=re.DOTALL
-    )
+    def replace_instructions(body: str) -> str:
+        footer_at = body.find("\n---")
+        footer = body[footer_at:] if footer_at != -1 else ""
+        return f"\n{next_instructions}\n{footer}"
 
-    # Update meta last updated
-    content = re.sub(
-        r'\| Last Updated \| .+ \|',
-        f'| Last Updated | {now.isoformat()} |',
-        content
-    )
+    _update_section(sections, "Next Session Instructions", replace_instructions)
 
-    # Detect completion
+    # Update meta last updated, and detect completion
     is_complete = phase == "COMPLETE"
-    if is_complete:
-        content = content.replace("| Status | active |", "| Status | complete |")
+
+    def update_meta(meta: str) -> str:
+        meta = _LAST_UPDATED_RE.sub(f'| Last Updated | {now.isoformat()} |', meta)
+        if is_complete:
+            meta = meta.replace("| Status | active |", "| Status | complete |")
+        return meta
+
+    _update_section(sections, "Meta", update_meta)
+
+    content = _render_sections(preamble, sections)
 
     safe_write(state_md_path, content)
 
     # Update current-project.json
     state["last_session"] = now.isoformat()
-    state["current_step"] = QRALPH_PHASES.index(phase) + 1 if phase in QRALPH_PHASES else 0
+    state["current_step"] = next_phase_idx  # 1-based step == next phase index
     safe_write_json(CURRENT_PROJECT_FILE, state)
 
     output = {
@@ -427,7 +522,7 @@ def _cmd_session_end_locked(project_id: str):
         "is_complete": is_complete,
         "state_file": str(state_md_path),
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
@@ -452,17 +547,31 @@ def _cmd_recover_locked(project_id: str):
     checkpoint_dir = project_path / "checkpoints"
     state = {}
 
-    if checkpoint_dir.exists():
-        checkpoints = sorted(checkpoint_dir.glob("*.json"))
-        if checkpoints:
-            state = qralph_state.load_state(checkpoints[-1])
-            # Validate checkpoint integrity before using it
-            if state:
-                errors = qralph_state.validate_state(state)
-                if errors:
-                    print(json.dumps({"warning": f"Checkpoint has validation errors: {errors}"}),
-                          file=sys.stderr)
-                    state = {}  # Fall back to minimal reconstruction
+    # Newest checkpoint by mtime: snapshot names ({phase}-{HHMMSS}.json,
+    # state.json) do not sort by age
+    latest = None
+    latest_key = None
+    try:
+        with os.scandir(checkpoint_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                # state.json is written after each snapshot, so it wins a tie
+                key = (entry.stat().st_mtime_ns, entry.name == "state.json")
+                if latest_key is None or key > latest_key:
+                    latest, latest_key = entry.path, key
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    if latest:
+        state = qralph_state.load_state(Path(latest))
+        # Validate checkpoint integrity before using it
+        if state:
+            errors = qralph_state.validate_state(state)
+            if errors:
+                print(json.dumps({"warning": f"Checkpoint has validation errors: {errors}"}),
+                      file=sys.stderr)
+                state = {}  # Fall back to minimal reconstruction
 
     if not state:
         # Minimal reconstruction
@@ -478,11 +587,23 @@ def _cmd_recover_locked(project_id: str):
             "circuit_breakers": {"total_tokens": 0, "total_cost_usd": 0.0, "error_counts": {}},
         }
 
-    # Gather filesystem evidence for phase inference
-    agent_outputs = list((project_path / "agent-outputs").glob("*.md")) if (project_path / "agent-outputs").exists() else []
-    synthesis_exists = (project_path / "SYNTHESIS.md").exists()
-    uat_exists = (project_path / "UAT.md").exists()
-    summary_exists = (project_path / "SUMMARY.md").exists()
+    # Gather filesystem evidence for phase inference: one listing of the
+    # project directory answers every existence check
+    try:
+        with os.scandir(project_path) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        names = set()
+    agent_outputs = []
+    if "agent-outputs" in names:
+        try:
+            with os.scandir(project_path / "agent-outputs") as entries:
+                agent_outputs = [entry.name for entry in entries if entry.name.endswith(".md")]
+        except NotADirectoryError:
+            pass
+    synthesis_exists = "SYNTHESIS.md" in names
+    uat_exists = "UAT.md" in names
+    summary_exists = "SUMMARY.md" in names
 
     # Only infer phase from files when checkpoint phase is NOT terminal.
     # COMPLETE and UAT are terminal/near-terminal - trust the checkpoint.
@@ -520,14 +641,15 @@ def _cmd_recover_locked(project_id: str):
     # Save recovered state
     safe_write_json(CURRENT_PROJECT_FILE, state)
 
-    # Create STATE.md via the normal flow
-    _cmd_create_state_locked(project_id)
+    # Create STATE.md via the normal flow, from the state just recovered,
+    # with the recovery mark rendered in
+    recovery_note = f"\n**RECOVERED**: State reconstructed at {datetime.now().isoformat()}. Some items may be STATUS UNKNOWN.\n"
+    created = _cmd_create_state_locked(project_id, state, recovery_note)
 
-    # Mark recovery in STATE.md
+    # An existing STATE.md was left alone, so mark recovery in it directly
     state_md_path = _get_state_md_path(project_path)
-    if state_md_path.exists():
+    if created and created["status"] == "exists":
         content = state_md_path.read_text()
-        recovery_note = f"\n**RECOVERED**: State reconstructed at {datetime.now().isoformat()}. Some items may be STATUS UNKNOWN.\n"
         content = content.replace("## Current Step Detail\n", f"## Current Step Detail\n{recovery_note}")
         safe_write(state_md_path, content)
 
@@ -543,7 +665,7 @@ def _cmd_recover_locked(project_id: str):
         "recent_git_log": git_log[:500],
         "state_file": str(state_md_path),
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
@@ -598,7 +720,7 @@ State file: `{state_file}`
         "file": str(target),
         "project_id": project_id,
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
     return output
 
 
@@ -609,7 +731,9 @@ def main():
     create = subparsers.add_parser("create-state", help="Create STATE.md")
     create.add_argument("project_id", help="Project ID")
 
-    subparsers.add_parser("session-start", help="Output session context")
+    start = subparsers.add_parser("session-start", help="Output session context")
+    start.add_argument("--no-git", action="store_true",
+                       help="Skip the git diff; uncommitted work is reported as null")
 
     end = subparsers.add_parser("session-end", help="Update STATE.md on end")
     end.add_argument("project_id", help="Project ID")
@@ -625,7 +749,7 @@ def main():
     if args.command == "create-state":
         cmd_create_state(args.project_id)
     elif args.command == "session-start":
-        cmd_session_start()
+        cmd_session_start(include_git=not args.no_git)
     elif args.command == "session-end":
         cmd_session_end(args.project_id)
     elif args.command == "recover":
@@ -76,12 +76,18 @@ nav = _load_codebase_nav()
 # Fixtures: Project Scaffolds
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def make_ts_project(tmp_path):
+# Session-scoped: tests only read the scaffolds, so each one is built once
+# and shared. Passing extra_files builds a fresh, unshared copy.
+
+@pytest.fixture(scope="session")
+def make_ts_project(tmp_path_factory):
     """Create a TypeScript project with tsconfig.json and .ts files."""
+    shared = []
+
     def _make(extra_files=None):
-        root = tmp_path / "ts-project"
-        root.mkdir(exist_ok=True)
+        if shared and not extra_files:
+            return shared[0]
+        root = tmp_path_factory.mktemp("ts-project")
         (root / "tsconfig.json").write_text(json.dumps({
             "compilerOptions": {
                 "baseUrl": ".",
@@ -124,16 +130,21 @@ def make_ts_project(tmp_path):
                 p = root / relpath
                 p.parent.mkdir(parents=True, exist_ok=True)
                 p.write_text(content)
+        else:
+            shared.append(root)
         return root
     return _make
 
 
-@pytest.fixture
-def make_python_project(tmp_path):
+@pytest.fixture(scope="session")
+def make_python_project(tmp_path_factory):
     """Create a Python project with .py files."""
+    shared = []
+
     def _make(extra_files=None):
-        root = tmp_path / "py-project"
-        root.mkdir(exist_ok=True)
+        if shared and not extra_files:
+            return shared[0]
+        root = tmp_path_factory.mktemp("py-project")
         (root / "pyproject.toml").write_text('[tool.pytest.ini_options]\n')
         pkg = root / "myapp"
         pkg.mkdir(exist_ok=True)
@@ -159,19 +170,25 @@ def make_python_project(tmp_path):
                 p = root / relpath
                 p.parent.mkdir(parents=True, exist_ok=True)
                 p.write_text(content)
+        else:
+            shared.append(root)
         return root
     return _make
 
 
-@pytest.fixture
-def make_polyglot_project(tmp_path):
+@pytest.fixture(scope="session")
+def make_polyglot_project(tmp_path_factory):
     """Create a project with multiple languages."""
+    shared = []
+
     def _make():
-        root = tmp_path / "polyglot"
-        root.mkdir(exist_ok=True)
+        if shared:
+            return shared[0]
+        root = tmp_path_factory.mktemp("polyglot")
         (root / "main.py").write_text("def main(): pass\n")
         (root / "app.ts").write_text("export function app() {}\n")
         (root / "lib.go").write_text("package main\nfunc Lib() {}\n")
+        shared.append(root)
         return root
     return _make
 
@@ -342,6 +359,18 @@ class TestTypeScriptFeatures:
         assert len(result) == 1
         assert result[0]["source"] == "reflect-metadata"
 
+    def test_parse_ts_imports_skips_non_import_lines(self, tmp_path):
+        f = tmp_path / "test.ts"
+        f.write_text(
+            'const msg = "from here";\n'
+            'import { a } from "./a";\n'
+            "export const b = 1;\n"
+            '  import type { C } from "./c";\n'
+        )
+        result = nav.parse_ts_imports(f)
+        assert [r["source"] for r in result] == ["./a", "./c"]
+        assert result[1]["specifiers"] == ["C"]
+
     def test_parse_ts_imports_non_ts_file_returns_empty(self, tmp_path):
         f = tmp_path / "data.json"
         f.write_text('{"key": "value"}\n')
@@ -394,6 +423,45 @@ class TestTypeScriptFeatures:
         deps = graph[index_key[0]]
         assert any("greeter" in d for d in deps)
 
+    def test_build_ts_dependency_graph_bulk_matches_per_file(self, make_ts_project, monkeypatch):
+        root = make_ts_project()
+
+        def fake_rg(cmd, **kwargs):
+            # Emit rg --json match events for every line rg's regex would hit
+            events = []
+            for path in cmd[cmd.index("--") + 1:]:
+                for line in Path(path).read_text().splitlines(keepends=True):
+                    if nav._TS_IMPORT_RE.search(line):
+                        events.append(json.dumps({"type": "match", "data": {
+                            "path": {"text": path}, "lines": {"text": line}}}))
+            return mock.Mock(returncode=0 if events else 1, stdout="\n".join(events))
+
+        expected = nav.build_ts_dependency_graph(root)
+        monkeypatch.setattr(nav, "_HAS_RG", True)
+        monkeypatch.setattr(nav.subprocess, "run", fake_rg)
+        assert nav.build_ts_dependency_graph(root) == expected
+        index = root / "src" / "index.ts"
+        bulk = nav._parse_ts_imports_bulk([index])
+        assert bulk == {str(index): nav.parse_ts_imports(index)}
+
+    def test_parse_ts_imports_bulk_falls_back_on_rg_error(self, make_ts_project, monkeypatch):
+        root = make_ts_project()
+        monkeypatch.setattr(nav, "_HAS_RG", True)
+        monkeypatch.setattr(nav.subprocess, "run",
+                            lambda cmd, **kw: mock.Mock(returncode=2, stdout=""))
+        assert nav._parse_ts_imports_bulk([root / "src" / "index.ts"]) is None
+
+    def test_build_ts_dependency_graph_deterministic_across_workers(self, make_ts_project,
+                                                                   monkeypatch):
+        root = make_ts_project()
+        parallel = nav.build_ts_dependency_graph(root)
+        monkeypatch.setattr(nav, "GRAPH_WORKERS", 1)
+        serial = nav.build_ts_dependency_graph(root)
+        assert list(parallel.items()) == list(serial.items())
+
+    def test_build_ts_dependency_graph_no_files(self, tmp_path):
+        assert nav.build_ts_dependency_graph(tmp_path) == {}
+
     def test_build_ts_dependency_graph_respects_file_limit(self, make_ts_project):
         root = make_ts_project()
         # Pass specific entry files to limit scope
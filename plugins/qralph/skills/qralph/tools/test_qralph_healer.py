@@ -306,6 +306,23 @@ def test_catastrophic_rollback_logs_decision(mock_env):
     assert "CATASTROPHIC ROLLBACK" in log
 
 
+def test_cmd_clear_resets_breakers_in_one_save(mock_env, capsys):
+    """cmd_clear zeroes error counts and heal attempts and logs the reset."""
+    project_path, state = _create_project(mock_env)
+    state["heal_attempts"] = 3
+    state["circuit_breakers"]["error_counts"] = {"sig": 2}
+    (mock_env / ".qralph" / "current-project.json").write_text(json.dumps(state))
+
+    result = qralph_healer.cmd_clear()
+
+    assert result["status"] == "cleared"
+    saved = json.loads((mock_env / ".qralph" / "current-project.json").read_text())
+    assert saved["heal_attempts"] == 0
+    assert saved["circuit_breakers"]["error_counts"] == {}
+    assert "_checksum" in saved
+    assert "circuit breaker reset" in (project_path / "decisions.log").read_text()
+
+
 # ============================================================================
 # EXISTING HEALER FUNCTIONS
 # ============================================================================
@@ -1110,6 +1110,64 @@ def test_state_validate_invalid_phase():
     assert any("Unknown phase" in e for e in errors)
 
 
+@pytest.mark.parametrize("created_at", ["yesterday", 1700000000, None, ["2026-01-01"]])
+def test_state_validate_invalid_created_at(created_at):
+    """REQ-QRALPH-013: Non-ISO or non-string created_at is reported, never raised"""
+    errors = qralph_state_mod.validate_state({"project_id": "001-test", "created_at": created_at})
+    assert any("Invalid ISO timestamp in created_at" in e for e in errors)
+
+
+def test_state_validate_valid_created_at_is_accepted():
+    """REQ-QRALPH-013: A valid ISO created_at validates on repeat calls"""
+    for _ in range(2):
+        errors = qralph_state_mod.validate_state({"created_at": "2026-10-18T09:30:00"})
+        assert not any("created_at" in e for e in errors)
+
+
+def test_state_schema_constants_are_read_only():
+    """REQ-QRALPH-013: Shared schema constants cannot be mutated by importing tools"""
+    with pytest.raises(TypeError):
+        qralph_state_mod.REQUIRED_STATE_FIELDS["extra"] = str
+    with pytest.raises(AttributeError):
+        qralph_state_mod.VALID_PHASES.add("BOGUS")
+    assert "EXECUTING" in qralph_state_mod.VALID_PHASES
+    assert isinstance(qralph_state_mod.VALID_SUBTEAM_STATUSES, frozenset)
+
+
+def test_state_load_interns_phase(temp_project_dir):
+    """REQ-QRALPH-013: Loaded phase strings are interned for identity-fast lookups"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test", "phase": "EXECUTING"}, state_file)
+    loaded = qralph_state_mod.load_state(state_file)
+    assert loaded["phase"] is sys.intern("EXECUTING")
+    assert qralph_state_mod.validate_state(loaded) == qralph_state_mod.validate_state(
+        {**loaded, "phase": "".join(["EXEC", "UTING"])})
+
+
+def test_state_consistency_flags_orphan_outputs(tmp_path):
+    """REQ-QRALPH-013: Output files with no matching agent are reported as orphans"""
+    project_path = tmp_path / "001-test"
+    outputs = project_path / "agent-outputs"
+    outputs.mkdir(parents=True)
+    for name in ("sde-iii.md", "rogue-agent.md", "notes.txt"):
+        (outputs / name).write_text("x")
+    state = {"project_id": "001-test", "agents": ["sde-iii"]}
+
+    errors = qralph_state_mod.validate_state_consistency(state, project_path)
+
+    orphan_errors = [e for e in errors if "Orphan output files" in e]
+    assert orphan_errors == ["Orphan output files not in agents list: {'rogue-agent'}"]
+
+
+def test_state_consistency_without_outputs_dir(tmp_path):
+    """REQ-QRALPH-013: A missing agent-outputs directory is not an error"""
+    project_path = tmp_path / "001-test"
+    project_path.mkdir()
+    errors = qralph_state_mod.validate_state_consistency(
+        {"project_id": "001-test", "agents": ["sde-iii"]}, project_path)
+    assert not any("Orphan" in e for e in errors)
+
+
 def test_state_repair_fills_missing_fields():
     """REQ-QRALPH-013: Repair fills all missing required fields"""
     state = {"project_id": "001-test"}
@@ -1129,6 +1187,22 @@ def test_state_repair_preserves_existing():
     assert repaired["heal_attempts"] == 3
 
 
+def test_state_repair_is_copy_on_write():
+    """REQ-QRALPH-013: Complete states pass through; repairs never alias input or defaults"""
+    complete = qralph_state_mod.repair_state({"project_id": "001-test"})
+    assert qralph_state_mod.repair_state(complete) is complete
+
+    partial = {"project_id": "001-test", "circuit_breakers": {"total_tokens": 7}}
+    repaired = qralph_state_mod.repair_state(partial)
+    assert partial == {"project_id": "001-test", "circuit_breakers": {"total_tokens": 7}}
+    assert repaired["circuit_breakers"]["total_tokens"] == 7
+    repaired["circuit_breakers"]["error_counts"]["sig"] = 1
+    repaired["agents"].append("sde-iii")
+    fresh = qralph_state_mod.repair_state({})
+    assert fresh["circuit_breakers"]["error_counts"] == {}
+    assert fresh["agents"] == []
+
+
 def test_state_checksum_roundtrip():
     """REQ-QRALPH-013: Checksum is valid after save/load cycle"""
     state = {"project_id": "001-test", "data": "test"}
@@ -1216,6 +1290,39 @@ def test_state_checksum_changes_with_data():
     assert qralph_state_mod._compute_checksum(state1) != qralph_state_mod._compute_checksum(state2)
 
 
+def test_state_checksum_reuses_hash_for_unchanged_state():
+    """REQ-QRALPH-013: Re-checksumming identical content skips the hash; changes still rehash"""
+    state = {"project_id": "001-test", "findings": {"P0": []}}
+    checksum = qralph_state_mod._compute_checksum(state)
+    with patch.object(qralph_state_mod, "_SHA256_TEMPLATE") as mock_template:
+        assert qralph_state_mod._compute_checksum(dict(state, _checksum=checksum)) == checksum
+        mock_template.copy.assert_not_called()
+    state["findings"]["P0"].append("new finding")
+    assert qralph_state_mod._compute_checksum(state) != checksum
+
+
+def test_state_import_defers_hashlib_and_tempfile():
+    """REQ-QRALPH-013: Importing qralph-state loads neither hashlib nor tempfile"""
+    import subprocess
+    code = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location('qs', {str(state_path)!r})\n"
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+        "print(sorted(m for m in ('hashlib', 'tempfile') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_state_checksum_matches_plain_sha256():
+    """REQ-QRALPH-013: The reused hasher template yields a standard SHA-256 hex digest"""
+    import hashlib
+    state = {"b": 1, "a": [1, 2]}
+    expected = hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode()).hexdigest()
+    assert qralph_state_mod._compute_checksum(state) == expected
+    assert qralph_state_mod._compute_checksum({"b": 2}) != expected
+
+
 def test_state_safe_write_and_read(temp_project_dir):
     """REQ-QRALPH-013: safe_write creates file atomically"""
     target = temp_project_dir / "test-output.txt"
@@ -1224,6 +1331,57 @@ def test_state_safe_write_and_read(temp_project_dir):
     assert target.read_text() == "hello world"
 
 
+def test_state_safe_write_bytes_and_partial_writes(temp_project_dir):
+    """REQ-QRALPH-013: safe_write accepts bytes and finishes short os.write calls"""
+    target = temp_project_dir / "chunked.txt"
+    real_write = qralph_state_mod.os.write
+    with patch.object(qralph_state_mod.os, "write", side_effect=lambda fd, buf: real_write(fd, buf[:3])):
+        qralph_state_mod.safe_write(target, "héllo wörld — ok")
+    assert target.read_text(encoding="utf-8") == "héllo wörld — ok"
+    qralph_state_mod.safe_write(target, b"\x00raw bytes")
+    assert target.read_bytes() == b"\x00raw bytes"
+
+
+def test_state_safe_write_replaces_symlinked_target(temp_project_dir):
+    """REQ-QRALPH-013: safe_write replaces a symlink target without writing through it"""
+    outside = temp_project_dir / "outside.txt"
+    outside.write_text("untouched")
+    target = temp_project_dir / "link.txt"
+    try:
+        target.symlink_to(outside)
+    except OSError:
+        pytest.skip("Cannot create symlinks on this platform")
+    qralph_state_mod.safe_write(target, "payload")
+    assert not target.is_symlink()
+    assert target.read_text() == "payload"
+    assert outside.read_text() == "untouched"
+
+
+@pytest.mark.parametrize("durability,file_syncs,dir_syncs", [
+    ("none", 0, 0),
+    ("data", 1, 0),
+    ("full", 1, 1),
+])
+def test_state_safe_write_durability_levels(temp_project_dir, durability, file_syncs, dir_syncs):
+    """REQ-QRALPH-013: safe_write flushes file and directory according to durability"""
+    target = temp_project_dir / "durable.txt"
+    with patch.object(qralph_state_mod.os, "fsync") as mock_fsync, \
+         patch.object(qralph_state_mod.os, "fdatasync", create=True) as mock_fdatasync, \
+         patch.object(qralph_state_mod, "_fsync_dir") as mock_dir_sync:
+        qralph_state_mod.safe_write(target, "payload", durability=durability)
+    assert target.read_text() == "payload"
+    assert mock_fsync.call_count + mock_fdatasync.call_count == file_syncs
+    assert mock_dir_sync.call_count == dir_syncs
+
+
+def test_state_safe_write_rejects_unknown_durability(temp_project_dir):
+    """REQ-QRALPH-013: safe_write rejects an unknown durability level before writing"""
+    target = temp_project_dir / "never.txt"
+    with pytest.raises(ValueError, match="Invalid durability"):
+        qralph_state_mod.safe_write(target, "payload", durability="eventual")
+    assert not target.exists()
+
+
 def test_state_safe_write_json_roundtrip(temp_project_dir):
     """REQ-QRALPH-013: safe_write_json preserves data through roundtrip"""
     target = temp_project_dir / "test-data.json"
@@ -1233,6 +1391,20 @@ def test_state_safe_write_json_roundtrip(temp_project_dir):
     assert loaded == data
 
 
+def test_state_safe_write_json_verify_readback(temp_project_dir):
+    """REQ-QRALPH-013: verify_readback passes on a clean write and catches a corrupted one"""
+    target = temp_project_dir / "verified.json"
+    qralph_state_mod.safe_write_json(target, {"a": 1}, verify_readback=True)
+    assert json.loads(target.read_text()) == {"a": 1}
+
+    def corrupting_write(path, content, **kwargs):
+        path.write_text(content[:-1])
+
+    with patch.object(qralph_state_mod, "safe_write", side_effect=corrupting_write):
+        with pytest.raises(OSError, match="Readback mismatch"):
+            qralph_state_mod.safe_write_json(target, {"a": 2}, verify_readback=True)
+
+
 def test_state_safe_read_json_missing_file(temp_project_dir):
     """REQ-QRALPH-013: safe_read_json returns default for missing file"""
     result = qralph_state_mod.safe_read_json(temp_project_dir / "nonexistent.json", {"default": True})
@@ -1247,6 +1419,27 @@ def test_state_safe_read_json_corrupt_file(temp_project_dir):
     assert result == {"fallback": True}
 
 
+def test_state_safe_read_text(temp_project_dir):
+    """REQ-QRALPH-013: safe_read_text returns raw content, or default when missing"""
+    target = temp_project_dir / "raw.json"
+    target.write_text('{"a": 1}\n')
+    assert qralph_state_mod.safe_read_text(target) == '{"a": 1}\n'
+    assert qralph_state_mod.safe_read_text(temp_project_dir / "missing.json", "") == ""
+
+
+def test_state_reads_treat_missing_paths_as_absent(temp_project_dir, capsys):
+    """REQ-QRALPH-013: Missing files and non-directory parents return defaults without warnings"""
+    not_a_dir = temp_project_dir / "plain.txt"
+    not_a_dir.write_text("x")
+    for path in (temp_project_dir / "missing.json", not_a_dir / "state.json"):
+        assert qralph_state_mod.load_state(path) == {}
+        assert qralph_state_mod.safe_read_json(path) == {}
+        assert qralph_state_mod.safe_read_text(path, "") == ""
+        with qralph_state_mod.exclusive_state_lock(temp_project_dir / "state.lock"):
+            assert qralph_state_mod.load_state(path) == {}
+    assert "Warning" not in capsys.readouterr().err
+
+
 def test_state_save_load_roundtrip(temp_project_dir):
     """REQ-QRALPH-013: Full state save/load cycle with checksum"""
     state_file = temp_project_dir / "state.json"
@@ -1258,6 +1451,134 @@ def test_state_save_load_roundtrip(temp_project_dir):
     assert "_checksum" in loaded
 
 
+def test_state_load_skips_shared_lock_under_exclusive_lock(temp_project_dir):
+    """REQ-QRALPH-013: load_state reads without flock when the exclusive lock is held"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test", "phase": "INIT"}, state_file)
+    unlocked = qralph_state_mod.load_state(state_file)
+    with qralph_state_mod.exclusive_state_lock(temp_project_dir / "state.lock"):
+        with patch.object(qralph_state_mod, "_lock_file") as mock_lock:
+            locked = qralph_state_mod.load_state(state_file)
+    mock_lock.assert_not_called()
+    assert locked == unlocked
+
+
+def test_state_transaction_saves_once(temp_project_dir):
+    """REQ-QRALPH-013: state_transaction batches mutations into one write"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test", "heal_attempts": 0}, state_file)
+    with patch.object(qralph_state_mod, "_write_state", wraps=qralph_state_mod._write_state) as spy:
+        with qralph_state_mod.state_transaction(state_file) as state:
+            state["phase"] = "REVIEWING"
+            state["heal_attempts"] += 1
+            state["heal_attempts"] += 1
+    assert spy.call_count == 1
+    loaded = qralph_state_mod.load_state(state_file)
+    assert (loaded["phase"], loaded["heal_attempts"]) == ("REVIEWING", 2)
+    assert loaded["_checksum"] == qralph_state_mod._compute_checksum(loaded)
+
+
+def test_state_transaction_skips_unchanged_and_failed_blocks(temp_project_dir):
+    """REQ-QRALPH-013: state_transaction writes nothing for no-op or raising blocks"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test", "phase": "INIT"}, state_file)
+    with patch.object(qralph_state_mod, "_write_state") as mock_write:
+        with qralph_state_mod.state_transaction(state_file) as state:
+            state["phase"] = "INIT"
+        with pytest.raises(RuntimeError):
+            with qralph_state_mod.state_transaction(state_file) as state:
+                state["phase"] = "REVIEWING"
+                raise RuntimeError("boom")
+        with qralph_state_mod.state_transaction(temp_project_dir / "missing.json") as state:
+            assert state == {}
+    mock_write.assert_not_called()
+    assert qralph_state_mod.load_state(state_file)["phase"] == "INIT"
+
+
+def test_state_transaction_saves_state_built_from_empty(temp_project_dir):
+    """REQ-QRALPH-013: a block that fills in a missing state saves it"""
+    state_file = temp_project_dir / "new.json"
+    with qralph_state_mod.state_transaction(state_file) as state:
+        assert state == {}
+        state["project_id"] = "003-new"
+    assert qralph_state_mod.load_state(state_file)["project_id"] == "003-new"
+
+
+def test_state_transaction_reuses_loaded_checksum(temp_project_dir):
+    """REQ-QRALPH-013: state_transaction compares against the verified on-disk checksum"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test", "phase": "INIT"}, state_file)
+    with patch.object(qralph_state_mod, "_canonical_json",
+                      wraps=qralph_state_mod._canonical_json) as spy:
+        with qralph_state_mod.state_transaction(state_file):
+            pass
+    # load_state verifies the file text as written; only the exit check serializes
+    assert spy.call_count == 1
+
+    legacy_file = temp_project_dir / "legacy.json"
+    legacy_file.write_text(json.dumps({"project_id": "002-legacy", "phase": "INIT"}))
+    with qralph_state_mod.state_transaction(legacy_file):
+        pass
+    loaded = json.loads(legacy_file.read_text())
+    assert loaded["_checksum"] == qralph_state_mod._compute_checksum(loaded)
+
+
+def test_state_transaction_detects_in_place_nested_mutation(temp_project_dir):
+    """REQ-QRALPH-013: Mutating a nested container in place still marks the state dirty"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test",
+                                 "sub_teams": {"REVIEWING": {"status": "running"}}}, state_file)
+    with qralph_state_mod.state_transaction(state_file) as state:
+        state["sub_teams"]["REVIEWING"]["status"] = "complete"
+    loaded = qralph_state_mod.load_state(state_file)
+    assert loaded["sub_teams"]["REVIEWING"]["status"] == "complete"
+    assert loaded["_checksum"] == qralph_state_mod._compute_checksum(loaded)
+
+
+def test_state_save_writes_single_line_json(temp_project_dir):
+    """REQ-QRALPH-013: save_state skips pretty-printing; safe_write_json still indents by default"""
+    state_file = temp_project_dir / "state.json"
+    qralph_state_mod.save_state({"project_id": "001-test", "agents": ["a", "b"]}, state_file)
+    assert "\n" not in state_file.read_text().strip()
+
+    other = temp_project_dir / "team-config.json"
+    qralph_state_mod.safe_write_json(other, {"agents": ["a"]})
+    assert other.read_text() == '{\n  "agents": [\n    "a"\n  ]\n}'
+
+
+def test_state_file_is_checksummed_text_plus_checksum(temp_project_dir):
+    """REQ-QRALPH-013: save_state serializes once; the file body is exactly what was hashed"""
+    import hashlib
+    state_file = temp_project_dir / "state.json"
+    state = {"project_id": "001-test", "agents": ["b", "a"], "phase": "INIT"}
+    with patch.object(qralph_state_mod, "_canonical_json",
+                      wraps=qralph_state_mod._canonical_json) as spy:
+        qralph_state_mod.save_state(state, state_file)
+    assert spy.call_count == 1
+    text = state_file.read_text()
+    body, suffix = text.rsplit(', "_checksum": ', 1)
+    assert suffix == f'"{state["_checksum"]}"}}'
+    assert hashlib.sha256((body + "}").encode()).hexdigest() == state["_checksum"]
+    assert json.loads(text) == state
+
+    qralph_state_mod.save_state({}, state_file)
+    assert json.loads(state_file.read_text()).keys() == {"_checksum"}
+
+
+def test_state_load_verifies_older_layouts_and_detects_edits(temp_project_dir, capsys):
+    """REQ-QRALPH-013: Indented files still verify; edited bodies still fail the checksum"""
+    state_file = temp_project_dir / "state.json"
+    state = {"project_id": "001-test", "phase": "INIT"}
+    state["_checksum"] = qralph_state_mod._compute_checksum(state)
+    state_file.write_text(json.dumps(state, indent=2))
+    assert qralph_state_mod.load_state(state_file) == state
+
+    qralph_state_mod.save_state(dict(state), state_file)
+    state_file.write_text(state_file.read_text().replace('"INIT"', '"UAT"'))
+    qralph_state_mod.load_state(state_file)
+    assert "checksum mismatch" in capsys.readouterr().err
+
+
 # ============================================================================
 # 10. ADDITIONAL PURE FUNCTION TESTS
 # ============================================================================
@@ -1600,6 +1921,93 @@ def test_cmd_status_lists_projects(mock_qralph_env, capsys):
     assert "projects" in captured.out
 
 
+def test_cmd_status_lists_only_numbered_project_dirs(mock_qralph_env, capsys):
+    """REQ-QRALPH-012: cmd_status skips stray entries and tolerates missing state"""
+    qralph_orchestrator.cmd_init("Project 1")
+    projects_dir = mock_qralph_env / ".qralph" / "projects"
+    (projects_dir / "002-no-state").mkdir()
+    (projects_dir / "notes").mkdir()
+    (projects_dir / "003-file.json").write_text("{}")
+    capsys.readouterr()
+
+    qralph_orchestrator.cmd_status()
+    projects = json.loads(capsys.readouterr().out)["projects"]
+
+    assert [p["id"][:3] for p in projects] == ["001", "002"]
+    assert projects[1] == {"id": "002-no-state", "phase": "no state"}
+
+
+def test_cmd_status_without_projects_dir(mock_qralph_env, capsys):
+    """REQ-QRALPH-012: cmd_status returns an empty list before any project exists"""
+    qralph_orchestrator.cmd_status()
+    assert json.loads(capsys.readouterr().out) == {"projects": []}
+
+
+def test_main_dispatches_init_and_status(mock_qralph_env, capsys):
+    """REQ-QRALPH-007: main() routes subcommands to their cmd_* handlers"""
+    with patch.object(sys, 'argv', ["qralph-orchestrator.py", "init", "--request", "Dispatch project",
+                                    "--mode", "planning"]):
+        qralph_orchestrator.main()
+    assert qralph_orchestrator.load_state()["mode"] == "planning"
+
+    capsys.readouterr()
+    with patch.object(sys, 'argv', ["qralph-orchestrator.py", "status"]):
+        qralph_orchestrator.main()
+    projects = json.loads(capsys.readouterr().out)["projects"]
+    assert projects[0]["mode"] == "planning"
+
+
+def test_main_init_requires_request(mock_qralph_env, capsys):
+    """REQ-QRALPH-001: main() rejects init without a request"""
+    with patch.object(sys, 'argv', ["qralph-orchestrator.py", "init"]):
+        with pytest.raises(SystemExit):
+            qralph_orchestrator.main()
+
+
+def test_load_state_with_path(mock_qralph_env, capsys):
+    """REQ-QRALPH-012: load_state_with_path pairs state with its live project dir"""
+    assert qralph_orchestrator.load_state_with_path() == ({}, None)
+
+    result = qralph_orchestrator.cmd_init("Path project")
+    state, project_path = qralph_orchestrator.load_state_with_path()
+    assert state["project_id"] == result["project_id"]
+    assert project_path == Path(result["project_path"])
+
+    # An empty project_path must not resolve to the CWD
+    state["project_path"] = ""
+    qralph_orchestrator.save_state(state)
+    assert qralph_orchestrator.load_state_with_path()[1] is None
+
+
+def test_cmd_subteam_status_without_project(mock_qralph_env, capsys):
+    """REQ-QRALPH-012: subteam-status errors out when no project is active"""
+    result = qralph_orchestrator.cmd_subteam_status("REVIEWING")
+    assert "No active project" in result["error"]
+
+
+def test_write_status_file_renders_template(tmp_path):
+    """REQ-QRALPH-015: STATUS control command renders phase, team, breakers, findings"""
+    state = {
+        "project_id": "001-demo",
+        "phase": "REVIEWING",
+        "mode": "coding",
+        "agents": ["security-reviewer", "architecture-advisor"],
+        "circuit_breakers": {"total_tokens": 12345, "total_cost_usd": 1.5, "error_counts": {"e": 1}},
+        "findings": {"P0": [{}], "P1": [], "P2": [{}, {}]},
+    }
+    qralph_orchestrator.write_status_file(state, tmp_path)
+    content = (tmp_path / "STATUS.md").read_text()
+
+    assert content.startswith("# QRALPH Status: 001-demo\n")
+    assert "- **Phase**: REVIEWING" in content
+    assert "- **Team**: N/A" in content
+    assert "- **Agents**: security-reviewer, architecture-advisor" in content
+    assert "- **Total Tokens**: 12,345 / 500,000" in content
+    assert "- **Total Cost**: $1.50 / $40.00" in content
+    assert "- **Unique Errors**: 1" in content
+    assert "- P0: 1\n- P1: 0\n- P2: 2\n" in content
+
+
 # ============================================================================
 # SECURITY HARDENING TESTS (Phase 1 & Phase 4)
 # ============================================================================
@@ -1685,6 +2093,50 @@ def test_safe_write_sets_permissions(tmp_path):
     assert stat.S_IMODE(mode) == 0o600
 
 
+def test_safe_write_private_mode_without_chmod(tmp_path):
+    """S-8: safe_write files stay 0600 under a permissive umask with no chmod call."""
+    import stat
+    target = tmp_path / "test.txt"
+    old_umask = qralph_state_mod.os.umask(0)
+    try:
+        with patch.object(qralph_state_mod.os, "chmod") as mock_chmod:
+            qralph_state_mod.safe_write(target, "secret data")
+    finally:
+        qralph_state_mod.os.umask(old_umask)
+    mock_chmod.assert_not_called()
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_print_json_compact_when_piped(capsys):
+    """print_json emits one compact line when stdout is not a terminal."""
+    qralph_state_mod.print_json({"status": "ok", "issues": []})
+    assert capsys.readouterr().out == '{"status":"ok","issues":[]}\n'
+
+
+def test_stat_key_fingerprints_path(tmp_path):
+    """stat_key gives (mtime_ns, size) for an existing path and None otherwise."""
+    target = tmp_path / "input.txt"
+    assert qralph_state_mod.stat_key(target) is None
+    target.write_text("abc")
+    st = target.stat()
+    assert qralph_state_mod.stat_key(target) == [st.st_mtime_ns, 3]
+
+
+def test_ttl_cache_round_trip_and_staleness(tmp_path):
+    """load_ttl_cache returns the saved value until the TTL or inputs change."""
+    cache = tmp_path / "cache.json"
+    inputs = ["v1"]
+    assert qralph_state_mod.load_ttl_cache(cache, 60, lambda v: inputs) is None
+
+    qralph_state_mod.save_ttl_cache(cache, {"status": "ok"}, inputs)
+    assert qralph_state_mod.load_ttl_cache(cache, 60, lambda v: inputs) == {"status": "ok"}
+    assert qralph_state_mod.load_ttl_cache(cache, 0, lambda v: inputs) is None
+    assert qralph_state_mod.load_ttl_cache(cache, 60, lambda v: ["v2"]) is None
+
+    cache.write_text("{not json")
+    assert qralph_state_mod.load_ttl_cache(cache, 60, lambda v: inputs) is None
+
+
 def test_exclusive_state_lock_context_manager(tmp_path):
     """R-6: exclusive_state_lock acquires and releases lock."""
     import importlib.util
@@ -1895,6 +2347,44 @@ def test_cmd_resume_nonexistent_project(mock_qralph_env, capsys):
     assert "error" in captured.out.lower()
 
 
+def test_cmd_resume_falls_back_to_newest_checkpoint(mock_qralph_env, capsys):
+    """F-018: without state.json, cmd_resume loads the most recently written checkpoint"""
+    init_result = qralph_orchestrator.cmd_init("Fallback project")
+    project_path = Path(init_result["project_path"])
+    checkpoint_dir = project_path / "checkpoints"
+    state = qralph_orchestrator.load_state()
+    (checkpoint_dir / "state.json").unlink()
+
+    # Alphabetically "uat-..." sorts after "reviewing-...", but reviewing is newer
+    older, newer = checkpoint_dir / "uat-100000.json", checkpoint_dir / "reviewing-090000.json"
+    qralph_state_mod.safe_write_json(older, dict(state, phase="UAT"))
+    qralph_state_mod.safe_write_json(newer, dict(state, phase="REVIEWING"))
+    import os
+    os.utime(older, ns=(1_000_000_000, 1_000_000_000))
+
+    result = qralph_orchestrator.cmd_resume(init_result["project_id"])
+    assert result["status"] == "resumed"
+    assert result["phase"] == "REVIEWING"
+
+
+def test_prune_checkpoints_keeps_newest_and_state_json(tmp_path):
+    """F-018: prune_checkpoints retains the newest N snapshots plus state.json"""
+    import os
+    (tmp_path / "state.json").write_text("{}")
+    os.utime(tmp_path / "state.json", ns=(1, 1))
+    for i in range(5):
+        snap = tmp_path / f"reviewing-00000{i}.json"
+        snap.write_text("{}")
+        os.utime(snap, ns=(i * 1_000_000_000 + 10, i * 1_000_000_000 + 10))
+
+    removed = qralph_orchestrator.prune_checkpoints(tmp_path, keep=2)
+
+    assert sorted(p.name for p in removed) == ["reviewing-000000.json", "reviewing-000001.json",
+                                               "reviewing-000002.json"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["reviewing-000003.json", "reviewing-000004.json",
+                                                         "state.json"]
+
+
 def test_cmd_finalize_rejects_from_wrong_phase(mock_qralph_env, capsys):
     """F-018: cmd_finalize rejects transition from INIT"""
     qralph_orchestrator.cmd_init("Cannot finalize from init")
@@ -2560,6 +3050,22 @@ def test_cmd_status_includes_findings_summary(mock_qralph_env, capsys):
     assert "fix_level" in summary
 
 
+def test_cmd_status_output_is_checkpoint_plus_summary(mock_qralph_env, capsys):
+    """REQ-QRALPH-020: cmd_status echoes the checkpoint unchanged, plus _status_summary."""
+    result, project_path = _setup_synthesized_project(mock_qralph_env, mode="coding")
+    checkpoint_file = project_path / "checkpoints" / "state.json"
+    checkpoint = json.loads(checkpoint_file.read_text())
+
+    for content in (checkpoint_file.read_text(), json.dumps(checkpoint) + "\n\n"):
+        checkpoint_file.write_text(content)
+        capsys.readouterr()
+        qralph_orchestrator.cmd_status(result["project_id"])
+        status_output = json.loads(capsys.readouterr().out)
+        summary = status_output.pop("_status_summary")
+        assert status_output == checkpoint
+        assert summary["fix_level"] == checkpoint.get("fix_level", "p0_p1")
+
+
 def test_repair_state_adds_fix_level_default():
     """REQ-QRALPH-020: repair_state adds fix_level default when missing."""
     repaired = qralph_state_mod.repair_state({"project_id": "test"})
@@ -2631,6 +3137,31 @@ def test_cmd_resume_includes_remediation_progress(mock_qralph_env, capsys):
     assert "REM-002" in progress["blocking_ids"]
 
 
+def test_cmd_resume_remediation_progress_caps_blocking_ids(mock_qralph_env, capsys):
+    """REQ-QRALPH-022: resume lists at most 20 blocking ids but counts them all."""
+    _setup_synthesized_project(mock_qralph_env, mode="coding")
+    state = qralph_orchestrator.load_state()
+    state["phase"] = "EXECUTING"
+    state["fix_level"] = "p0"
+    state["remediation_tasks"] = (
+        [{"id": f"REM-{i:03d}", "priority": "P0", "status": "open"} for i in range(25)]
+        + [{"id": "REM-100", "priority": "P1", "status": "open"},
+           {"id": "REM-101", "priority": "P0", "status": "fixed"}]
+    )
+    qralph_orchestrator.save_state_and_checkpoint(state)
+    _clear_control_md(mock_qralph_env)
+
+    with patch.object(qralph_orchestrator, 'sweep_orphaned_processes', return_value=None):
+        result = qralph_orchestrator.cmd_resume(state["project_id"])
+
+    progress = result["remediation_progress"]
+    assert progress["total"] == 27
+    assert progress["fixed"] == 1
+    assert progress["open_at_fix_level"] == 25
+    assert progress["blocking_ids"] == [f"REM-{i:03d}" for i in range(20)]
+    assert progress["warning"].startswith("25 tasks")
+
+
 # ============================================================================
 # T-005: ANTI-BULK-STAMP TESTS
 # ============================================================================
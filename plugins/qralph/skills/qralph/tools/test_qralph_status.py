@@ -111,6 +111,16 @@ class TestHelpers:
         """Invalid timestamp returns 'unknown'."""
         assert qralph_status.format_duration("not-a-date") == "unknown"
 
+    def test_format_duration_parses_each_timestamp_once(self):
+        """Repeat renders reuse the parsed timestamp; bad inputs still return 'unknown'."""
+        started = (datetime.now() - timedelta(minutes=3)).isoformat()
+        qralph_status._parse_iso.cache_clear()
+        for _ in range(3):
+            assert "m" in qralph_status.format_duration(started)
+        assert qralph_status._parse_iso.cache_info().misses == 1
+        assert qralph_status.format_duration(None) == "unknown"
+        assert qralph_status.format_duration(["2026-01-01"]) == "unknown"
+
     def test_format_percentage(self):
         """Percentage formatting works correctly."""
         assert qralph_status.format_percentage(250000, 500000) == "50%"
@@ -176,6 +186,13 @@ class TestDataLoading:
             projects = qralph_status.list_all_projects()
         assert projects == []
 
+    def test_list_all_projects_skips_files(self, mock_qralph):
+        """Stray files in projects/ are not listed as projects."""
+        (mock_qralph / "projects" / "notes.md").write_text("x")
+        with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph):
+            projects = qralph_status.list_all_projects()
+        assert sorted(projects) == ["001-test-project", "002-complete-project"]
+
     def test_load_current_project(self, mock_qralph):
         """Loads current project metadata."""
         with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph):
@@ -202,6 +219,35 @@ class TestDataLoading:
             state = qralph_status.load_project_state("999-nonexistent")
         assert state is None
 
+    def test_load_project_state_reuses_parse_until_file_changes(self, mock_qralph):
+        """Unchanged state files are served from cache; rewrites are re-read."""
+        state_file = mock_qralph / "projects" / "001-test-project" / "checkpoints" / "state.json"
+        with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph), \
+             patch.object(qralph_status, "safe_read_json", wraps=qralph_status.safe_read_json) as spy:
+            first = qralph_status.load_project_state("001-test-project")
+            assert qralph_status.load_project_state("001-test-project") is first
+            assert spy.call_count == 1
+
+            state = json.loads(state_file.read_text())
+            state["phase"] = "UAT"
+            state_file.write_text(json.dumps(state))
+            assert qralph_status.load_project_state("001-test-project")["phase"] == "UAT"
+            assert spy.call_count == 2
+
+            state_file.unlink()
+            assert qralph_status.load_project_state("001-test-project") is None
+
+    def test_load_project_summary_keeps_only_list_fields(self, mock_qralph):
+        """List-view summary counts findings and drops the full state payload."""
+        state_file = mock_qralph / "projects" / "001-test-project" / "checkpoints" / "state.json"
+        state = json.loads(state_file.read_text())
+        state["findings"] = [{"priority": "P0", "evidence": "x" * 1000}, {"priority": "P1"}, {"priority": "P1"}]
+        state_file.write_text(json.dumps(state))
+        with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph):
+            summary = qralph_status.load_project_summary("001-test-project")
+        assert summary == {"phase": "REVIEWING", "mode": "coding", "agent_count": 2,
+                           "p0": 1, "p1": 2, "cost": 1.50}
+
 
 # ──── Display tests ────
 
@@ -216,6 +262,16 @@ class TestDisplay:
         assert "001-test-project" in output
         assert "002-complete-project" in output
 
+    def test_display_list_view_keeps_sorted_order_with_parallel_loads(self, mock_qralph, capsys):
+        """Rows come out sorted by project ID, including projects with no state."""
+        qralph_status.Colors.disable()
+        (mock_qralph / "projects" / "000-no-state").mkdir()
+        with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph):
+            qralph_status.display_list_view()
+        rows = [line for line in capsys.readouterr().out.splitlines() if line[2:5].isdigit()]
+        assert [row[2:].split()[0] for row in rows] == ["000-no-state", "001-test-project", "002-complete-project"]
+        assert "NO STATE" in rows[0]
+
     def test_display_list_view_empty(self, tmp_path, capsys):
         """List view handles no projects gracefully."""
         qralph_status.Colors.disable()
@@ -264,3 +320,103 @@ class TestColors:
         assert qralph_status.Colors.RESET == ""
         assert qralph_status.Colors.BOLD == ""
         assert qralph_status.Colors.GREEN == ""
+
+    def test_phase_and_marker_labels_follow_disable(self):
+        """Precomputed labels are reused, and Colors.disable() drops the colored ones."""
+        with patch.object(qralph_status.Colors, "GREEN", "<g>"), \
+             patch.object(qralph_status.Colors, "CYAN", "<c>"), \
+             patch.object(qralph_status.Colors, "RESET", "<r>"):
+            qralph_status.phase_label.cache_clear()
+            qralph_status.marker_label.cache_clear()
+            assert qralph_status.phase_label("COMPLETE") == "<g>COMPLETE<r>"
+            assert qralph_status.phase_label("COMPLETE") is qralph_status.phase_label("COMPLETE")
+            assert qralph_status.marker_label(True) == "<c>▶<r> "
+            qralph_status.Colors.disable()
+            assert qralph_status.phase_label("COMPLETE") == "COMPLETE"
+            assert qralph_status.marker_label(True) == "▶ "
+        qralph_status.Colors.disable()
+        assert qralph_status.marker_label(False) == "  "
+
+
+# ──── Watch mode tests ────
+
+
+def _run_watch(mock_qralph, argv, ticks, on_tick=None):
+    """Run main() in watch mode for a fixed number of sleep ticks."""
+    calls = {"n": 0}
+
+    def fake_sleep(_seconds):
+        calls["n"] += 1
+        if on_tick:
+            on_tick(calls["n"])
+        if calls["n"] >= ticks:
+            raise KeyboardInterrupt
+
+    with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph), \
+         patch.object(qralph_status.time, "sleep", side_effect=fake_sleep), \
+         patch.object(sys, "argv", ["qralph-status.py", *argv, "--no-color"]), \
+         pytest.raises(SystemExit):
+        qralph_status.main()
+
+
+class TestWatch:
+    def test_watch_signature_tracks_state_changes(self, mock_qralph):
+        """Signature changes when a state file is rewritten or a project appears."""
+        with patch.object(qralph_status, "get_qralph_root", return_value=mock_qralph):
+            before = qralph_status.watch_signature()
+            assert qralph_status.watch_signature() == before
+            state_file = mock_qralph / "projects" / "001-test-project" / "checkpoints" / "state.json"
+            state_file.write_text(state_file.read_text() + " ")
+            changed = qralph_status.watch_signature()
+            assert changed != before
+            (mock_qralph / "projects" / "003-new").mkdir()
+            assert qralph_status.watch_signature() != changed
+
+    def test_watch_list_view_redraws_only_on_change(self, mock_qralph):
+        """Idle list view is drawn once; a state change triggers one redraw."""
+        state_file = mock_qralph / "projects" / "002-complete-project" / "checkpoints" / "state.json"
+
+        def touch_on_third(tick):
+            if tick == 3:
+                state_file.write_text(state_file.read_text() + "\n")
+
+        with patch.object(qralph_status, "render_list_view", return_value="") as mock_render:
+            _run_watch(mock_qralph, ["--watch"], ticks=6, on_tick=touch_on_third)
+        assert mock_render.call_count == 2
+
+    def test_watch_writes_each_frame_in_one_write(self, mock_qralph):
+        """Clear sequence, body and footer go out as a single stdout write."""
+        with patch.object(qralph_status.sys, "stdout", new_callable=StringIO) as fake_out, \
+             patch.object(fake_out, "write", wraps=fake_out.write) as spy_write:
+            _run_watch(mock_qralph, ["001-test-project", "--watch"], ticks=1)
+        frames = [c.args[0] for c in spy_write.call_args_list if "Watching" in c.args[0]]
+        assert len(frames) == 1
+        assert frames[0].startswith(qralph_status.CLEAR_SCREEN)
+        assert "QRALPH Status: 001-test-project" in frames[0]
+
+    def test_diff_frame_rewrites_only_changed_rows(self):
+        """First frame clears the screen; later frames touch only changed rows."""
+        size = qralph_status.os.terminal_size((80, 24))
+        first = ["Header", "Phase: INIT", "Elapsed: 1s"]
+        full = qralph_status.diff_frame(None, first, size)
+        assert full == qralph_status.CLEAR_SCREEN + "Header\nPhase: INIT\nElapsed: 1s\n"
+
+        assert qralph_status.diff_frame(first, first, size) == "\033[4;1H"
+
+        changed = qralph_status.diff_frame(first, ["Header", "Phase: INIT", "Elapsed: 2s"], size)
+        assert changed == "\033[3;1HElapsed: 2s\033[K\033[4;1H"
+
+        shorter = qralph_status.diff_frame(first, ["Header"], size)
+        assert "\033[2;1H\033[J" in shorter
+        assert "Phase" not in shorter
+
+    def test_diff_frame_full_redraw_when_rows_could_shift(self):
+        """Wrapping lines or frames taller than the terminal force a full redraw."""
+        size = qralph_status.os.terminal_size((20, 5))
+        previous = ["a", "b"]
+        colored = [f"\033[32m{'x' * 15}\033[0m"]
+        assert not qralph_status.diff_frame(previous, colored, size).startswith(qralph_status.CLEAR_SCREEN)
+        wide = ["x" * 20]
+        assert qralph_status.diff_frame(previous, wide, size).startswith(qralph_status.CLEAR_SCREEN)
+        tall = [str(i) for i in range(5)]
+        assert qralph_status.diff_frame(previous, tall, size).startswith(qralph_status.CLEAR_SCREEN)
@@ -646,6 +646,16 @@ class TestWatchdogSubteamHealth:
         assert len(issues) > 0
         assert any("missing" in i["message"].lower() for i in issues)
 
+    def test_subteam_health_empty_result(self, tmp_project):
+        _, project_dir, state = tmp_project
+        state["sub_teams"] = {"REVIEWING": {"status": "failed"}}
+        (project_dir / "phase-outputs").mkdir(exist_ok=True)
+        (project_dir / "phase-outputs" / "REVIEWING-result.json").write_text("")
+
+        issues = qralph_watchdog.check_subteam_health(state, project_dir)
+        assert [i["level"] for i in issues] == ["error"]
+        assert "empty" in issues[0]["message"]
+
     def test_subteam_health_stale_running(self, tmp_project):
         _, project_dir, state = tmp_project
         old_time = (datetime.now() - timedelta(hours=2)).isoformat()
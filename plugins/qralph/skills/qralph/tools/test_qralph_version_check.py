@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for qralph-version-check.py - plugin cache vs project-local version checks.
+
+Covers:
+- Project root discovery
+- Sync copy decisions (size / mtime / content hash)
+- Check result cache (TTL, input invalidation, --force, sync)
+"""
+
+import json
+import os
+import pytest
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import importlib.util
+
+# Load version check
+version_check_path = Path(__file__).parent / "qralph-version-check.py"
+spec = importlib.util.spec_from_file_location("qralph_version_check", version_check_path)
+qralph_version_check = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(qralph_version_check)
+
+
+# ============================================================================
+# PROJECT ROOT DISCOVERY
+# ============================================================================
+
+
+def test_find_project_root_from_nested_dir(tmp_path, monkeypatch):
+    """The nearest ancestor holding .qralph/ is the project root"""
+    (tmp_path / "proj" / ".qralph").mkdir(parents=True)
+    nested = tmp_path / "proj" / "src" / "pkg"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+    assert qralph_version_check.find_project_root() == (tmp_path / "proj").resolve()
+
+
+def test_find_project_root_falls_back_to_cwd(tmp_path, monkeypatch):
+    """Without any .qralph/ ancestor the CWD is returned"""
+    monkeypatch.chdir(tmp_path)
+    assert qralph_version_check.find_project_root() == tmp_path.resolve()
+
+
+def test_find_project_root_follows_cwd_changes(tmp_path, monkeypatch):
+    """A cached root is not reused after the CWD moves to another project"""
+    for name in ("one", "two"):
+        (tmp_path / name / ".qralph").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path / "one")
+    assert qralph_version_check.find_project_root() == (tmp_path / "one").resolve()
+    monkeypatch.chdir(tmp_path / "two")
+    assert qralph_version_check.find_project_root() == (tmp_path / "two").resolve()
+
+
+# ============================================================================
+# SYNC COPY DECISIONS
+# ============================================================================
+
+
+def test_needs_copy_missing_destination(tmp_path):
+    """A destination that does not exist needs a copy"""
+    src = tmp_path / "src.py"
+    src.write_text("print('hi')\n")
+    assert qralph_version_check._needs_copy(str(src), str(tmp_path / "dst.py")) is True
+
+
+def test_needs_copy_same_size_different_content(tmp_path):
+    """Same-size files with different bytes need a copy"""
+    src = tmp_path / "src.py"
+    dst = tmp_path / "dst.py"
+    src.write_text("aaaa\n")
+    dst.write_text("bbbb\n")
+    os.utime(dst, ns=(0, 1_000_000_000))
+    assert qralph_version_check._needs_copy(str(src), str(dst)) is True
+
+
+def test_needs_copy_same_content_different_mtime(tmp_path, monkeypatch):
+    """Identical bytes with a different mtime skip the copy and align the mtime"""
+    src = tmp_path / "src.py"
+    dst = tmp_path / "dst.py"
+    src.write_text("same\n")
+    dst.write_text("same\n")
+    os.utime(dst, ns=(0, 1_000_000_000))
+
+    assert qralph_version_check._needs_copy(str(src), str(dst)) is False
+    assert os.stat(dst).st_mtime_ns == os.stat(src).st_mtime_ns
+
+    # The next sync decides on size and mtime alone, without hashing
+    def fail_hash(path):
+        raise AssertionError("hashed an mtime-aligned pair")
+
+    monkeypatch.setattr(qralph_version_check, "_file_sha256", fail_hash)
+    assert qralph_version_check._needs_copy(str(src), str(dst)) is False
+
+
+def test_needs_copy_synced_pair_not_hashed(tmp_path, monkeypatch):
+    """A pair copied with copy2 matches on size and mtime"""
+    src = tmp_path / "src.py"
+    src.write_text("synced\n")
+    dst = tmp_path / "dst.py"
+    shutil.copy2(src, dst)
+    monkeypatch.setattr(qralph_version_check, "_file_sha256",
+                        lambda path: pytest.fail("hashed a copy2 pair"))
+    assert qralph_version_check._needs_copy(str(src), str(dst)) is False
+
+
+# ============================================================================
+# CHECK RESULT CACHE
+# ============================================================================
+
+
+SKILL_MD = "# QRALPH v1.2.3\n\nSkill body.\n"
+
+
+@pytest.fixture
+def plugin_env(tmp_path, monkeypatch):
+    """Plugin cache with v1.2.3 and a project that is current with it."""
+    cache_base = tmp_path / "cache"
+    skill_dir = cache_base / "1.2.3" / "skills" / "qralph"
+    (skill_dir / "tools").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(SKILL_MD)
+    (skill_dir / "tools" / "tool.py").write_text("print('tool')\n")
+    monkeypatch.setattr(qralph_version_check, "PLUGIN_CACHE_BASE", cache_base)
+
+    project_root = tmp_path / "proj"
+    (project_root / ".qralph").mkdir(parents=True)
+    (project_root / ".qralph" / "VERSION").write_text("1.2.3\n")
+    local_skill = project_root / ".claude" / "skills" / "project-orchestration" / "qralph"
+    local_skill.mkdir(parents=True)
+    (local_skill / "SKILL.md").write_text(SKILL_MD)
+    return project_root
+
+
+def _run_check_calls(monkeypatch):
+    """Count _run_check calls while still running the real check."""
+    calls = []
+    real = qralph_version_check._run_check
+
+    def counting(project_root):
+        calls.append(project_root)
+        return real(project_root)
+
+    monkeypatch.setattr(qralph_version_check, "_run_check", counting)
+    return calls
+
+
+def test_check_cache_hit_within_ttl(plugin_env, monkeypatch):
+    """A second check within the TTL reuses the cached result"""
+    calls = _run_check_calls(monkeypatch)
+    first = qralph_version_check.check(plugin_env)
+    second = qralph_version_check.check(plugin_env)
+    assert first["status"] == "current"
+    assert second == first
+    assert len(calls) == 1
+
+
+def test_check_cache_written_atomically(plugin_env):
+    """The cache entry goes through safe_write without a device flush"""
+    with patch.object(qralph_version_check.qralph_state, "safe_write") as mock_write:
+        qralph_version_check.check(plugin_env)
+    path, text = mock_write.call_args.args
+    assert path == plugin_env / ".qralph" / qralph_version_check.CHECK_CACHE_NAME
+    assert mock_write.call_args.kwargs == {"durability": "none"}
+    assert json.loads(text)["value"]["status"] == "current"
+
+
+def test_check_cache_invalidated_by_input_change(plugin_env, monkeypatch):
+    """Editing a checked file forces a fresh result"""
+    calls = _run_check_calls(monkeypatch)
+    assert qralph_version_check.check(plugin_env)["status"] == "current"
+    # A different size, so the change shows even within one mtime tick
+    (plugin_env / ".qralph" / "VERSION").write_text("1.2.0-rc1\n")
+
+    result = qralph_version_check.check(plugin_env)
+    assert result["status"] == "outdated"
+    assert len(calls) == 2
+
+
+def test_check_cache_expires_after_ttl(plugin_env, monkeypatch):
+    """A cached result older than the TTL is recomputed"""
+    calls = _run_check_calls(monkeypatch)
+    qralph_version_check.check(plugin_env)
+    monkeypatch.setattr(qralph_version_check, "CHECK_CACHE_TTL_SECONDS", 0)
+    qralph_version_check.check(plugin_env)
+    assert len(calls) == 2
+
+
+def test_check_force_ignores_cache(plugin_env, monkeypatch):
+    """force=True (--force) recomputes even with a fresh cached result"""
+    calls = _run_check_calls(monkeypatch)
+    qralph_version_check.check(plugin_env)
+    qralph_version_check.check(plugin_env, force=True)
+    assert len(calls) == 2
+
+
+def test_sync_removes_check_cache(plugin_env):
+    """sync deletes the cached check so the next check sees synced files"""
+    qralph_version_check.check(plugin_env)
+    cache_file = plugin_env / ".qralph" / qralph_version_check.CHECK_CACHE_NAME
+    assert cache_file.exists()
+
+    result = qralph_version_check.sync(plugin_env)
+    assert result["success"] is True
+    assert not cache_file.exists()
+    assert (plugin_env / ".qralph" / "tools" / "tool.py").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -139,6 +139,29 @@ def test_agent_health_good_outputs(mock_env):
     assert len(issues) == 0
 
 
+def test_agent_health_stale_small_output(mock_env):
+    """Warns when a small output has not changed within the agent's timeout."""
+    import os
+    project_path, state = _create_project(mock_env, agents=["sde-iii"])
+    output = project_path / "agent-outputs" / "sde-iii.md"
+    output.write_text("partial")
+    old = time.time() - 10_000
+    os.utime(output, (old, old))
+
+    issues = qralph_watchdog.check_agent_health(state, project_path)
+    assert len(issues) == 1
+    assert "stale" in issues[0]["message"]
+
+
+def test_agent_health_no_agents_yet(mock_env):
+    """No issues, not even a missing outputs dir, before agents are selected."""
+    project_path, state = _create_project(mock_env, agents=[])
+    import shutil
+    shutil.rmtree(project_path / "agent-outputs")
+
+    assert qralph_watchdog.check_agent_health(state, project_path) == []
+
+
 # ============================================================================
 # STATE INTEGRITY
 # ============================================================================
@@ -184,6 +207,16 @@ def test_state_integrity_orphan_outputs(mock_env):
     assert any("orphan" in i.get("message", "").lower() for i in issues)
 
 
+def test_state_integrity_ignores_non_markdown_outputs(mock_env):
+    """Only .md files in agent-outputs count as agent outputs."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "agent-outputs" / "notes.txt").write_text("scratch")
+    (project_path / "agent-outputs" / "nested.md").mkdir()
+
+    issues = qralph_watchdog.check_state_integrity(state, project_path)
+    assert not any(i.get("check") == "agent_outputs" for i in issues)
+
+
 def test_state_integrity_negative_tokens(mock_env):
     """Error for negative token count."""
     project_path, state = _create_project(mock_env)
@@ -200,6 +233,24 @@ def test_state_integrity_invalid_timestamp(mock_env):
     assert any("timestamp" in i.get("message", "").lower() for i in issues)
 
 
+@pytest.mark.parametrize("value, valid", [
+    ("2026-02-01T10:30:00", True),
+    ("2026-02-01 10:30:00+00:00", True),
+    ("2026-02-01", True),
+    ("20260201T103000", True),
+    ("2026-W05-1", True),
+    ("2026-13-01T00:00:00", False),
+    ("yesterday", False),
+    (1700000000, False),
+])
+def test_state_integrity_timestamp_formats(mock_env, value, valid):
+    """created_at is accepted exactly when datetime.fromisoformat parses it."""
+    project_path, state = _create_project(mock_env)
+    state["created_at"] = value
+    issues = qralph_watchdog.check_state_integrity(state, project_path)
+    assert any(i.get("check") == "created_at" for i in issues) is not valid
+
+
 # ============================================================================
 # PHASE PRECONDITIONS
 # ============================================================================
@@ -250,6 +301,19 @@ def test_preconditions_executing_ok(mock_env):
     assert len(issues) == 0
 
 
+def test_preconditions_validating_work_remaining(mock_env):
+    """VALIDATING blocked only when the EXECUTING result lists remaining work."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "agent-outputs" / "sde-iii.md").write_text("done")
+    assert qralph_watchdog.check_phase_preconditions("VALIDATING", state, project_path) == []
+
+    (project_path / "phase-outputs").mkdir()
+    (project_path / "phase-outputs" / "EXECUTING-result.json").write_text(
+        json.dumps({"work_remaining": ["fix flaky test"]}))
+    issues = qralph_watchdog.check_phase_preconditions("VALIDATING", state, project_path)
+    assert [i["precondition"] for i in issues] == ["automated_tests_passing"]
+
+
 def test_preconditions_uat_no_artifacts(mock_env):
     """UAT blocked when no execution artifacts."""
     project_path, state = _create_project(mock_env)
@@ -259,6 +323,17 @@ def test_preconditions_uat_no_artifacts(mock_env):
     assert any(i["precondition"] == "execution_artifacts_exist" for i in issues)
 
 
+def test_preconditions_uat_empty_outputs_dir(mock_env):
+    """UAT blocked when agent-outputs holds no .md files."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "agent-outputs" / "notes.txt").write_text("scratch")
+    issues = qralph_watchdog.check_phase_preconditions("UAT", state, project_path)
+    assert any(i["precondition"] == "execution_artifacts_exist" for i in issues)
+
+    (project_path / "agent-outputs" / "sde-iii.md").write_text("done")
+    assert qralph_watchdog.check_phase_preconditions("UAT", state, project_path) == []
+
+
 def test_preconditions_complete_no_uat(mock_env):
     """COMPLETE blocked when UAT.md missing."""
     project_path, state = _create_project(mock_env)
@@ -274,6 +349,27 @@ def test_preconditions_complete_ok(mock_env):
     assert len(issues) == 0
 
 
+def test_every_phase_precondition_has_a_check():
+    """Each precondition named in PHASE_PRECONDITIONS dispatches to a predicate."""
+    names = {p for conds in qralph_watchdog.PHASE_PRECONDITIONS.values() for p in conds}
+    assert names <= set(qralph_watchdog.PRECOND_CHECKS)
+
+
+def test_preconditions_coe_analysis_with_pe_overlay(mock_env):
+    """EXECUTING flags fixed tasks without COE analyses only when the PE overlay is active."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "SYNTHESIS.md").write_text("# Synthesis")
+    state["remediation_tasks"] = [{"id": "T1", "status": "fixed"}]
+    assert qralph_watchdog.check_phase_preconditions("EXECUTING", state, project_path) == []
+
+    state["pe_overlay"] = {"nav_strategy": "polyglot"}
+    issues = qralph_watchdog.check_phase_preconditions("EXECUTING", state, project_path)
+    assert [i["precondition"] for i in issues] == ["coe_analysis_exists"]
+
+    (project_path / "coe-analyses").mkdir()
+    assert qralph_watchdog.check_phase_preconditions("EXECUTING", state, project_path) == []
+
+
 # ============================================================================
 # ESCALATION LOGIC
 # ============================================================================
@@ -359,5 +455,161 @@ def test_cmd_check_preconditions_blocked(mock_env, capsys):
     assert result["can_proceed"] is False
 
 
+def test_cmd_check_agents_reports_output_status(mock_env, capsys):
+    """cmd_check_agents classifies each agent by its output file size."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "agent-outputs" / "sde-iii.md").write_text("x" * 200)
+    (project_path / "agent-outputs" / "security-reviewer.md").write_text("")
+    result = qralph_watchdog.cmd_check_agents()
+    statuses = {a["agent"]: (a["status"], a["output_size"]) for a in result["agents"]}
+    assert statuses == {
+        "sde-iii": ("complete", 200),
+        "security-reviewer": ("empty", 0),
+        "docs-writer": ("pending", 0),
+    }
+    assert result["complete"] == 1
+
+
+def test_cmd_check_scans_outputs_once(mock_env, capsys, monkeypatch):
+    """cmd_check lists agent-outputs once and shares it across checks."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "agent-outputs" / "orphan-agent.md").write_text("orphaned output")
+    scans = []
+    real_scan = qralph_watchdog._scan_outputs
+
+    def counting_scan(outputs_dir):
+        scans.append(outputs_dir)
+        return real_scan(outputs_dir)
+
+    monkeypatch.setattr(qralph_watchdog, "_scan_outputs", counting_scan)
+    result = qralph_watchdog.cmd_check()
+    assert len(scans) == 1
+    assert any("Orphan" in i.get("message", "") for i in result["issues"])
+    assert sum(1 for i in result["issues"] if i.get("agent") in state["agents"]) == 3
+
+
+def test_cmd_check_reuses_recent_result(mock_env, capsys, monkeypatch):
+    """A repeat cmd_check within the TTL reuses the cached output until inputs change."""
+    project_path, state = _create_project(mock_env)
+    first = qralph_watchdog.cmd_check()
+    real_scan = qralph_watchdog._scan_outputs
+
+    def fail_scan(outputs_dir):
+        raise AssertionError("cached result should have been used")
+
+    monkeypatch.setattr(qralph_watchdog, "_scan_outputs", fail_scan)
+    assert qralph_watchdog.cmd_check() == first
+    monkeypatch.setattr(qralph_watchdog, "_scan_outputs", real_scan)
+
+    (project_path / "agent-outputs" / "orphan-agent.md").write_text("new file")
+    changed = qralph_watchdog.cmd_check()
+    assert any("Orphan" in i.get("message", "") for i in changed["issues"])
+
+
+def test_cmd_check_force_and_ttl(mock_env, capsys, monkeypatch):
+    """force=True and an expired TTL both recompute."""
+    _create_project(mock_env)
+    qralph_watchdog.cmd_check()
+    scans = []
+    real_scan = qralph_watchdog._scan_outputs
+    monkeypatch.setattr(qralph_watchdog, "_scan_outputs",
+                        lambda d: scans.append(d) or real_scan(d))
+
+    qralph_watchdog.cmd_check(force=True)
+    assert len(scans) == 1
+
+    monkeypatch.setattr(qralph_watchdog, "CHECK_CACHE_TTL_SECONDS", 0)
+    qralph_watchdog.cmd_check()
+    assert len(scans) == 2
+
+
+def test_check_no_cache_flag_sets_force():
+    """check --no-cache parses to force=True; plain check keeps the cache."""
+    parser = qralph_watchdog._build_parser()
+    assert parser.parse_args(["check", "--no-cache"]).force is True
+    assert parser.parse_args(["check"]).force is False
+
+
+def test_cmd_check_counts_issue_levels(mock_env, capsys):
+    """cmd_check tallies issues by level and flags critical ones as unhealthy."""
+    project_path, state = _create_project(mock_env)
+    (project_path / "agent-outputs" / "security-reviewer.md").write_text("")
+    result = qralph_watchdog.cmd_check()
+    assert result["status"] == "unhealthy"
+    assert result["critical_issues"] == 1
+    assert result["warning_issues"] == 2
+    assert result["error_issues"] == 0
+
+
+def test_cmd_check_skips_disk_checks_when_project_vanishes(mock_env, capsys, monkeypatch):
+    """Only the critical project_path issue is reported once the directory is gone."""
+    project_path, state = _create_project(mock_env)
+    import shutil
+    shutil.rmtree(project_path)
+    monkeypatch.setattr(qralph_watchdog, "_get_project_path", lambda s: project_path)
+    result = qralph_watchdog.cmd_check()
+    assert result["status"] == "unhealthy"
+    assert [i.get("check") for i in result["issues"]] == ["project_path"]
+
+
+def test_cmd_output_compact_when_piped(mock_env, capsys):
+    """Command results are single-line JSON when stdout is not a terminal."""
+    _create_project(mock_env, phase="DISCOVERING")
+    result = qralph_watchdog.cmd_check_preconditions("DISCOVERING")
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert json.loads(out) == result
+
+
+def test_cmd_serve_answers_each_line(mock_env, capsys, monkeypatch):
+    """serve replies with one JSON line per command and keeps going after bad input."""
+    import io
+    _create_project(mock_env, phase="DISCOVERING")
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        "check-preconditions DISCOVERING\n"
+        "\n"
+        "bogus\n"
+        "serve\n"
+        "check-preconditions 'UAT\n"
+        "check-agents\n"
+    ))
+    qralph_watchdog.cmd_serve(qralph_watchdog._build_parser())
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(replies) == 5
+    assert replies[0]["status"] == "ready"
+    assert all("error" in r for r in replies[1:4])
+    assert replies[4]["total_agents"] == 3
+
+
+
+def test_cmd_serve_survives_handler_exception(mock_env, capsys, monkeypatch):
+    """A command that raises gets an error reply and later commands still run."""
+    import io
+    _create_project(mock_env, phase="DISCOVERING")
+    current = mock_env / ".qralph" / "current-project.json"
+    state = json.loads(current.read_text())
+    state["circuit_breakers"] = {"total_tokens": "a"}
+    current.write_text(json.dumps(state))
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("check-state\ncheck-preconditions DISCOVERING\n"))
+    qralph_watchdog.cmd_serve(qralph_watchdog._build_parser())
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(replies) == 2
+    assert set(replies[0]) == {"error"}
+    assert replies[1]["status"] == "ready"
+
+
+def test_cmd_serve_help_stays_off_stdout(mock_env, capsys, monkeypatch):
+    """--help text goes to stderr; stdout carries exactly one JSON reply."""
+    import io
+    monkeypatch.setattr("sys.stdin", io.StringIO("check --help\n"))
+    qralph_watchdog.cmd_serve(qralph_watchdog._build_parser())
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert len(lines) == 1
+    assert "error" in json.loads(lines[0])
+    assert "usage:" in captured.err
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -11,6 +11,8 @@ REQ-STATE-007: MEMORY.md integration (pointer only)
 """
 
 import json
+import os
+import subprocess
 import pytest
 import tempfile
 from datetime import datetime
@@ -75,6 +77,19 @@ def _create_test_project(mock_env, project_id="001-test-project"):
     return project_path, state
 
 
+def test_get_project_path_prefers_exact_match(mock_env):
+    """Partial IDs resolve to a project directory; an exact ID beats a longer match"""
+    projects_dir = mock_env / ".qralph" / "projects"
+    (projects_dir / "001-test-project-v2").mkdir()
+    (projects_dir / "001-test-project").mkdir()
+    (projects_dir / "002-notes.md").write_text("not a project")
+
+    assert session_state._get_project_path("001-test-project") == projects_dir / "001-test-project"
+    assert session_state._get_project_path("001-test-project-") == projects_dir / "001-test-project-v2"
+    assert session_state._get_project_path("002") is None
+    assert session_state._get_project_path("../etc") is None
+
+
 # ============================================================================
 # STATE.MD CREATION (REQ-STATE-001)
 # ============================================================================
@@ -110,6 +125,16 @@ def test_create_state_meta_fields(mock_env):
     assert "coding" in content
 
 
+def test_create_state_request_braces_literal(mock_env):
+    """REQ-STATE-001: Braces in the request are written literally"""
+    project_path, state = _create_test_project(mock_env)
+    state["request"] = "Render {project_id} and {{x}} verbatim"
+    (mock_env / ".qralph" / "current-project.json").write_text(json.dumps(state))
+    session_state.cmd_create_state("001-test-project")
+    content = (project_path / "STATE.md").read_text()
+    assert "| Request | Render {project_id} and {{x}} verbatim |" in content
+
+
 def test_create_state_checkbox_syntax(mock_env):
     """REQ-STATE-001: Execution plan uses checkbox syntax"""
     project_path, _ = _create_test_project(mock_env)
@@ -256,6 +281,16 @@ def test_session_start_includes_next_instructions(mock_env):
     assert "next_instructions" in result
 
 
+def test_session_start_next_instructions_stop_at_footer(mock_env):
+    """REQ-STATE-004: Next instructions are read up to the --- footer"""
+    project_path, _ = _create_test_project(mock_env)
+    (project_path / "STATE.md").write_text(
+        "# State\n\n## Next Session Instructions\n\nResume at step 4.\n\n---\n*footer*\n"
+    )
+    result = session_state.cmd_session_start(include_git=False)
+    assert result["next_instructions"] == "Resume at step 4."
+
+
 @patch.object(session_state, '_get_git_diff_stat', return_value="foo.py | 5 +++--")
 def test_session_start_uncommitted_alerts(mock_git, mock_env):
     """REQ-STATE-004: Alerts for uncommitted work"""
@@ -264,6 +299,25 @@ def test_session_start_uncommitted_alerts(mock_git, mock_env):
     assert result["uncommitted_work"] is True
 
 
+@patch.object(session_state, '_get_git_diff_stat')
+def test_session_start_no_git_skips_diff(mock_git, mock_env):
+    """REQ-STATE-004: include_git=False skips git and nulls uncommitted work"""
+    _create_test_project(mock_env)
+    result = session_state.cmd_session_start(include_git=False)
+    mock_git.assert_not_called()
+    assert result["uncommitted_work"] is None
+    assert result["uncommitted_details"] is None
+
+
+def test_session_start_piped_output_is_compact(mock_env, capsys):
+    """REQ-STATE-004: Piped output is compact single-line JSON"""
+    _create_test_project(mock_env)
+    result = session_state.cmd_session_start(include_git=False)
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert json.loads(out) == result
+
+
 def test_session_start_output_size(mock_env):
     """REQ-STATE-004: Output stays under 2000 tokens (~8000 chars)"""
     _create_test_project(mock_env)
@@ -332,6 +386,106 @@ def test_session_end_appends_session_log(mock_env):
     assert "Session end" in content
 
 
+def test_session_end_repeated_keeps_log_table(mock_env):
+    """REQ-STATE-005: each session-end appends a numbered row and leaves the rest stable"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_create_state("001-test-project")
+    session_state.cmd_session_end("001-test-project")
+    first = (project_path / "STATE.md").read_text()
+    session_state.cmd_session_end("001-test-project")
+    content = (project_path / "STATE.md").read_text()
+
+    _, sections = session_state._parse_sections(content)
+    table = dict(sections)["Session Log"].strip().splitlines()
+    assert table[1].startswith("|---")
+    assert [row.split("|")[1].strip() for row in table[2:]] == ["1", "2", "3"]
+    # Only the appended row and timestamps differ between runs
+    assert len(content.splitlines()) == len(first.splitlines()) + 1
+
+
+def test_parse_sections_round_trip(mock_env):
+    """STATE.md splits into sections and renders back unchanged"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_create_state("001-test-project")
+    content = (project_path / "STATE.md").read_text()
+    preamble, sections = session_state._parse_sections(content)
+    assert [title for title, _ in sections] == [
+        "Meta", "Execution Plan", "Current Step Detail",
+        "Uncommitted Work", "Session Log", "Next Session Instructions"]
+    assert session_state._render_sections(preamble, sections) == content
+
+
+def test_parse_sections_round_trip_duplicate_titles():
+    """Repeated section titles are kept, in order, and render back unchanged"""
+    content = "# State\n## Notes\nfirst\n## Notes\nsecond\n"
+    preamble, sections = session_state._parse_sections(content)
+    assert sections == [("Notes", "first\n"), ("Notes", "second\n")]
+    assert session_state._render_sections(preamble, sections) == content
+
+
+def test_session_end_unbalanced_fence_keeps_later_sections(mock_env):
+    """REQ-STATE-005: an unclosed ``` fence does not hide later known sections"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_create_state("001-test-project")
+    state_md = project_path / "STATE.md"
+    content = state_md.read_text().replace(
+        "**Notes**: Initial state created\n", "**Notes**: Initial state created\n```\nstray\n")
+    state_md.write_text(content)
+
+    preamble, sections = session_state._parse_sections(content)
+    assert [title for title, _ in sections] == list(session_state.STATE_MD_SECTIONS)
+    assert session_state._render_sections(preamble, sections) == content
+
+    with patch.object(session_state, '_get_git_diff_stat', return_value=""):
+        session_state.cmd_session_end("001-test-project")
+    updated = dict(session_state._parse_sections(state_md.read_text())[1])
+    assert "Session end" in updated["Session Log"]
+    assert "Next expected phase" in updated["Next Session Instructions"]
+
+
+def test_session_end_updates_first_duplicate_section_only(mock_env):
+    """REQ-STATE-005: session-end keeps a user-added duplicate section intact"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_create_state("001-test-project")
+    state_md = project_path / "STATE.md"
+    state_md.write_text(state_md.read_text() + "\n## Session Log\n\nuser notes\n")
+
+    with patch.object(session_state, '_get_git_diff_stat', return_value=""):
+        session_state.cmd_session_end("001-test-project")
+
+    _, sections = session_state._parse_sections(state_md.read_text())
+    logs = [body for title, body in sections if title == "Session Log"]
+    assert len(logs) == 2
+    assert "Session end" in logs[0]
+    assert logs[1] == "\nuser notes\n"
+
+
+def test_session_end_without_state_md_keeps_state_file(mock_env):
+    """REQ-STATE-005: session-end creating STATE.md keeps create-state's state fields"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_session_end("001-test-project")
+
+    assert (project_path / "STATE.md").exists()
+    updated = json.loads((mock_env / ".qralph" / "current-project.json").read_text())
+    assert updated["state_file"] == ".qralph/projects/001-test-project/STATE.md"
+    assert updated["total_steps"] == len(session_state.QRALPH_PHASES)
+    assert "last_session" in updated
+
+
+def test_session_end_header_like_diff_line_stays_in_section(mock_env):
+    """REQ-STATE-005: a '## ' line inside the fenced git diff does not start a section"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_create_state("001-test-project")
+    with patch.object(session_state, '_get_git_diff_stat', return_value="## notes.md | 2 +-"):
+        session_state.cmd_session_end("001-test-project")
+        session_state.cmd_session_end("001-test-project")
+    content = (project_path / "STATE.md").read_text()
+
+    _, sections = session_state._parse_sections(content)
+    assert "## notes.md | 2 +-" in dict(sections)["Uncommitted Work"]
+    assert content.count("## notes.md") == 1
+
+
 def test_session_end_completion_detection(mock_env):
     """REQ-STATE-005: session-end detects COMPLETE phase"""
     project_path, _ = _create_test_project(mock_env)
@@ -371,11 +525,32 @@ def test_recover_marks_uncertain(mock_env):
     assert "RECOVERED" in state_md
 
 
+def test_recover_marks_existing_state_md(mock_env):
+    """REQ-STATE-006: Recovery marks a STATE.md that already existed"""
+    project_path, _ = _create_test_project(mock_env)
+    session_state.cmd_create_state("001-test-project")
+    session_state.cmd_recover("001-test-project")
+    state_md = (project_path / "STATE.md").read_text()
+    assert "## Current Step Detail\n\n**RECOVERED**" in state_md
+    assert state_md.count("**RECOVERED**") == 1
+
+
 # ============================================================================
 # HELPER FUNCTION TESTS
 # ============================================================================
 
 
+def test_git_diff_stat_truncated():
+    """Large diff stats are cut at a line boundary and marked truncated"""
+    stat = "".join(f" src/file{i}.py | 10 +++++-----\n" for i in range(500))
+    fake = subprocess.CompletedProcess(args=[], returncode=0, stdout=stat)
+    with patch.object(session_state.subprocess, "run", return_value=fake):
+        result = session_state._get_git_diff_stat()
+    assert result.endswith("\n... (truncated)")
+    assert len(result) <= session_state.MAX_DIFF_STAT_CHARS + len("\n... (truncated)")
+    assert result.splitlines()[-2].endswith("+++++-----")
+
+
 def test_format_checklist_init():
     """Checklist shows INIT as current"""
     result = session_state._format_checklist(session_state.QRALPH_PHASES, "INIT")
@@ -391,6 +566,12 @@ def test_format_checklist_reviewing():
     assert "[ ] EXECUTING" in result
 
 
+def test_format_checklist_unknown_phase():
+    """Checklist marks every phase complete for an unknown phase"""
+    result = session_state._format_checklist(["INIT", "UAT"], "DONE")
+    assert result == "- [x] INIT\n- [x] UAT"
+
+
 # ============================================================================
 # LOOP BUG FIXES (Phase 1H)
 # ============================================================================
@@ -440,6 +621,38 @@ def test_recover_infers_executing_without_summary(mock_env):
     assert recovered["phase"] == "EXECUTING"
 
 
+def test_recover_uses_newest_checkpoint_by_mtime(mock_env):
+    """REQ-STATE-006: Recovery reads the newest checkpoint, not the last by name"""
+    project_path, state = _create_test_project(mock_env)
+    checkpoint_dir = project_path / "checkpoints"
+
+    state["phase"] = "DISCOVERING"
+    older = checkpoint_dir / "uat-235959.json"
+    older.write_text(json.dumps(state))
+    os.utime(older, (1_000_000, 1_000_000))
+
+    state["phase"] = "EXECUTING"
+    (checkpoint_dir / "state.json").write_text(json.dumps(state))
+
+    result = session_state.cmd_recover("001-test-project")
+    assert result["phase"] == "EXECUTING"
+
+
+def test_recover_counts_markdown_agent_outputs(mock_env):
+    """REQ-STATE-006: Recovery counts only .md agent outputs"""
+    project_path, _ = _create_test_project(mock_env)
+    outputs = project_path / "agent-outputs"
+    (outputs / "architect.md").write_text("# Architect")
+    (outputs / "reviewer.md").write_text("# Reviewer")
+    (outputs / "notes.txt").write_text("scratch")
+
+    result = session_state.cmd_recover("001-test-project")
+
+    assert result["agent_outputs_found"] == 2
+    assert result["synthesis_exists"] is False
+    assert result["phase"] == "REVIEWING"
+
+
 def test_recover_from_corrupt_checkpoint_with_fallback(mock_env):
     """F-012: Recovery from corrupt checkpoint falls back to minimal state reconstruction."""
     project_id = "001-corrupt-test"